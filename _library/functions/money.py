@@ -0,0 +1,316 @@
+from collections.abc import Iterable, Sequence
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from functools import lru_cache, total_ordering
+import math
+from operator import attrgetter
+
+from _library.functions.number_utils import get_quantizer
+
+
+@lru_cache(maxsize=32)
+def get_scale(places: int) -> int:
+    """
+    Return the number of minor units in one major unit (10 ** places).
+    """
+    if places < 0:
+        raise ValueError("places must be ≥ 0")
+    return 10**places
+
+
+@lru_cache(maxsize=256, typed=True)
+def get_ratio(factor: int | float | Decimal) -> tuple[int, int]:
+    """
+    Return `factor` as an exact (numerator, denominator) pair; floats go through str() like `round_half_up`.
+
+    Cached: batch billing reuses a handful of rates and quantities.
+    """
+    if isinstance(factor, bool):
+        raise TypeError("factor must be a number, not bool")
+    if factor.__class__ is float:
+        factor = Decimal(str(factor))
+    return factor.as_integer_ratio()
+
+
+def divide_half_up(numerator: int, denominator: int) -> int:
+    """
+    Integer division rounding half away from zero (ROUND_HALF_UP semantics).
+    """
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if remainder * 2 >= denominator:
+        quotient += 1
+    return -quotient if numerator < 0 else quotient
+
+
+# -------------------------
+# Minor-unit conversions
+# -------------------------
+def to_minor(value: int | float | Decimal, places: int = 2) -> int:
+    """
+    Convert a value to integer minor units, rounding exactly like `round_half_up(value, places)`.
+
+    Example:
+        to_minor(2.345, 2) -> 235
+        to_minor(-2.555, 2) -> -256
+    """
+    scale = get_scale(places)
+    if value.__class__ is int:
+        return value * scale
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int(value.quantize(get_quantizer(places), rounding=ROUND_HALF_UP).scaleb(places))
+
+
+def from_minor(minor: int, places: int = 2) -> Decimal:
+    """
+    Minor units back to a Decimal with the same exponent `round_half_up()` produces.
+
+    Example:
+        from_minor(235, 2) -> Decimal('2.35')
+    """
+    return Decimal(minor).scaleb(-places)
+
+
+def scale_minor(minor: int, factor: int | float | Decimal) -> int:
+    """
+    Multiply minor units by a quantity or rate, rounding half up to whole minor units.
+    """
+    numerator, denominator = get_ratio(factor)
+    return divide_half_up(minor * numerator, denominator)
+
+
+def allocate_minor(amount: int, ratios: Sequence[int | float | Decimal]) -> list[int]:
+    """
+    Split `amount` minor units in proportion to `ratios`; the parts always sum to `amount`.
+
+    Largest-remainder method: every part gets its floored share, and the
+    leftover units go to the largest remainders (earlier parts first on ties).
+
+    Example:
+        allocate_minor(10000, [1, 1, 1]) -> [3334, 3333, 3333]
+    """
+    fractions = [Fraction(*get_ratio(ratio)) for ratio in ratios]
+    if not fractions or sum(fractions) <= 0 or any(fraction < 0 for fraction in fractions):
+        raise ValueError("ratios must be non-negative with a positive total")
+
+    # Scale to integer weights so the split is plain integer arithmetic
+    denominator = math.lcm(*(fraction.denominator for fraction in fractions))
+    weights = [fraction.numerator * (denominator // fraction.denominator) for fraction in fractions]
+    total = sum(weights)
+
+    magnitude = abs(amount)
+    shares = []
+    remainders = []
+    for index, weight in enumerate(weights):
+        share, remainder = divmod(magnitude * weight, total)
+        shares.append(share)
+        remainders.append((-remainder, index))
+
+    leftover = magnitude - sum(shares)
+    if leftover:
+        for _, index in sorted(remainders)[:leftover]:
+            shares[index] += 1
+
+    return [-share for share in shares] if amount < 0 else shares
+
+
+# -------------------------
+# Fixed-point type
+# -------------------------
+@total_ordering
+class Money:
+    """
+    Fixed-point amount stored as integer minor units (cents for places=2).
+
+    Arithmetic between amounts is exact integer arithmetic; rounding only
+    happens on the way in (`Money.of`, multiplication by non-integers), and
+    always as ROUND_HALF_UP, so `Money.of(v, p).to_decimal() == round_half_up(v, p)`.
+
+    Adding, subtracting or ordering amounts with different `places` raises ValueError.
+
+    For large batches prefer the list helpers below (`to_minor_many`,
+    `scale_many`, plain `sum()` over minor units): they skip the per-object overhead.
+    """
+
+    __slots__ = ("minor", "places")
+
+    def __init__(self, minor: int, places: int = 2):
+        get_scale(places)  # validates places
+        self.minor = minor
+        self.places = places
+
+    @classmethod
+    def of(cls, value: "int | float | Decimal | Money", places: int = 2) -> "Money":
+        """
+        Build from a major-unit value, e.g. Money.of(12.345) -> 12.35.
+        """
+        if isinstance(value, Money):
+            return value if value.places == places else cls.of(value.to_decimal(), places)
+        return cls(to_minor(value, places), places)
+
+    @classmethod
+    def zero(cls, places: int = 2) -> "Money":
+        return cls(0, places)
+
+    def to_decimal(self) -> Decimal:
+        """
+        Same value and exponent as the equivalent `round_half_up()` result (zero is unsigned).
+        """
+        return from_minor(self.minor, self.places)
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __int__(self) -> int:
+        return self.minor
+
+    def __bool__(self) -> bool:
+        return bool(self.minor)
+
+    # -------------------------
+    # Comparison
+    # -------------------------
+    def _check(self, other: "Money") -> None:
+        if other.places != self.places:
+            raise ValueError(f"Cannot combine amounts with {self.places} and {other.places} decimal places")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.minor == other.minor and self.places == other.places
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor < other.minor
+
+    def __hash__(self) -> int:
+        return hash((self.minor, self.places))
+
+    # -------------------------
+    # Arithmetic
+    # -------------------------
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor + other.minor, self.places)
+
+    def __radd__(self, other) -> "Money":
+        # Lets the builtin sum() start from 0
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor - other.minor, self.places)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.minor, self.places)
+
+    def __abs__(self) -> "Money":
+        return Money(abs(self.minor), self.places)
+
+    def __mul__(self, factor: int | float | Decimal) -> "Money":
+        """
+        Multiply by a quantity or rate; equal to `round_half_up(amount * factor, places)`.
+        """
+        if factor.__class__ is int:
+            return Money(self.minor * factor, self.places)
+        if not isinstance(factor, (float, Decimal)):
+            return NotImplemented
+        return Money(scale_minor(self.minor, factor), self.places)
+
+    __rmul__ = __mul__
+
+    def allocate(self, ratios: Sequence[int | float | Decimal]) -> list["Money"]:
+        """
+        Split into parts proportional to `ratios` that sum exactly to this amount (see `allocate_minor`).
+
+        Example:
+            Money.of(100).allocate([1, 1, 1]) -> [33.34, 33.33, 33.33]
+        """
+        return [Money(share, self.places) for share in allocate_minor(self.minor, ratios)]
+
+
+# -------------------------
+# Batch operations
+# -------------------------
+def round_many(values: Iterable[int | float | Decimal], places: int = 2) -> list[Decimal]:
+    """
+    `[round_half_up(value, places) for value in values]` with the per-call overhead hoisted out.
+    """
+    quantizer = get_quantizer(places)
+    return [
+        (value if isinstance(value, Decimal) else Decimal(str(value))).quantize(quantizer, rounding=ROUND_HALF_UP)
+        for value in values
+    ]
+
+
+def to_minor_many(values: Iterable[int | float | Decimal], places: int = 2) -> list[int]:
+    """
+    Convert many values to integer minor units (see `to_minor`).
+    """
+    scale = get_scale(places)
+    quantizer = get_quantizer(places)
+    minors = []
+    for value in values:
+        if value.__class__ is int:
+            minors.append(value * scale)
+            continue
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        minors.append(int(value.quantize(quantizer, rounding=ROUND_HALF_UP).scaleb(places)))
+    return minors
+
+
+def from_minor_many(minors: Iterable[int], places: int = 2) -> list[Decimal]:
+    """
+    Convert many minor-unit amounts back to Decimals (see `from_minor`).
+    """
+    exponent = -places
+    return [Decimal(minor).scaleb(exponent) for minor in minors]
+
+
+def scale_many(minors: Iterable[int], factor: int | float | Decimal) -> list[int]:
+    """
+    Apply one quantity or rate to many minor-unit amounts (see `scale_minor`).
+    """
+    numerator, denominator = get_ratio(factor)
+    if denominator == 1:
+        return [minor * numerator for minor in minors]
+
+    scaled = []
+    for minor in minors:
+        product = minor * numerator
+        quotient, remainder = divmod(abs(product), denominator)
+        if remainder * 2 >= denominator:
+            quotient += 1
+        scaled.append(-quotient if product < 0 else quotient)
+    return scaled
+
+
+def sum_rounded(values: Iterable[int | float | Decimal], places: int = 2) -> Money:
+    """
+    Sum of the individually rounded values (line items are rounded before totalling).
+
+    Equal to `sum(round_half_up(value, places) for value in values)`.
+    """
+    return Money(sum(to_minor_many(values, places)), places)
+
+
+def sum_money(amounts: Iterable[Money], places: int = 2) -> Money:
+    """
+    Exact total of Money amounts sharing `places`.
+    """
+    amounts = amounts if isinstance(amounts, Sequence) else list(amounts)
+    if amounts and set(map(attrgetter("places"), amounts)) != {places}:
+        raise ValueError(f"Cannot combine amounts with different decimal places (expected {places})")
+    return Money(sum(map(attrgetter("minor"), amounts)), places)
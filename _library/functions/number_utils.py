@@ -1,4 +1,5 @@
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 from typing import TypedDict
 
 
@@ -70,5 +71,15 @@ def round_half_up(value: float | Decimal, places: int = 2) -> Decimal:
     if not isinstance(value, Decimal):
         value = Decimal(str(value))
 
-    quantize_str = f"1.{'0' * places}"  # e.g. '1.00' for 2 decimal places
-    return value.quantize(Decimal(quantize_str), rounding=ROUND_HALF_UP)
+    return value.quantize(get_quantizer(places), rounding=ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=32)
+def get_quantizer(places: int) -> Decimal:
+    """
+    Return the quantize exponent for `places` decimal places (cached; Decimal is immutable).
+
+    Example:
+        get_quantizer(2) -> Decimal('1.00')
+    """
+    return Decimal(f"1.{'0' * places}")
@@ -61,6 +61,3 @@ def get_current_timestamp(
 
     # Defensive programming: fail fast for invalid values
     raise ValueError(f"Invalid date/time type: {type}")
-
-
-print(get_current_timestamp("datetime"))
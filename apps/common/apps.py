@@ -3,3 +3,16 @@ from django.apps import AppConfig
 
 class CommonConfig(AppConfig):
     name = "apps.common"
+
+    def ready(self):
+        # Register system checks (unindexed filter fields) and signal receivers (cache invalidation)
+        from apps.common import checks, signals  # noqa: F401
+
+        # Readiness waits for `manage.py warm_cache` (CACHE_WARMING_READINESS)
+        from config.django.cache_warming import cache_warming_config
+
+        if cache_warming_config.CACHE_WARMING_READINESS:
+            from apps.common.cache_warming.state import check_warm
+            from apps.common.health import readiness_checker
+
+            readiness_checker.register("cache_warm", check_warm)
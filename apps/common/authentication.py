@@ -0,0 +1,86 @@
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.db import router
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from apps.common.functions.tiered_cache import tiered_delete_many, tiered_get, tiered_set
+from config.django.rest_framework import drf_config
+
+# Cache key namespace for token → (user, token) resolutions
+TOKEN_CACHE_PREFIX = "auth:token:"
+
+# User fields never copied to the cache (token authentication doesn't need them)
+EXCLUDED_USER_FIELDS = ("password",)
+
+
+def token_cache_key(key: str) -> str:
+    # Hash the key so raw credentials never appear in Redis keyspace dumps
+    return TOKEN_CACHE_PREFIX + hashlib.sha256(key.encode()).hexdigest()
+
+
+def invalidate_tokens(keys) -> None:
+    """
+    Drop cached resolutions for the given token keys.
+
+    Called from signal handlers on token delete and user changes.
+    """
+    cache_keys = [token_cache_key(key) for key in keys]
+    if cache_keys:
+        tiered_delete_many(cache_keys)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for DRF's TokenAuthentication that caches the
+    token → user lookup in the local and Redis cache tiers.
+
+    Entries live for TOKEN_CACHE_TIMEOUT seconds and are invalidated by
+    apps.common.signals when a token is deleted or its user changes.
+    Other workers may keep a revoked token for up to LOCAL_CACHE_TIMEOUT.
+    Only successful resolutions are cached; invalid and inactive tokens
+    always go through the database. The cached snapshot holds field values
+    only, without the password hash (deferred: loaded if ever accessed).
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        snapshot = tiered_get(cache_key)
+        if snapshot is not None:
+            resolved = self.restore_snapshot(snapshot)
+            if resolved is not None:
+                return resolved
+
+        user, token = super().authenticate_credentials(key)
+        tiered_set(cache_key, self.build_snapshot(user, token), drf_config.TOKEN_CACHE_TIMEOUT)
+        return user, token
+
+    @staticmethod
+    def build_snapshot(user, token) -> dict:
+        return {
+            "token": {field.attname: getattr(token, field.attname) for field in Token._meta.concrete_fields},
+            "user": {
+                field.attname: getattr(user, field.attname)
+                for field in user._meta.concrete_fields
+                if field.attname not in EXCLUDED_USER_FIELDS
+            },
+        }
+
+    @staticmethod
+    def restore_snapshot(snapshot) -> tuple | None:
+        UserModel = get_user_model()
+        try:
+            token_fields, user_fields = snapshot["token"], snapshot["user"]
+            token_names = [field.attname for field in Token._meta.concrete_fields]
+            token_values = [token_fields[name] for name in token_names]
+            user_names = [field.attname for field in UserModel._meta.concrete_fields if field.attname not in EXCLUDED_USER_FIELDS]
+            user_values = [user_fields[name] for name in user_names]
+        except (KeyError, TypeError):
+            # Snapshot predates a schema change (or this format); reload from the database
+            return None
+
+        user = UserModel.from_db(router.db_for_read(UserModel), user_names, user_values)
+        token = Token.from_db(router.db_for_read(Token), token_names, token_values)
+        token.user = user
+        return user, token
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from django.db import router
+
+from apps.common.functions.tiered_cache import tiered_delete_many, tiered_get, tiered_set
+from config.django.authentication import authentication_config
+
+# Cache key namespace for user snapshots
+USER_CACHE_PREFIX = "auth:user:"
+
+# Attributes ModelBackend uses to memoize permissions on the user instance
+PERM_CACHE_ATTRS = ("_perm_cache", "_user_perm_cache", "_group_perm_cache")
+
+
+def user_cache_key(user_id) -> str:
+    return f"{USER_CACHE_PREFIX}{user_id}"
+
+
+def invalidate_users(user_ids) -> None:
+    """
+    Drop cached snapshots for the given user ids.
+
+    Called from signal handlers on user, group and permission changes.
+    """
+    cache_keys = [user_cache_key(user_id) for user_id in user_ids]
+    if cache_keys:
+        tiered_delete_many(cache_keys)
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend whose `get_user()` is served from the cache tiers.
+
+    AuthenticationMiddleware still resolves `request.user` lazily through
+    `django.contrib.auth.get_user()`; only the database lookup is replaced.
+    The snapshot holds the user's concrete field values plus the permission
+    sets ModelBackend memoizes, so `has_perm()` needs no queries either.
+
+    Rejected username/password credentials end the backend chain here: the
+    ModelBackend listed after it (for sessions that recorded it) must not
+    hash the password a second time.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None and password is not None and (username or kwargs.get(get_user_model().USERNAME_FIELD)):
+            # Django stops trying backends and sends user_login_failed
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id):
+        cache_key = user_cache_key(user_id)
+        snapshot = tiered_get(cache_key)
+        if snapshot is not None:
+            user = self.restore_snapshot(snapshot)
+            if user is not None:
+                return user
+
+        user = super().get_user(user_id)
+        if user is None:
+            return None
+
+        # Populate the permission memo attributes before snapshotting
+        self.get_all_permissions(user)
+        tiered_set(cache_key, self.build_snapshot(user), authentication_config.USER_CACHE_TIMEOUT)
+        return user
+
+    @staticmethod
+    def build_snapshot(user) -> dict:
+        return {
+            "fields": {field.attname: getattr(user, field.attname) for field in user._meta.concrete_fields},
+            "perms": {attr: getattr(user, attr) for attr in PERM_CACHE_ATTRS if hasattr(user, attr)},
+        }
+
+    def restore_snapshot(self, snapshot: dict):
+        UserModel = get_user_model()
+        fields = snapshot["fields"]
+
+        try:
+            values = [fields[field.attname] for field in UserModel._meta.concrete_fields]
+        except KeyError:
+            # Snapshot predates a schema change; reload from the database
+            return None
+
+        user = UserModel.from_db(router.db_for_read(UserModel), None, values)
+        for attr, value in snapshot["perms"].items():
+            setattr(user, attr, value)
+
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,79 @@
+from django.urls import include, path
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.views import APIView
+
+from config.django.base import base_config
+
+# Synthetic rows shared by the list / large-render endpoints
+ROWS = [
+    {"id": index, "name": f"item-{index}", "price": f"{index * 1.25:.2f}", "active": index % 2 == 0, "tags": ["a", "b", "c"]}
+    for index in range(10_000)
+]
+
+
+class BenchmarkThrottle(SimpleRateThrottle):
+    # High enough never to reject: measures throttle bookkeeping, not 429s
+    scope = "benchmark"
+    rate = "100000000/hour"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class BenchmarkView(APIView):
+    # JSON only: the browsable renderer would measure template rendering instead
+    renderer_classes = [JSONRenderer]
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+
+class EmptyView(BenchmarkView):
+    # Middleware + DRF dispatch overhead only
+    def get(self, request):
+        return Response({})
+
+
+class AuthenticatedView(BenchmarkView):
+    # Token authentication + permission check
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"user": request.user.pk})
+
+
+class ThrottledView(BenchmarkView):
+    # Cache-backed throttle round trip on every request
+    throttle_classes = [BenchmarkThrottle]
+
+    def get(self, request):
+        return Response({})
+
+
+class PaginatedListView(BenchmarkView):
+    def get(self, request):
+        paginator = LimitOffsetPagination()
+        page = paginator.paginate_queryset(ROWS, request, view=self)
+        return paginator.get_paginated_response(page)
+
+
+class LargeJSONView(BenchmarkView):
+    def get(self, request):
+        return Response(ROWS)
+
+
+# Mounted only by the benchmark command (ROOT_URLCONF override), never in routes.urls
+urlpatterns = [
+    path("__benchmark__/empty/", EmptyView.as_view()),
+    path("__benchmark__/authenticated/", AuthenticatedView.as_view()),
+    path("__benchmark__/throttled/", ThrottledView.as_view()),
+    path("__benchmark__/paginated/", PaginatedListView.as_view()),
+    path("__benchmark__/large-json/", LargeJSONView.as_view()),
+    path("", include(base_config.ROOT_URLCONF)),
+]
@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import sys
+import time
+
+from apps.common.benchmarks.stats import summarize_latencies
+
+
+def build_wsgi_environ(path: str, host: str, headers: dict[str, str]) -> dict:
+    path_info, _, query_string = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path_info,
+        "QUERY_STRING": query_string,
+        "SERVER_NAME": host,
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_HOST": host,
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name, value in headers.items():
+        environ["HTTP_" + name.upper().replace("-", "_")] = value
+    return environ
+
+
+def run_wsgi(application, path: str, host: str, headers: dict[str, str], requests: int, concurrency: int) -> dict:
+    """
+    Drive a WSGI callable from a thread pool and return latency statistics.
+    """
+    statuses: list[str] = []
+
+    def one_request(_):
+        environ = build_wsgi_environ(path, host, headers)
+        started = time.perf_counter()
+        body = application(environ, lambda status, response_headers, exc_info=None: statuses.append(status))
+        try:
+            for _chunk in body:
+                pass
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(one_request, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(1 for status in statuses if not status.startswith("2"))
+    return summarize_latencies(latencies, elapsed, errors)
+
+
+def build_asgi_scope(path: str, host: str, headers: dict[str, str]) -> dict:
+    path_info, _, query_string = path.partition("?")
+    raw_headers = [(b"host", host.encode())]
+    raw_headers += [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path_info,
+        "raw_path": path_info.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": (host, 80),
+    }
+
+
+async def _run_asgi(application, path: str, host: str, headers: dict[str, str], requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: list[int] = []
+
+    async def one_request():
+        async with semaphore:
+            scope = build_asgi_scope(path, host, headers)
+            request_sent = False
+
+            async def receive():
+                nonlocal request_sent
+                if not request_sent:
+                    request_sent = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                # Hold the connection open until the app finishes
+                await asyncio.Event().wait()
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            started = time.perf_counter()
+            await application(scope, receive, send)
+            return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(1 for status in statuses if not 200 <= status < 300)
+    return summarize_latencies(list(latencies), elapsed, errors)
+
+
+def run_asgi(application, path: str, host: str, headers: dict[str, str], requests: int, concurrency: int) -> dict:
+    """
+    Drive an ASGI callable with `concurrency` in-flight requests and return latency statistics.
+    """
+    return asyncio.run(_run_asgi(application, path, host, headers, requests, concurrency))
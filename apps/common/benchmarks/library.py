@@ -0,0 +1,105 @@
+from decimal import Decimal
+import random
+
+from django.contrib.auth import get_user_model
+
+from _library.functions.money import allocate_minor, round_many, scale_many, to_minor, to_minor_many
+from _library.functions.number_utils import round_half_up, validate_int
+from _library.functions.string_utils import trim_string
+from _library.functions.timestamp_utils import DateTimeTypeChoices, get_current_timestamp
+from _library.functions.validate_foreign_key import validate_foreign_key
+
+# Inputs per distribution; fixed seed keeps runs comparable with the baseline
+SAMPLE_SIZE = 1000
+SEED = 20260101
+
+
+def build_cases(rng: random.Random | None = None) -> dict[str, tuple]:
+    """
+    Return {case_name: (callable, [args, ...])} for every shared helper and input distribution.
+
+    Distributions:
+    - valid: values the helper accepts
+    - errors: values the helper rejects (error payload path)
+    - mixed: realistic blend of types, including errors
+    """
+    rng = rng or random.Random(SEED)
+
+    def sample(generators):
+        return [rng.choice(generators)() for _ in range(SAMPLE_SIZE)]
+
+    # -------------------------
+    # validate_int
+    # -------------------------
+    def validate_int_args(value):
+        return (value, "quantity", 0, 1, 1000)
+
+    int_valid = [lambda: rng.randint(1, 1000), lambda: str(rng.randint(1, 1000))]
+    int_errors = [lambda: "abc", lambda: None, lambda: "", lambda: rng.randint(1001, 5000), lambda: -rng.randint(1, 50)]
+
+    # -------------------------
+    # round_half_up
+    # -------------------------
+    money_valid = [lambda: rng.uniform(-10_000, 10_000), lambda: Decimal(f"{rng.uniform(0, 1000):.4f}")]
+    money_mixed = money_valid + [lambda: rng.randint(-1000, 1000), lambda: rng.randint(0, 99) + 0.005]
+
+    # -------------------------
+    # trim_string
+    # -------------------------
+    strings = [lambda: f"  value-{rng.randint(0, 99)}  ", lambda: "clean", lambda: "\t tabbed \n"]
+    non_strings = [lambda: None, lambda: rng.randint(0, 99), lambda: 1.5]
+
+    # -------------------------
+    # validate_foreign_key (existing / missing / malformed primary keys)
+    # -------------------------
+    UserModel = get_user_model()
+    existing_ids = list(UserModel.objects.values_list("pk", flat=True)[:50]) or [1]
+    fk_valid = [lambda: rng.choice(existing_ids)]
+    fk_errors = [lambda: "abc", lambda: None, lambda: 10**9 + rng.randint(0, 1000)]
+
+    def fk_args(values):
+        return [(value, "user", UserModel) for value in values]
+
+    timestamp_types = list(DateTimeTypeChoices)
+
+    cases = {
+        "validate_int.valid": (validate_int, [validate_int_args(v) for v in sample(int_valid)]),
+        "validate_int.errors": (validate_int, [validate_int_args(v) for v in sample(int_errors)]),
+        "validate_int.mixed": (validate_int, [validate_int_args(v) for v in sample(int_valid * 3 + int_errors)]),
+        "round_half_up.valid": (round_half_up, [(v, 2) for v in sample(money_valid)]),
+        "round_half_up.mixed": (round_half_up, [(v, rng.choice((0, 2, 4))) for v in sample(money_mixed)]),
+        "trim_string.valid": (trim_string, [(v,) for v in sample(strings)]),
+        "trim_string.mixed": (trim_string, [(v,) for v in sample(strings + non_strings)]),
+        "validate_foreign_key.valid": (validate_foreign_key, fk_args(sample(fk_valid))),
+        "validate_foreign_key.errors": (validate_foreign_key, fk_args(sample(fk_errors))),
+        "validate_foreign_key.mixed": (validate_foreign_key, fk_args(sample(fk_valid * 3 + fk_errors))),
+        "get_current_timestamp.mixed": (get_current_timestamp, [(rng.choice(timestamp_types),) for _ in range(SAMPLE_SIZE)]),
+    }
+
+    # -------------------------
+    # money: one billing batch per call (round lines, apply a rate, total, split);
+    # sampled last so the cases above keep their baseline inputs
+    # -------------------------
+    invoice_lines = sample(money_mixed)
+    tax_rate = Decimal("0.075")
+    split_ratios = [rng.randint(1, 10) for _ in range(12)]
+
+    def bill_decimal(values):
+        lines = [round_half_up(v, 2) for v in values]
+        taxes = [round_half_up(line * tax_rate, 2) for line in lines]
+        return sum(lines) + sum(taxes)
+
+    def bill_minor(values):
+        lines = to_minor_many(values, 2)
+        return sum(lines) + sum(scale_many(lines, tax_rate))
+
+    cases.update(
+        {
+            "money.round.loop": (lambda values: [round_half_up(v, 2) for v in values], [(invoice_lines,)]),
+            "money.round.batch": (round_many, [(invoice_lines, 2)]),
+            "money.bill.decimal": (bill_decimal, [(invoice_lines,)]),
+            "money.bill.minor": (bill_minor, [(invoice_lines,)]),
+            "money.allocate": (allocate_minor, [(to_minor(v), split_ratios) for v in invoice_lines[:100]]),
+        }
+    )
+    return cases
@@ -0,0 +1,68 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+
+def measure(func, inputs: list[tuple], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Micro-benchmark `func(*args)` over a list of argument tuples.
+
+    - ns_per_op: best-of-`repeat` mean time per call (GC disabled while timing)
+    - peak_bytes_per_op: mean transient allocation high-water mark per call
+    - retained_blocks: blocks still allocated after one pass (leak indicator)
+    """
+    # Calibrate loop count so each timed run lasts at least `min_time`
+    loops = 1
+    while True:
+        elapsed = _time_pass(func, inputs, loops)
+        if elapsed >= min_time * 1e9 or loops >= 1_000_000:
+            break
+        loops *= 2
+
+    best = min(_time_pass(func, inputs, loops) for _ in range(repeat))
+    ns_per_op = best / (loops * len(inputs))
+
+    # -------------------------
+    # Allocation profile (separate pass: tracemalloc distorts timings)
+    # -------------------------
+    tracemalloc.start()
+    peak_total = 0
+    try:
+        for args in inputs:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += max(peak - before, 0)
+    finally:
+        tracemalloc.stop()
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    results = [func(*args) for args in inputs]
+    del results
+    gc.collect()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+
+    return {
+        "ops": loops * len(inputs),
+        "ns_per_op": round(ns_per_op, 1),
+        "ops_per_sec": round(1e9 / ns_per_op) if ns_per_op else 0,
+        "peak_bytes_per_op": round(peak_total / len(inputs), 1),
+        "retained_blocks": max(retained_blocks, 0),
+    }
+
+
+def _time_pass(func, inputs: list[tuple], loops: int) -> int:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            for args in inputs:
+                func(*args)
+        return time.perf_counter_ns() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+import statistics
+
+# Metrics where a larger value is an improvement; everything else is "lower is better"
+HIGHER_IS_BETTER = frozenset({"throughput_rps", "ops_per_sec", "rows_per_sec", "compression_ratio"})
+
+
+def summarize_latencies(latencies: list[float], elapsed: float, errors: int = 0) -> dict:
+    """
+    Summarize per-request latencies (seconds) into throughput and percentiles (ms).
+    """
+    count = len(latencies)
+    if count >= 2:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+    }
+
+
+def load_baseline(path: str | Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str | Path, results: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float, metrics: tuple[str, ...]) -> list[str]:
+    """
+    Compare {case: {metric: value}} results against a stored baseline.
+
+    Returns human-readable regression messages for every metric that got
+    worse by more than `tolerance` (e.g. 0.10 → 10%). Cases or metrics
+    missing from the baseline are ignored.
+    """
+    regressions = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if not previous:
+            continue
+        for metric in metrics:
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            if worse > tolerance:
+                regressions.append(f"{case}.{metric}: {old} → {new} ({change:+.1%})")
+    return regressions
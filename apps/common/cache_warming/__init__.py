@@ -0,0 +1,85 @@
+"""
+Declared cache warmers.
+
+Apps declare warmers in a `warmers` module (discovered like `admin`):
+
+    @warmer("catalog.categories", priority=10)
+    def warm_categories():
+        return len(Category.objects.all().cached())
+
+A warmer fills the cache through the same code path requests use
+(`.cached()`, `get_cached()`, `get_or_compute()`), so the keys it writes
+are exactly the ones requests read. It may return the number of items it
+warmed for progress output. `manage.py warm_cache` runs them (see runner).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.utils.module_loading import autodiscover_modules
+
+
+class WarmerError(Exception):
+    """
+    Invalid warmer declaration or selection.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class CacheWarmer:
+    name: str
+    func: Callable[[], int | None]
+    # Higher runs first (reference tables before what is computed from them)
+    priority: int = 0
+    # A failed required warmer keeps the cache from being marked warm
+    required: bool = True
+    tags: frozenset[str] = frozenset()
+
+
+# Registered warmers by name
+cache_warmers: dict[str, CacheWarmer] = {}
+
+
+def register_warmer(
+    name: str,
+    func: Callable[[], int | None],
+    priority: int = 0,
+    required: bool = True,
+    tags: tuple[str, ...] = (),
+) -> CacheWarmer:
+    if name in cache_warmers and cache_warmers[name].func is not func:
+        raise WarmerError(f"Cache warmer {name!r} is already registered")
+    cache_warmers[name] = CacheWarmer(name, func, priority, required, frozenset(tags))
+    return cache_warmers[name]
+
+
+def warmer(name: str | None = None, priority: int = 0, required: bool = True, tags: tuple[str, ...] = ()):
+    """
+    Decorator registering a cache warmer (named after the function by default).
+    """
+
+    def decorator(func):
+        register_warmer(name or f"{func.__module__}.{func.__qualname__}", func, priority, required, tags)
+        return func
+
+    return decorator
+
+
+def autodiscover() -> None:
+    # Import `<app>.warmers` of every installed app
+    autodiscover_modules("warmers")
+
+
+def select_warmers(names: list[str] | None = None, tags: list[str] | None = None) -> list[CacheWarmer]:
+    """
+    Registered warmers matching `names` and `tags` (all when both are empty), highest priority first.
+    """
+    unknown = set(names or ()) - cache_warmers.keys()
+    if unknown:
+        raise WarmerError(f"Unknown cache warmers: {', '.join(sorted(unknown))}")
+    selected = [
+        entry
+        for entry in cache_warmers.values()
+        if (not names or entry.name in names) and (not tags or entry.tags.intersection(tags))
+    ]
+    return sorted(selected, key=lambda entry: (-entry.priority, entry.name))
@@ -0,0 +1,94 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import queue
+import threading
+import time
+
+from django.db import connections
+
+from apps.common.cache_warming import CacheWarmer
+
+logger = logging.getLogger(__name__)
+
+# Result statuses
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+
+@dataclass(slots=True)
+class WarmResult:
+    name: str
+    status: str
+    required: bool
+    duration: float = 0.0
+    items: int | None = None
+    error: str = ""
+
+
+def run_warmer(entry: CacheWarmer) -> WarmResult:
+    started = time.perf_counter()
+    try:
+        items = entry.func()
+    except Exception as exc:
+        logger.exception("Cache warmer %s failed", entry.name)
+        return WarmResult(entry.name, STATUS_ERROR, entry.required, time.perf_counter() - started, error=repr(exc))
+    finally:
+        # Pool threads are not request threads: nothing else closes their connections
+        connections.close_all()
+    return WarmResult(
+        entry.name, STATUS_OK, entry.required, time.perf_counter() - started, items if isinstance(items, int) else None
+    )
+
+
+def run_warmers(
+    warmers: list[CacheWarmer],
+    workers: int,
+    timeout: float,
+    on_result: Callable[[WarmResult], None] | None = None,
+) -> list[WarmResult]:
+    """
+    Run `warmers` (in list order) on at most `workers` threads.
+
+    `on_result` is called from the calling thread as each warmer finishes.
+    Warmers still queued or running after `timeout` seconds are reported as
+    timed out; running ones are left to finish on daemon threads, which do
+    not keep the process alive.
+    """
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for entry in warmers:
+        pending.put(entry)
+    finished: queue.SimpleQueue = queue.SimpleQueue()
+    stop = threading.Event()
+
+    def work():
+        while not stop.is_set():
+            try:
+                entry = pending.get_nowait()
+            except queue.Empty:
+                return
+            finished.put(run_warmer(entry))
+
+    for index in range(min(workers, len(warmers))):
+        threading.Thread(target=work, name=f"cache-warmer-{index}", daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    results: dict[str, WarmResult] = {}
+    while len(results) < len(warmers):
+        try:
+            result = finished.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            break
+        results[result.name] = result
+        if on_result is not None:
+            on_result(result)
+
+    # Nothing new starts after the deadline
+    stop.set()
+    for entry in warmers:
+        if entry.name not in results:
+            results[entry.name] = WarmResult(entry.name, STATUS_TIMEOUT, entry.required, timeout)
+            if on_result is not None:
+                on_result(results[entry.name])
+    return [results[entry.name] for entry in warmers]
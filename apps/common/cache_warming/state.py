@@ -0,0 +1,78 @@
+import logging
+import os
+import socket
+import time
+
+from django.core.cache import caches
+
+from apps.common.functions.tiered_cache import SHARED_ALIAS, delete_if_value
+from config.django.cache_warming import cache_warming_config
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cache_warming:"
+
+# Latched per process: once this node was ready, a later Redis flush does not take it out of rotation
+_warm_seen = False
+
+
+def marker_key() -> str:
+    version = cache_warming_config.CACHE_WARMING_VERSION
+    return f"{KEY_PREFIX}warm:{version}" if version else f"{KEY_PREFIX}warm"
+
+
+def lock_key() -> str:
+    return f"{marker_key()}:lock"
+
+
+def warm_state() -> dict | None:
+    """
+    The marker left by the last complete run for CACHE_WARMING_VERSION (None when cold).
+    """
+    return caches[SHARED_ALIAS].get(marker_key())
+
+
+def mark_warm(duration: float, warmed: int) -> None:
+    # No expiry: the marker goes away with the data it describes (flush, eviction)
+    state = {
+        "finished_at": time.time(),
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        "duration": duration,
+        "warmers": warmed,
+    }
+    caches[SHARED_ALIAS].set(marker_key(), state, None)
+
+
+def clear_warm() -> None:
+    caches[SHARED_ALIAS].delete(marker_key())
+
+
+def acquire_lock(timeout: float) -> str | None:
+    """
+    Claim the warm-up for this version so nodes deploying together don't all hit the database.
+
+    Returns the lock token to pass to release_lock(), or None when another node holds it.
+    """
+    token = f"{socket.gethostname()}:{os.getpid()}:{os.urandom(8).hex()}"
+    if caches[SHARED_ALIAS].add(lock_key(), token, int(timeout) + 1):
+        return token
+    return None
+
+
+def release_lock(token: str) -> None:
+    try:
+        # Only our own lock: after it expired another node may have taken over
+        delete_if_value(caches[SHARED_ALIAS], lock_key(), token)
+    except Exception:
+        logger.warning("Releasing the cache warming lock failed", exc_info=True)
+
+
+def check_warm() -> bool:
+    """
+    Readiness check (CACHE_WARMING_READINESS): ready once the cache was marked warm.
+    """
+    global _warm_seen
+    if not _warm_seen:
+        _warm_seen = warm_state() is not None
+    return _warm_seen
@@ -0,0 +1,44 @@
+from django.core import checks
+from django.urls import get_resolver
+
+from apps.common.filters import IndexedFilterSet
+
+
+def all_subclasses(cls) -> list[type]:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(all_subclasses(subclass))
+    return subclasses
+
+
+@checks.register(checks.Tags.models)
+def check_filter_indexes(app_configs, **kwargs):
+    """
+    Report IndexedFilterSet filters that would scan unindexed columns.
+    """
+    # Filtersets live next to the views; make sure the URLconf imported them
+    try:
+        get_resolver().url_patterns  # noqa: B018
+    except Exception:
+        # Broken URLconfs are reported by the urls checks
+        pass
+
+    messages = []
+    for filterset in all_subclasses(IndexedFilterSet):
+        if filterset._meta.model is None:
+            continue
+        if app_configs is not None and filterset._meta.model._meta.app_config not in app_configs:
+            continue
+        message_class, check_id = (checks.Error, "common.E001") if filterset.is_strict() else (checks.Warning, "common.W001")
+        for name, reason in filterset.get_unindexed_filters().items():
+            messages.append(
+                message_class(
+                    f"Filter '{name}' of {filterset.__module__}.{filterset.__qualname__}: {reason}.",
+                    hint="Add db_index=True or a Meta.indexes entry, use FullTextSearchFilter for text search, "
+                    "or list the filter in unindexed_fields.",
+                    obj=filterset,
+                    id=check_id,
+                )
+            )
+    return messages
@@ -0,0 +1,107 @@
+"""
+Per-request deadlines.
+
+DeadlineMiddleware opens a budget (DEFAULT_TIMEOUT or the view's own
+`deadline` attribute); the database and Redis layers apply whatever is left
+of it to each call and raise DeadlineExceeded once it is spent.
+"""
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+import threading
+import time
+
+# Layers that can run out of time
+LAYER_VIEW = "view"
+LAYER_DATABASE = "database"
+LAYER_CACHE = "cache"
+
+
+class DeadlineExceeded(Exception):
+    """
+    The request budget ran out in `layer` (answered with 504).
+    """
+
+    def __init__(self, layer: str):
+        super().__init__(f"Request deadline exceeded in {layer}")
+        self.layer = layer
+
+
+@dataclass(slots=True)
+class Deadline:
+    # Mutable holder: process_view may run in another thread (async mode) and still adjust it
+    started_at: float
+    expires_at: float
+    exceeded_in: str | None = None
+    # Set by the async middleware to reschedule cancellation when the budget changes
+    on_change: Callable[[], None] | None = None
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+current_deadline: ContextVar[Deadline | None] = ContextVar("current_deadline", default=None)
+
+_counters = dict.fromkeys((LAYER_VIEW, LAYER_DATABASE, LAYER_CACHE), 0)
+_counters_lock = threading.Lock()
+
+
+def start_deadline(seconds: float) -> Deadline:
+    now = time.monotonic()
+    return Deadline(now, now + seconds)
+
+
+def remaining() -> float | None:
+    """
+    Seconds left in the current request's budget, or None outside a request.
+    """
+    deadline = current_deadline.get()
+    return None if deadline is None else deadline.remaining()
+
+
+def exceeded(layer: str) -> DeadlineExceeded:
+    """
+    Record which layer ran out of time and build the exception to raise.
+
+    Only the first layer per request is counted.
+    """
+    deadline = current_deadline.get()
+    if deadline is None or deadline.exceeded_in is None:
+        if deadline is not None:
+            deadline.exceeded_in = layer
+        with _counters_lock:
+            _counters[layer] = _counters.get(layer, 0) + 1
+    return DeadlineExceeded(layer)
+
+
+def check(layer: str) -> float | None:
+    """
+    Raise DeadlineExceeded when the budget is spent; return the seconds left.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise exceeded(layer)
+    return left
+
+
+def deadline_metrics() -> dict:
+    with _counters_lock:
+        return dict(_counters)
+
+
+def deadline(seconds: float):
+    """
+    Give a view its own budget instead of DEFAULT_TIMEOUT.
+
+        @deadline(5)
+        def report(request): ...
+
+    Class-based views set a `deadline` class attribute instead.
+    """
+
+    def decorator(view):
+        view.deadline = seconds
+        return view
+
+    return decorator
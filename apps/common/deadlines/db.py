@@ -0,0 +1,55 @@
+from apps.common.deadlines import LAYER_DATABASE, check, exceeded
+
+# PostgreSQL "query_canceled" (raised when statement_timeout fires)
+QUERY_CANCELED = "57014"
+
+# Connection attribute remembering the statement_timeout (ms) last applied
+APPLIED_ATTR = "deadline_statement_timeout"
+
+
+def apply_statement_timeout(connection, cursor, left: float | None) -> None:
+    """
+    Keep PostgreSQL's statement_timeout close to the remaining budget.
+
+    Re-setting costs a round trip, so it only happens when the applied value
+    overshoots the budget by more than 20% (at least 100ms), and it is
+    cleared again lazily on the first query outside a request.
+    """
+    applied = getattr(connection, APPLIED_ATTR, 0)
+    if left is None:
+        if applied:
+            cursor.execute("SET statement_timeout = 0")
+            setattr(connection, APPLIED_ATTR, 0)
+        return
+
+    wanted = max(int(left * 1000), 1)
+    if applied and wanted <= applied <= wanted + max(100, wanted // 5):
+        return
+    cursor.execute(f"SET statement_timeout = {wanted}")
+    setattr(connection, APPLIED_ATTR, wanted)
+
+
+def enforce_deadline(execute, sql, params, many, context):
+    """
+    connection.execute_wrapper() hook: refuse queries once the budget is
+    spent and, on PostgreSQL, cap each statement at the remaining time.
+    """
+    left = check(LAYER_DATABASE)
+    connection = context["connection"]
+    if connection.vendor != "postgresql":
+        return execute(sql, params, many, context)
+
+    # Raw DB-API cursor: the SET must not go through execute_wrappers (this hook) again
+    apply_statement_timeout(connection, context["cursor"].cursor, left)
+    try:
+        return execute(sql, params, many, context)
+    except Exception as exc:
+        cause = exc.__cause__ or exc
+        if left is not None and getattr(cause, "sqlstate", getattr(cause, "pgcode", None)) == QUERY_CANCELED:
+            raise exceeded(LAYER_DATABASE) from exc
+        raise
+
+
+def install_deadline_wrapper(connection) -> None:
+    if enforce_deadline not in connection.execute_wrappers:
+        connection.execute_wrappers.append(enforce_deadline)
@@ -0,0 +1,39 @@
+from redis.connection import Connection, ConnectionPool
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from apps.common.deadlines import LAYER_CACHE, check, exceeded, remaining
+
+
+class DeadlineConnection(Connection):
+    """
+    Redis connection that refuses to send once the request budget is spent
+    and whose reads wait at most the remaining budget (never longer than
+    the configured socket timeout).
+    """
+
+    def send_packed_command(self, command, check_health=True):
+        check(LAYER_CACHE)
+        return super().send_packed_command(command, check_health)
+
+    def read_response(self, *args, **kwargs):
+        left = remaining()
+        if left is None or "timeout" in kwargs or (self.socket_timeout and left >= self.socket_timeout):
+            return super().read_response(*args, **kwargs)
+        if left <= 0:
+            # A reply is pending on this socket; drop it rather than desynchronize the connection
+            self.disconnect()
+            raise exceeded(LAYER_CACHE)
+        try:
+            return super().read_response(*args, timeout=left, **kwargs)
+        except RedisTimeoutError as exc:
+            raise exceeded(LAYER_CACHE) from exc
+
+
+class DeadlineConnectionPool(ConnectionPool):
+    """
+    Connection pool for django-redis (CONNECTION_POOL_CLASS) using DeadlineConnection.
+    """
+
+    def __init__(self, connection_class=DeadlineConnection, **kwargs):
+        # TLS URLs pick their own connection class and keep socket-level timeouts only
+        super().__init__(connection_class=connection_class, **kwargs)
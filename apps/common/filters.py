@@ -0,0 +1,122 @@
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+import django_filters
+
+from apps.common.search import full_text_filter
+from config.django.rest_framework import drf_config
+
+# Lookups a B-tree index cannot serve (leading wildcard / pattern / case-folding)
+UNINDEXABLE_LOOKUPS = frozenset({"contains", "icontains", "endswith", "iendswith", "regex", "iregex", "iexact", "istartswith"})
+
+
+def indexed_fields(model) -> set[str]:
+    """
+    Names of fields that lead at least one index on `model`.
+
+    Composite indexes only count for their first column.
+    """
+    meta = model._meta
+    names = {field.name for field in meta.concrete_fields if field.primary_key or field.unique or field.db_index}
+
+    for index in meta.indexes:
+        if index.fields:
+            names.add(index.fields[0].lstrip("-"))
+    for constraint in meta.constraints:
+        if getattr(constraint, "fields", None):
+            names.add(constraint.fields[0])
+    for fields in meta.unique_together:
+        names.add(fields[0])
+    return names
+
+
+def unindexed_reason(model, field_name: str, lookup_expr: str) -> str | None:
+    """
+    Explain why filtering `model` on `field_name__lookup_expr` cannot use an
+    index, or return None when it can. Relation hops are joined on foreign
+    keys, which are indexed, so only the final field is checked.
+    """
+    if lookup_expr.split("__")[-1] in UNINDEXABLE_LOOKUPS:
+        return f"lookup '{lookup_expr}' cannot use a B-tree index"
+
+    *path, name = field_name.split("__")
+    try:
+        for part in path:
+            model = model._meta.get_field(part).related_model
+        field = model._meta.get_field(name)
+    except (FieldDoesNotExist, AttributeError):
+        # Not a model path (e.g. an annotation); nothing to check
+        return None
+
+    if field.is_relation:
+        return None
+    if field.name not in indexed_fields(model):
+        return f"column {model._meta.label}.{field.name} is not indexed"
+    return None
+
+
+class FullTextSearchFilter(django_filters.CharFilter):
+    """
+    Full-text search over `fields` backed by the CreateFullTextIndex migration
+    operation (tsvector + GIN on PostgreSQL, FTS5 on SQLite).
+
+    Replaces `icontains` scans over text columns.
+    """
+
+    def __init__(self, *args, fields: list[str], config: str = "english", vector_column: str = "search_vector", **kwargs):
+        kwargs.setdefault("field_name", "search")
+        super().__init__(*args, **kwargs)
+        self.search_fields = list(fields)
+        self.config = config
+        self.vector_column = vector_column
+
+    def filter(self, qs, value):
+        if value in django_filters.constants.EMPTY_VALUES:
+            return qs
+        return full_text_filter(qs, self.search_fields, value, self.config, self.vector_column)
+
+
+class IndexedFilterSet(django_filters.FilterSet):
+    """
+    FilterSet that knows which of its filters would cause sequential scans.
+
+    Unindexed filters are reported by the `common` system checks at startup
+    (warnings, or errors with FILTER_INDEX_STRICT). In strict mode the
+    filterset also refuses to run, since WSGI/ASGI servers skip system checks.
+
+    - `unindexed_fields`: filter names accepted even though unindexed
+      (e.g. small tables).
+    - `strict_indexes`: per-class override of FILTER_INDEX_STRICT.
+    """
+
+    unindexed_fields: tuple[str, ...] = ()
+    strict_indexes: bool | None = None
+
+    @classmethod
+    def is_strict(cls) -> bool:
+        return drf_config.FILTER_INDEX_STRICT if cls.strict_indexes is None else cls.strict_indexes
+
+    @classmethod
+    def get_unindexed_filters(cls) -> dict[str, str]:
+        """
+        Return {filter name: reason} for filters that cannot use an index.
+        """
+        # Cached per class (not inherited): filters are fixed once the class is built
+        if "_unindexed_filters" not in cls.__dict__:
+            unindexed = {}
+            model = cls._meta.model
+            for name, filter_ in cls.base_filters.items():
+                # Custom methods and the full-text filter manage their own queries
+                if model is None or name in cls.unindexed_fields or filter_.method or isinstance(filter_, FullTextSearchFilter):
+                    continue
+                reason = unindexed_reason(model, filter_.field_name, filter_.lookup_expr)
+                if reason:
+                    unindexed[name] = reason
+            cls._unindexed_filters = unindexed
+        return cls._unindexed_filters
+
+    def __init__(self, *args, **kwargs):
+        if self.is_strict() and self.get_unindexed_filters():
+            raise ImproperlyConfigured(
+                f"{type(self).__qualname__} filters on unindexed columns: "
+                + "; ".join(f"{name} ({reason})" for name, reason in self.get_unindexed_filters().items())
+            )
+        super().__init__(*args, **kwargs)
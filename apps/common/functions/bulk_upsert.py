@@ -0,0 +1,217 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import StrEnum
+from functools import reduce
+import io
+import json
+import operator
+
+from django.db import connections, models, transaction
+
+from config.django.database import database_config
+
+
+class UpsertStrategyChoices(StrEnum):
+    # How bulk_upsert() writes rows
+    AUTO = "auto"  # COPY on PostgreSQL above BULK_UPSERT_COPY_THRESHOLD, else BULK_CREATE
+    BULK_CREATE = "bulk_create"  # batched INSERT ... ON CONFLICT DO UPDATE (all backends)
+    COPY = "copy"  # PostgreSQL only: COPY into a temp table, then one merge statement
+
+
+@dataclass(frozen=True, slots=True)
+class UpsertResult:
+    created: int = 0
+    updated: int = 0
+
+    def __add__(self, other: "UpsertResult") -> "UpsertResult":
+        return UpsertResult(self.created + other.created, self.updated + other.updated)
+
+
+def deduplicate(objs, attnames: list[str]) -> list:
+    # A key may appear once per statement on PostgreSQL; the last occurrence wins
+    return list({tuple(getattr(obj, attname) for attname in attnames): obj for obj in objs}.values())
+
+
+def bulk_upsert(
+    queryset,
+    objs,
+    unique_fields: list[str],
+    update_fields: list[str] | None = None,
+    batch_size: int | None = None,
+    strategy: UpsertStrategyChoices = UpsertStrategyChoices.AUTO,
+) -> UpsertResult:
+    """
+    Insert `objs`, updating rows that conflict on `unique_fields`.
+
+    `update_fields` defaults to every concrete non-key field; an empty list
+    only inserts missing rows. Runs in a single transaction.
+    """
+    meta = queryset.model._meta
+    unique = [meta.get_field(name) for name in unique_fields]
+    if update_fields is None:
+        update = [field for field in meta.concrete_fields if not field.primary_key and field not in unique]
+    else:
+        update = [meta.get_field(name) for name in update_fields]
+
+    objs = deduplicate(objs, [field.attname for field in unique])
+    if not objs:
+        return UpsertResult()
+
+    connection = connections[queryset.db]
+    if strategy == UpsertStrategyChoices.AUTO:
+        use_copy = connection.vendor == "postgresql" and len(objs) >= database_config.BULK_UPSERT_COPY_THRESHOLD
+        strategy = UpsertStrategyChoices.COPY if use_copy else UpsertStrategyChoices.BULK_CREATE
+    if strategy == UpsertStrategyChoices.COPY and connection.vendor != "postgresql":
+        raise ValueError("The COPY upsert strategy requires PostgreSQL")
+
+    batch_size = batch_size or database_config.BULK_UPSERT_BATCH_SIZE
+    with transaction.atomic(using=queryset.db, savepoint=False):
+        if strategy == UpsertStrategyChoices.COPY:
+            return copy_upsert(queryset, objs, unique, update, batch_size)
+        return batched_upsert(queryset, objs, unique, update, batch_size)
+
+
+# -------------------------
+# Batched INSERT ... ON CONFLICT (all backends)
+# -------------------------
+def count_existing(queryset, unique: list, chunk: list) -> int:
+    manager = queryset.model._base_manager.using(queryset.db)
+    if len(unique) == 1:
+        field = unique[0]
+        return manager.filter(**{f"{field.attname}__in": [getattr(obj, field.attname) for obj in chunk]}).count()
+    conditions = (models.Q(**{field.attname: getattr(obj, field.attname) for field in unique}) for obj in chunk)
+    return manager.filter(reduce(operator.or_, conditions)).count()
+
+
+def batched_upsert(queryset, objs: list, unique: list, update: list, batch_size: int) -> UpsertResult:
+    """
+    Upsert in chunks with bulk_create(); counts come from a key lookup per chunk.
+
+    Counts are exact unless a concurrent transaction inserts the same keys.
+    """
+    connection = connections[queryset.db]
+    # Respect backend parameter limits (e.g. SQLite's variable cap) for the insert and the lookup
+    batch_size = max(min(batch_size, connection.ops.bulk_batch_size(queryset.model._meta.concrete_fields, objs)), 1)
+    if update:
+        options = {"update_conflicts": True, "update_fields": [field.name for field in update]}
+        if connection.features.supports_update_conflicts_with_target:
+            options["unique_fields"] = [field.name for field in unique]
+    else:
+        options = {"ignore_conflicts": True}
+
+    result = UpsertResult()
+    for start in range(0, len(objs), batch_size):
+        chunk = objs[start : start + batch_size]
+        existing = count_existing(queryset, unique, chunk)
+        queryset.bulk_create(chunk, **options)
+        result += UpsertResult(created=len(chunk) - existing, updated=existing if update else 0)
+    return result
+
+
+# -------------------------
+# PostgreSQL COPY + merge
+# -------------------------
+def scalar_text(value) -> str:
+    # PostgreSQL text input for one prepared value
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def array_literal(values) -> str:
+    """
+    Render a (nested) list as a PostgreSQL array literal: [1, None, "a b"] -> {"1",NULL,"a b"}.
+    """
+    items = []
+    for value in values:
+        if value is None:
+            items.append("NULL")
+        elif isinstance(value, (list, tuple)):
+            items.append(array_literal(value))
+        else:
+            items.append('"' + scalar_text(value).replace("\\", "\\\\").replace('"', '\\"') + '"')
+    return "{" + ",".join(items) + "}"
+
+
+def copy_value(field, value, connection) -> str:
+    """
+    Render one value as a PostgreSQL CSV field (NULL is an unquoted \\N).
+
+    As with save() and bulk_create(), None is SQL NULL, also for JSONField;
+    `Value(None, JSONField())` stores JSON null.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(field, models.JSONField):
+        if isinstance(value, models.Value) and value.value is None:
+            text = "null"
+        else:
+            text = json.dumps(value, cls=field.encoder)
+    else:
+        value = field.get_db_prep_save(value, connection)
+        if value is None:
+            return "\\N"
+        # ArrayField values are lists once prepared
+        text = array_literal(value) if isinstance(value, (list, tuple)) else scalar_text(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def copy_chunks(objs: list, fields: list, connection, batch_size: int):
+    # CSV text per chunk, so memory stays bounded for very large loads
+    for start in range(0, len(objs), batch_size):
+        yield "".join(
+            ",".join(copy_value(field, field.pre_save(obj, add=True), connection) for field in fields) + "\n"
+            for obj in objs[start : start + batch_size]
+        )
+
+
+def copy_upsert(queryset, objs: list, unique: list, update: list, batch_size: int) -> UpsertResult:
+    """
+    Stream rows into a temporary table with COPY, then merge them with one
+    INSERT ... SELECT ... ON CONFLICT. `xmax = 0` on the returned rows tells
+    inserts from updates. Supports psycopg 3 and psycopg2.
+    """
+    connection = connections[queryset.db]
+    meta = queryset.model._meta
+    quote = connection.ops.quote_name
+
+    # Database-generated primary keys are left to the table default unless they are the conflict target
+    fields = [field for field in meta.concrete_fields if not (field.primary_key and field.db_returning and field not in unique)]
+    table = quote(meta.db_table)
+    temp_table = quote(f"upsert_{meta.db_table}"[: connection.ops.max_name_length()])
+    columns = ", ".join(quote(field.column) for field in fields)
+    conflict = ", ".join(quote(field.column) for field in unique)
+    if update:
+        action = "DO UPDATE SET " + ", ".join(f"{quote(field.column)} = EXCLUDED.{quote(field.column)}" for field in update)
+    else:
+        action = "DO NOTHING"
+
+    copy_sql = f"COPY {temp_table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TEMPORARY TABLE {temp_table} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA")
+
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, "copy"):
+            # psycopg 3
+            with raw_cursor.copy(copy_sql) as copy:
+                for chunk in copy_chunks(objs, fields, connection, batch_size):
+                    copy.write(chunk)
+        else:
+            # psycopg2
+            for chunk in copy_chunks(objs, fields, connection, batch_size):
+                raw_cursor.copy_expert(copy_sql, io.StringIO(chunk))
+
+        cursor.execute(
+            f"WITH upserted AS ("
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {temp_table} "
+            f"ON CONFLICT ({conflict}) {action} RETURNING (xmax = 0) AS inserted"
+            f") SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted"
+        )
+        created, updated = cursor.fetchone()
+        # Dropped now so the merge can run again within the same outer transaction
+        cursor.execute(f"DROP TABLE {temp_table}")
+    return UpsertResult(created=created, updated=updated)
@@ -0,0 +1,260 @@
+from functools import wraps
+import logging
+import os
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import caches
+from django.http import JsonResponse
+
+from apps.common.functions.tiered_cache import SHARED_ALIAS
+from config.django.bulkhead import bulkhead_config
+
+logger = logging.getLogger(__name__)
+
+# Redis sorted set per group: member = lease token, score = lease expiry (ms, Redis clock)
+BULKHEAD_PREFIX = "bulkhead:"
+
+# Token used when Redis is unavailable and only the local limit applies
+LOCAL_TOKEN = "local"
+
+# Backoff bounds (seconds) while queued for a cluster slot
+POLL_MIN_INTERVAL = 0.01
+POLL_MAX_INTERVAL = 0.1
+
+# Reclaim expired leases, then take a slot if one is free (atomic)
+ACQUIRE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now_ms + tonumber(ARGV[2]), ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+class BulkheadFull(Exception):
+    pass
+
+
+def redis_client():
+    # django-redis exposes the raw client; other backends (e.g. locmem) only get local limits
+    client = getattr(caches[SHARED_ALIAS], "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        return None
+    return client.get_client(write=True)
+
+
+class Bulkhead:
+    """
+    Cap in-flight work of one group across the cluster.
+
+    A local counter (never more than `limit` per worker) is checked first, so
+    a saturated worker sheds without touching Redis; the cluster-wide slot is
+    a lease in a Redis sorted set, reclaimed automatically when it expires.
+    Redis failures degrade to the local limit only.
+    """
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self.key = BULKHEAD_PREFIX + name
+        self._condition = threading.Condition()
+        self._script = None
+
+        # Saturation metrics (this worker)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.acquired = 0
+        self.queued = 0
+        self.shed = 0
+        self.redis_errors = 0
+        self.wait_seconds_total = 0.0
+
+    def acquire(self, timeout: float | None = None) -> str:
+        """
+        Take a slot, waiting up to `timeout` seconds; raise BulkheadFull otherwise.
+        """
+        timeout = bulkhead_config.BULKHEAD_QUEUE_TIMEOUT if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._condition:
+            if self.in_flight >= self.limit:
+                self.queued += 1
+            while self.in_flight >= self.limit:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.shed += 1
+                    raise BulkheadFull(self.name)
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        token = os.urandom(16).hex()
+        interval = POLL_MIN_INTERVAL
+        cluster_queued = False
+        while True:
+            try:
+                if self.acquire_cluster_slot(token):
+                    break
+            except Exception:
+                self.redis_errors += 1
+                logger.warning("Bulkhead %s: Redis unavailable, applying local limit only", self.name, exc_info=True)
+                token = LOCAL_TOKEN
+                break
+
+            if time.monotonic() >= deadline:
+                self.release_local()
+                with self._condition:
+                    self.shed += 1
+                raise BulkheadFull(self.name)
+            if not cluster_queued:
+                cluster_queued = True
+                with self._condition:
+                    self.queued += 1
+            time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            interval = min(interval * 2, POLL_MAX_INTERVAL)
+
+        with self._condition:
+            self.acquired += 1
+            self.wait_seconds_total += time.monotonic() - started
+        return token
+
+    def acquire_cluster_slot(self, token: str) -> bool:
+        client = redis_client()
+        if client is None:
+            return True
+        if self._script is None:
+            self._script = client.register_script(ACQUIRE_SCRIPT)
+        lease_ms = bulkhead_config.BULKHEAD_LEASE_SECONDS * 1000
+        return bool(self._script(keys=[self.key], args=[self.limit, lease_ms, token], client=client))
+
+    def release(self, token: str) -> None:
+        if token != LOCAL_TOKEN:
+            try:
+                client = redis_client()
+                if client is not None:
+                    client.zrem(self.key, token)
+            except Exception:
+                # The lease expires on its own
+                self.redis_errors += 1
+                logger.warning("Bulkhead %s: releasing slot failed", self.name, exc_info=True)
+        self.release_local()
+
+    def release_local(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def cluster_in_flight(self) -> int | None:
+        try:
+            client = redis_client()
+            if client is None:
+                return None
+            return client.zcount(self.key, int(time.time() * 1000), "+inf")
+        except Exception:
+            return None
+
+    def metrics(self) -> dict:
+        cluster_in_flight = self.cluster_in_flight()
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "cluster_in_flight": cluster_in_flight,
+            "saturation": round((self.in_flight if cluster_in_flight is None else cluster_in_flight) / self.limit, 3),
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "shed": self.shed,
+            "redis_errors": self.redis_errors,
+            "avg_wait_ms": round(self.wait_seconds_total / self.acquired * 1000, 3) if self.acquired else 0.0,
+        }
+
+
+_bulkheads: dict[str, Bulkhead] = {}
+_bulkheads_lock = threading.Lock()
+
+
+def get_bulkhead(name: str, limit: int | None = None) -> Bulkhead:
+    """
+    Return the process-wide bulkhead for a group.
+
+    BULKHEAD_GROUPS wins over `limit`, so limits can be tuned without a deploy.
+    """
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        with _bulkheads_lock:
+            bulkhead = _bulkheads.get(name)
+            if bulkhead is None:
+                limit = bulkhead_config.BULKHEAD_GROUPS.get(name, limit)
+                if not limit:
+                    raise ValueError(f"No concurrency limit configured for bulkhead group {name!r}")
+                bulkhead = _bulkheads[name] = Bulkhead(name, limit)
+    return bulkhead
+
+
+def bulkhead_metrics() -> dict:
+    return {name: bulkhead.metrics() for name, bulkhead in sorted(_bulkheads.items())}
+
+
+def shed_response(group: str) -> JsonResponse:
+    response = JsonResponse({"detail": "Server is busy, please retry later."}, status=503)
+    response["Retry-After"] = str(bulkhead_config.BULKHEAD_RETRY_AFTER)
+    logger.warning("Bulkhead %s saturated; request shed", group)
+    return response
+
+
+def run_in_bulkhead(group: str, func, *args, limit: int | None = None, **kwargs):
+    bulkhead = get_bulkhead(group, limit)
+    try:
+        token = bulkhead.acquire()
+    except BulkheadFull:
+        return shed_response(group)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        bulkhead.release(token)
+
+
+async def arun_in_bulkhead(group: str, func, *args, limit: int | None = None, **kwargs):
+    bulkhead = get_bulkhead(group, limit)
+    # Queueing blocks (condition wait, Redis polling), so it runs off the event loop
+    try:
+        token = await sync_to_async(bulkhead.acquire, thread_sensitive=False)()
+    except BulkheadFull:
+        return shed_response(group)
+    try:
+        return await func(*args, **kwargs)
+    finally:
+        await sync_to_async(bulkhead.release, thread_sensitive=False)(token)
+
+
+def bulkhead(group: str, limit: int | None = None):
+    """
+    Limit concurrent executions of a view (function or view method, sync or async).
+
+        @bulkhead("reports", limit=8)
+        def get(self, request): ...
+    """
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(*args, **kwargs):
+                return await arun_in_bulkhead(group, view, *args, limit=limit, **kwargs)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            return run_in_bulkhead(group, view, *args, limit=limit, **kwargs)
+
+        return wrapper
+
+    return decorator
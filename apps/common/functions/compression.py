@@ -0,0 +1,136 @@
+"""
+Content codecs shared by the compression middleware and its benchmark.
+"""
+
+import secrets
+import struct
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+# zstd skippable frame magic (0x184D2A50-0x184D2A5F): decoders ignore its payload
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+
+def available_encodings() -> set[str]:
+    encodings = {GZIP}
+    if zstandard is not None:
+        encodings.add(ZSTD)
+    if brotli is not None:
+        encodings.add(BROTLI)
+    return encodings
+
+
+def random_padding(max_bytes: int) -> int:
+    return secrets.randbelow(max_bytes) if max_bytes else 0
+
+
+# -------------------------
+# gzip (header written by hand so padding can go into FNAME, as Django does)
+# -------------------------
+def gzip_header(padding: int) -> bytes:
+    flags = 0x08 if padding else 0  # FNAME
+    header = b"\x1f\x8b\x08" + bytes([flags]) + b"\x00\x00\x00\x00\x00\xff"
+    if padding:
+        header += b"a" * padding + b"\x00"
+    return header
+
+
+class GzipStream:
+    def __init__(self, level: int, padding: int = 0):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self.crc = 0
+        self.size = 0
+        self.header = gzip_header(padding)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        out = self.header + self.compressor.compress(data)
+        self.header = b""
+        if flush:
+            # Sync flush: streamed chunks reach the client without waiting for more input
+            out += self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        return out
+
+    def finish(self) -> bytes:
+        out = self.header + self.compressor.flush(zlib.Z_FINISH)
+        return out + struct.pack("<II", self.crc, self.size & 0xFFFFFFFF)
+
+
+# -------------------------
+# zstd / brotli
+# -------------------------
+class ZstdStream:
+    def __init__(self, level: int, padding: int = 0):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        self.padding = padding
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        out = self.compressor.compress(data)
+        if flush:
+            out += self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return out
+
+    def finish(self) -> bytes:
+        out = self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        if self.padding:
+            out += struct.pack("<II", ZSTD_SKIPPABLE_MAGIC, self.padding) + b"\x00" * self.padding
+        return out
+
+
+class BrotliStream:
+    def __init__(self, level: int, padding: int = 0):
+        # brotli has no ignorable container field: never chosen for BREACH-sensitive responses
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        out = self.compressor.process(data)
+        if flush:
+            out += self.compressor.flush()
+        return out
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+STREAMS = {GZIP: GzipStream, ZSTD: ZstdStream, BROTLI: BrotliStream}
+
+
+def compress_bytes(data: bytes, encoding: str, level: int, padding: int = 0) -> bytes:
+    if encoding == ZSTD and not padding:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == BROTLI:
+        return brotli.compress(data, quality=level)
+    stream = STREAMS[encoding](level, padding)
+    return stream.compress(data, flush=False) + stream.finish()
+
+
+def compress_iterator(chunks, encoding: str, level: int, padding: int = 0):
+    stream = STREAMS[encoding](level, padding)
+    for chunk in chunks:
+        data = stream.compress(chunk)
+        if data:
+            yield data
+    yield stream.finish()
+
+
+async def compress_async_iterator(chunks, encoding: str, level: int, padding: int = 0):
+    stream = STREAMS[encoding](level, padding)
+    async for chunk in chunks:
+        data = stream.compress(chunk)
+        if data:
+            yield data
+    yield stream.finish()
@@ -0,0 +1,175 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from config.django.static import MediaServeChoices, static_config
+
+# Single "bytes=start-end" range; multi-range requests are answered with the full body
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFile:
+    """
+    Bounded view over an open file.
+
+    Exposes `fileno()` so servers with `wsgi.file_wrapper` (gunicorn, uwsgi)
+    can sendfile() the range straight from the page cache, while `read()`
+    stops at the range end for servers that iterate the body.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        file.seek(start)
+        self.file = file
+        self.name = file.name
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def resolve_media_path(path: str) -> str:
+    """
+    Resolve a URL path to an existing file inside MEDIA_ROOT.
+
+    Raises Http404 for traversal attempts and missing files.
+    """
+    try:
+        full_path = safe_join(static_config.MEDIA_ROOT, path)
+    except SuspiciousFileOperation as exc:
+        raise Http404("File not found") from exc
+
+    if not os.path.isfile(full_path):
+        raise Http404("File not found")
+    return full_path
+
+
+def parse_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single byte range into an inclusive (start, end) pair.
+
+    Returns None when the header is absent, unsupported or syntactically
+    invalid (serve full body) and raises ValueError when a valid range
+    cannot be satisfied (RFC 9110 §14.2).
+    """
+    match = RANGE_RE.match(range_header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start:
+        # Suffix range: last N bytes
+        if not end:
+            return None
+        length = int(end)
+        if length == 0:
+            raise ValueError(range_header)
+        if size == 0:
+            # Nothing to slice: the (empty) full body is the answer
+            return None
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    if end and int(end) < start:
+        # last-pos before first-pos is invalid, not unsatisfiable: ignore the header
+        return None
+    if start >= size:
+        raise ValueError(range_header)
+    end = min(int(end), size - 1) if end else size - 1
+    return start, end
+
+
+def if_range_matches(request, etag: str, last_modified: int) -> bool:
+    # A missing If-Range means the range always applies
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        # Strong comparison only (weak ETags never match If-Range)
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def serve_media(request, path: str, as_attachment: bool = False) -> HttpResponse:
+    """
+    Serve a file from MEDIA_ROOT after the caller has checked permissions.
+
+    Depending on MEDIA_SERVE_MODE the body is either handed off to the front
+    proxy (X-Accel-Redirect / X-Sendfile) or streamed with Range support.
+    """
+    full_path = resolve_media_path(path)
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+
+    # -------------------------
+    # Proxy handoff (no bytes through Python)
+    # -------------------------
+    if static_config.MEDIA_SERVE_MODE != MediaServeChoices.DIRECT:
+        response = HttpResponse(content_type=content_type)
+        if static_config.MEDIA_SERVE_MODE == MediaServeChoices.X_ACCEL_REDIRECT:
+            relative_path = os.path.relpath(full_path, static_config.MEDIA_ROOT).replace(os.sep, "/")
+            response["X-Accel-Redirect"] = static_config.MEDIA_ACCEL_REDIRECT_PREFIX + quote(relative_path)
+        else:
+            response["X-Sendfile"] = full_path
+        if as_attachment:
+            response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(os.path.basename(full_path))}"
+        return response
+
+    # -------------------------
+    # Conditional request handling
+    # -------------------------
+    stat_result = os.stat(full_path)
+    size = stat_result.st_size
+    last_modified = int(stat_result.st_mtime)
+    etag = f'"{last_modified:x}-{size:x}"'
+
+    conditional_response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if conditional_response is not None:
+        return conditional_response
+
+    # -------------------------
+    # Range handling
+    # -------------------------
+    byte_range = None
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and request.method in ("GET", "HEAD") and if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    start, end = byte_range or (0, size - 1)
+    length = max(end - start + 1, 0)
+
+    response = FileResponse(
+        RangeFile(open(full_path, "rb"), start, length),  # closed by FileResponse
+        as_attachment=as_attachment,
+        content_type=content_type,
+        status=206 if byte_range else 200,
+    )
+    response["Content-Length"] = str(length)
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    if byte_range:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
@@ -0,0 +1,286 @@
+from collections import deque
+import json
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import tracemalloc
+
+from apps.common.functions.bulkhead import redis_client
+from apps.common.server.memory import process_memory
+from config.django.base import base_config
+from config.django.memory_profiling import memory_profiling_config
+
+logger = logging.getLogger(__name__)
+
+# Redis hash: field = worker id, value = that worker's published profile (JSON)
+WORKERS_KEY = "memprof:workers"
+WORKERS_TTL = 24 * 3600
+
+# Routes beyond MEMORY_PROFILING_MAX_ROUTES are grouped under this name
+OTHER_ROUTE = "<other>"
+
+# Allocations of the profiler itself are not attributed to requests
+EXCLUDE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def short_path(filename: str) -> str:
+    """
+    Path relative to the project, or starting at site-packages for libraries.
+    """
+    base = str(base_config.BASE_DIR)
+    if filename.startswith(base):
+        return filename[len(base) :].lstrip(os.sep)
+    marker = f"{os.sep}site-packages{os.sep}"
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    return filename
+
+
+def site_name(traceback: tracemalloc.Traceback) -> str:
+    # Most recent frame first
+    return " <- ".join(f"{short_path(frame.filename)}:{frame.lineno}" for frame in reversed(traceback))
+
+
+class MemoryProfiler:
+    """
+    Per-worker aggregation of sampled request allocations.
+
+    tracemalloc is process-wide, so at most one request per worker is
+    traced at a time; in threaded or async workers a sample also contains
+    the allocations of requests running concurrently (noise, not loss).
+
+    - peak: highest traced memory while the request ran
+    - net: memory allocated during the request and still alive at its end
+      (the response itself, caches, leaks)
+    - sites: allocation sites of that net memory, ranked across samples
+    """
+
+    def __init__(self):
+        self._sampling = threading.Lock()
+        self._lock = threading.Lock()
+        self._last_publish = 0.0
+        self.reset()
+
+    def after_fork(self) -> None:
+        # Forked workers start with fresh locks and an empty profile (the master's is not theirs)
+        self._sampling = threading.Lock()
+        self._lock = threading.Lock()
+        self._last_publish = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes: dict[str, dict] = {}
+            self.sites: dict[str, dict] = {}
+            self.recent: deque = deque(maxlen=memory_profiling_config.MEMORY_PROFILING_RECENT_SAMPLES)
+            self.sampled = 0
+            self.skipped_busy = 0
+
+    # -------------------------
+    # Sampling
+    # -------------------------
+    def start(self) -> bool:
+        """
+        Decide whether to trace this request and start tracing if so.
+        """
+        if random.random() >= memory_profiling_config.MEMORY_PROFILING_SAMPLE_RATE:
+            return False
+        if not self._sampling.acquire(blocking=False):
+            self.skipped_busy += 1
+            return False
+        if tracemalloc.is_tracing():
+            # Owned by someone else (a debugging session, PYTHONTRACEMALLOC)
+            self._sampling.release()
+            return False
+        tracemalloc.start(memory_profiling_config.MEMORY_PROFILING_TRACEBACK_DEPTH)
+        return True
+
+    def stop(self, route: str, started: float, status: int | None) -> None:
+        """
+        Stop tracing and record the sample; must follow a successful start().
+        """
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+            self._sampling.release()
+
+        key_type = "lineno" if memory_profiling_config.MEMORY_PROFILING_TRACEBACK_DEPTH == 1 else "traceback"
+        statistics = snapshot.filter_traces(EXCLUDE_FILTERS).statistics(key_type)
+        top = [
+            {"site": site_name(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in statistics[: memory_profiling_config.MEMORY_PROFILING_TOP_SITES]
+        ]
+        self.record(route, peak, current, time.perf_counter() - started, status, top)
+        self.maybe_publish()
+
+    def record(self, route: str, peak: int, net: int, duration: float, status: int | None, top: list[dict]) -> None:
+        with self._lock:
+            self.sampled += 1
+            if route not in self.routes and len(self.routes) >= memory_profiling_config.MEMORY_PROFILING_MAX_ROUTES:
+                route = OTHER_ROUTE
+            stats = self.routes.setdefault(route, {"samples": 0, "peak_total": 0, "peak_max": 0, "net_total": 0, "net_max": 0})
+            stats["samples"] += 1
+            stats["peak_total"] += peak
+            stats["peak_max"] = max(stats["peak_max"], peak)
+            stats["net_total"] += net
+            stats["net_max"] = max(stats["net_max"], net)
+
+            for entry in top:
+                site = self.sites.setdefault(entry["site"], {"size": 0, "count": 0, "samples": 0, "routes": set()})
+                site["size"] += entry["size"]
+                site["count"] += entry["count"]
+                site["samples"] += 1
+                if len(site["routes"]) < 10:
+                    site["routes"].add(route)
+            limit = memory_profiling_config.MEMORY_PROFILING_MAX_SITES
+            if len(self.sites) > 2 * limit:
+                # Amortized trim back to the heaviest sites
+                self.sites = dict(sorted(self.sites.items(), key=lambda item: item[1]["size"], reverse=True)[:limit])
+
+            self.recent.append(
+                {
+                    "route": route,
+                    "status": status,
+                    "peak": peak,
+                    "net": net,
+                    "duration_ms": round(duration * 1000, 3),
+                    "at": int(time.time()),
+                    "top": top,
+                }
+            )
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    def snapshot(self) -> dict:
+        """
+        This worker's profile (JSON-serializable).
+        """
+        with self._lock:
+            routes = {
+                route: {
+                    "samples": stats["samples"],
+                    "peak_mean": stats["peak_total"] // stats["samples"],
+                    "peak_max": stats["peak_max"],
+                    "net_mean": stats["net_total"] // stats["samples"],
+                    "net_max": stats["net_max"],
+                    "peak_total": stats["peak_total"],
+                    "net_total": stats["net_total"],
+                }
+                for route, stats in self.routes.items()
+            }
+            sites = sorted(self.sites.items(), key=lambda item: item[1]["size"], reverse=True)
+            return {
+                "worker": worker_id(),
+                "sample_rate": memory_profiling_config.MEMORY_PROFILING_SAMPLE_RATE,
+                "sampled": self.sampled,
+                "skipped_busy": self.skipped_busy,
+                "memory": process_memory(os.getpid()),
+                "routes": routes,
+                "sites": [
+                    {
+                        "site": site,
+                        "size": stats["size"],
+                        "count": stats["count"],
+                        "samples": stats["samples"],
+                        "routes": sorted(stats["routes"]),
+                    }
+                    for site, stats in sites[: memory_profiling_config.MEMORY_PROFILING_MAX_SITES]
+                ],
+                "recent": list(self.recent),
+            }
+
+    def maybe_publish(self) -> None:
+        now = time.monotonic()
+        if now - self._last_publish < memory_profiling_config.MEMORY_PROFILING_PUBLISH_INTERVAL:
+            return
+        self._last_publish = now
+        publish(self.snapshot())
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+memory_profiler = MemoryProfiler()
+os.register_at_fork(after_in_child=memory_profiler.after_fork)
+
+
+# -------------------------
+# Fleet view (Redis)
+# -------------------------
+def publish(profile: dict) -> None:
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(WORKERS_KEY, profile["worker"], json.dumps(profile))
+        pipe.expire(WORKERS_KEY, WORKERS_TTL)
+        pipe.execute()
+    except Exception:
+        logger.debug("Memory profile not published", exc_info=True)
+
+
+def load_profiles() -> list[dict]:
+    """
+    Profiles published by every worker, most recently sampled first.
+    """
+    client = redis_client()
+    if client is None:
+        raise RuntimeError("Fleet memory profiles need the Redis shared cache")
+    profiles = [json.loads(value) for value in client.hgetall(WORKERS_KEY).values()]
+    return sorted(profiles, key=lambda profile: max((sample["at"] for sample in profile["recent"]), default=0), reverse=True)
+
+
+def delete_profiles() -> None:
+    client = redis_client()
+    if client is None:
+        raise RuntimeError("Fleet memory profiles need the Redis shared cache")
+    client.delete(WORKERS_KEY)
+
+
+def merge_profiles(profiles: list[dict]) -> dict:
+    """
+    Combine worker profiles: route and site totals add up, maxima take the max.
+    """
+    routes: dict[str, dict] = {}
+    sites: dict[str, dict] = {}
+    for profile in profiles:
+        for route, stats in profile["routes"].items():
+            merged = routes.setdefault(route, {"samples": 0, "peak_total": 0, "peak_max": 0, "net_total": 0, "net_max": 0})
+            merged["samples"] += stats["samples"]
+            merged["peak_total"] += stats["peak_total"]
+            merged["net_total"] += stats["net_total"]
+            merged["peak_max"] = max(merged["peak_max"], stats["peak_max"])
+            merged["net_max"] = max(merged["net_max"], stats["net_max"])
+        for entry in profile["sites"]:
+            merged = sites.setdefault(
+                entry["site"], {"site": entry["site"], "size": 0, "count": 0, "samples": 0, "routes": set()}
+            )
+            merged["size"] += entry["size"]
+            merged["count"] += entry["count"]
+            merged["samples"] += entry["samples"]
+            merged["routes"].update(entry["routes"])
+
+    for stats in routes.values():
+        stats["peak_mean"] = stats["peak_total"] // stats["samples"]
+        stats["net_mean"] = stats["net_total"] // stats["samples"]
+    return {
+        "workers": [
+            {"worker": profile["worker"], "sampled": profile["sampled"], "memory": profile["memory"]} for profile in profiles
+        ],
+        "routes": routes,
+        "sites": [
+            {**site, "routes": sorted(site["routes"])}
+            for site in sorted(sites.values(), key=lambda site: site["size"], reverse=True)
+        ],
+    }
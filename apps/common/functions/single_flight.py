@@ -0,0 +1,206 @@
+from dataclasses import dataclass, field
+import logging
+import math
+import os
+import random
+import threading
+import time
+
+from django.core.cache import caches
+
+from apps.common.deadlines import DeadlineExceeded
+from apps.common.functions.tiered_cache import SHARED_ALIAS, delete_if_value
+from config.django.cache import cache_config
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the per-key distributed recompute lock
+LOCK_SUFFIX = ":compute-lock"
+
+# Backoff bounds (seconds) while waiting for another node's compute
+POLL_MIN_INTERVAL = 0.01
+POLL_MAX_INTERVAL = 0.2
+
+
+@dataclass(slots=True)
+class Entry:
+    # Cached envelope: value plus what early expiration needs
+    value: object
+    soft_expires_at: float  # wall clock; after this the value is stale
+    compute_seconds: float  # how long the last compute took
+
+
+@dataclass(slots=True)
+class Call:
+    # In-flight local compute shared by threads of this worker
+    done: threading.Event = field(default_factory=threading.Event)
+    value: object = None
+    error: BaseException | None = None
+
+
+_calls: dict[str, Call] = {}
+_calls_lock = threading.Lock()
+
+
+def local_single_flight(key: str, compute):
+    """
+    Run `compute()` once per key across the threads of this worker; other
+    threads asking for the same key meanwhile get the same result (or error).
+    """
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = Call()
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.value
+
+    try:
+        call.value = compute()
+        return call.value
+    except BaseException as exc:
+        call.error = exc
+        raise
+    finally:
+        with _calls_lock:
+            _calls.pop(key, None)
+        call.done.set()
+
+
+def should_refresh(entry: Entry, beta: float) -> bool:
+    """
+    Stale, or probabilistically "early stale" (XFetch): the closer to expiry
+    and the slower the compute, the likelier one caller refreshes ahead of time.
+    """
+    now = time.time()
+    if now >= entry.soft_expires_at:
+        return True
+    if beta <= 0 or entry.compute_seconds <= 0:
+        return False
+    return now - entry.compute_seconds * beta * math.log(1.0 - random.random()) >= entry.soft_expires_at
+
+
+def get_or_compute(
+    key: str,
+    compute,
+    soft_ttl: int | None = None,
+    hard_ttl: int | None = None,
+    beta: float | None = None,
+):
+    """
+    Return the cached value for `key`, computing it at most once cluster-wide.
+
+    - Fresh values (younger than `soft_ttl`) are returned directly.
+    - Stale values (until `hard_ttl`, default 2x soft) are still served while
+      the single caller holding the Redis lock recomputes them.
+    - Values are refreshed probabilistically before `soft_ttl` (`beta`).
+    - On a cold miss one thread per worker asks; it either computes under the
+      lock or waits for the node that does (up to COMPUTE_WAIT_TIMEOUT).
+    - Redis failures (raised, or swallowed by IGNORE_EXCEPTIONS) degrade to
+      computing directly, without waiting.
+    """
+    soft_ttl = cache_config.CACHES_TIMEOUT if soft_ttl is None else soft_ttl
+    if soft_ttl <= 0:
+        # A zero timeout would make cache.set() expire the entry immediately
+        raise ValueError("soft_ttl must be a positive number of seconds")
+    hard_ttl = max(hard_ttl or soft_ttl * 2, soft_ttl)
+    beta = cache_config.COMPUTE_EARLY_EXPIRY_BETA if beta is None else beta
+    cache = caches[SHARED_ALIAS]
+
+    try:
+        entry = cache.get(key)
+    except DeadlineExceeded:
+        raise
+    except Exception:
+        logger.warning("Shared cache read failed for %s", key, exc_info=True)
+        return compute()
+
+    if isinstance(entry, Entry):
+        if not should_refresh(entry, beta):
+            return entry.value
+        # Stale-while-revalidate: whoever gets the lock refreshes, everyone else serves stale
+        token = acquire_lock(cache, key)
+        if token is None:
+            return entry.value
+        return local_single_flight(key, lambda: compute_and_store(cache, key, compute, soft_ttl, hard_ttl, token))
+
+    return local_single_flight(key, lambda: fill_miss(cache, key, compute, soft_ttl, hard_ttl))
+
+
+def acquire_lock(cache, key: str) -> str | None:
+    token = os.urandom(16).hex()
+    try:
+        if cache.add(key + LOCK_SUFFIX, token, cache_config.COMPUTE_LOCK_TIMEOUT):
+            return token
+    except Exception:
+        logger.warning("Shared cache lock failed for %s", key, exc_info=True)
+    return None
+
+
+def lock_held(cache, key: str) -> bool:
+    # A failed read counts as "no lock": nobody can be computing through an unreachable cache
+    try:
+        return cache.get(key + LOCK_SUFFIX) is not None
+    except Exception:
+        return False
+
+
+def read_entry(cache, key: str):
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
+
+
+def compute_and_store(cache, key: str, compute, soft_ttl: int, hard_ttl: int, token: str | None):
+    try:
+        started = time.perf_counter()
+        value = compute()
+        elapsed = time.perf_counter() - started
+        try:
+            cache.set(key, Entry(value, time.time() + soft_ttl, elapsed), hard_ttl)
+        except Exception:
+            logger.warning("Shared cache write failed for %s", key, exc_info=True)
+        return value
+    finally:
+        if token is not None:
+            try:
+                delete_if_value(cache, key + LOCK_SUFFIX, token)
+            except Exception:
+                logger.warning("Releasing compute lock failed for %s", key, exc_info=True)
+
+
+def fill_miss(cache, key: str, compute, soft_ttl: int, hard_ttl: int):
+    deadline = time.monotonic() + cache_config.COMPUTE_WAIT_TIMEOUT
+    interval = POLL_MIN_INTERVAL
+    lock_missing = False
+    while True:
+        token = acquire_lock(cache, key)
+        if token is not None:
+            return compute_and_store(cache, key, compute, soft_ttl, hard_ttl, token)
+
+        # add() is also falsy when the cache is unreachable (IGNORE_EXCEPTIONS): only wait on a lock that exists
+        if not lock_held(cache, key):
+            entry = read_entry(cache, key)
+            if isinstance(entry, Entry):
+                return entry.value
+            if lock_missing:
+                # Twice no lock to take nor to wait on: the cache is unavailable
+                return compute_and_store(cache, key, compute, soft_ttl, hard_ttl, None)
+            # The holder may just have released it; try once more
+            lock_missing = True
+            continue
+
+        # Another node is computing: wait for its value rather than piling on the database
+        time.sleep(interval)
+        interval = min(interval * 2, POLL_MAX_INTERVAL)
+        entry = read_entry(cache, key)
+        if isinstance(entry, Entry):
+            return entry.value
+        if time.monotonic() >= deadline:
+            logger.warning("Timed out waiting for %s to be computed elsewhere", key)
+            return compute_and_store(cache, key, compute, soft_ttl, hard_ttl, None)
@@ -0,0 +1,100 @@
+import logging
+
+from django.core.cache import caches
+
+from apps.common.deadlines import DeadlineExceeded
+from config.django.cache import cache_config
+
+logger = logging.getLogger(__name__)
+
+# Cache aliases (see config.django.cache.CacheSettings)
+LOCAL_ALIAS = "local"
+SHARED_ALIAS = "default"
+
+# Sentinel distinguishing "not cached" from a cached None
+MISSING = object()
+
+# Delete a key only while it still holds the caller's value (atomic lock release)
+COMPARE_AND_DELETE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def tiered_get(key: str, default=None):
+    """
+    Read a key from the in-process tier, then from Redis.
+
+    Redis hits are copied into the local tier. Redis failures are logged and
+    treated as misses so callers fall back to the source of truth; a spent
+    request deadline is not a failure and propagates (504).
+    """
+    value = caches[LOCAL_ALIAS].get(key, MISSING)
+    if value is not MISSING:
+        return value
+
+    try:
+        value = caches[SHARED_ALIAS].get(key, MISSING)
+    except DeadlineExceeded:
+        raise
+    except Exception:
+        logger.warning("Shared cache read failed for %s", key, exc_info=True)
+        return default
+
+    if value is MISSING:
+        return default
+
+    caches[LOCAL_ALIAS].set(key, value, cache_config.LOCAL_CACHE_TIMEOUT)
+    return value
+
+
+def tiered_set(key: str, value, timeout: int | None = None) -> None:
+    """
+    Write a key to both tiers.
+
+    The local copy never outlives LOCAL_CACHE_TIMEOUT, which bounds how long
+    other workers can serve a value after it was invalidated.
+    """
+    local_timeout = cache_config.LOCAL_CACHE_TIMEOUT if timeout is None else min(timeout, cache_config.LOCAL_CACHE_TIMEOUT)
+
+    try:
+        caches[SHARED_ALIAS].set(key, value, timeout)
+    except DeadlineExceeded:
+        raise
+    except Exception:
+        logger.warning("Shared cache write failed for %s", key, exc_info=True)
+
+    if local_timeout:
+        caches[LOCAL_ALIAS].set(key, value, local_timeout)
+
+
+def tiered_delete_many(keys: list[str]) -> None:
+    # Local tier first: it can never fail and must not keep serving the value
+    caches[LOCAL_ALIAS].delete_many(keys)
+    try:
+        caches[SHARED_ALIAS].delete_many(keys)
+    except Exception:
+        logger.error("Shared cache invalidation failed for %s", keys, exc_info=True)
+
+
+def tiered_delete(key: str) -> None:
+    tiered_delete_many([key])
+
+
+def delete_if_value(cache, key: str, value) -> bool:
+    """
+    Delete `key` from `cache` only if it still holds `value` (e.g. a lock token).
+
+    Atomic on django-redis; other backends (locmem in development) fall back
+    to get-then-delete.
+    """
+    client = getattr(cache, "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        if cache.get(key) != value:
+            return False
+        return bool(cache.delete(key))
+    # Compared against the stored bytes, encoded the way django-redis stored them
+    raw = client.get_client(write=True)
+    return bool(raw.eval(COMPARE_AND_DELETE_SCRIPT, 1, client.make_key(key), client.encode(value)))
@@ -0,0 +1,154 @@
+"""
+Fast-path liveness/readiness probes.
+
+The wrappers sit outside Django's handler (see config/wsgi.py and
+config/asgi.py): probe requests never reach middleware or URL resolution.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import json
+import logging
+import threading
+import time
+
+from django.core.cache import caches
+from django.db import connections
+
+from config.django.health import health_config
+
+logger = logging.getLogger(__name__)
+
+JSON_HEADERS = [("Content-Type", "application/json"), ("Cache-Control", "no-store")]
+
+
+def check_database() -> None:
+    # Runs on the checker's own thread, so its connection is reused across probes (CONN_MAX_AGE)
+    connection = connections["default"]
+    connection.close_if_unusable_or_obsolete()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def check_cache() -> None:
+    cache = caches["default"]
+    client = getattr(cache, "client", None)
+    if client is not None and hasattr(client, "get_client"):
+        # django-redis: PING over the pooled connection
+        client.get_client().ping()
+    else:
+        cache.get("health:probe")
+
+
+class ReadinessChecker:
+    """
+    Run readiness checks at most once per HEALTH_CACHE_SECONDS.
+
+    Checks run on a single dedicated thread; concurrent probes wait for the
+    in-flight run instead of starting their own.
+    """
+
+    def __init__(self):
+        self.checks: dict = {"database": check_database, "cache": check_cache}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness")
+        self._lock = threading.Lock()
+        self._result: tuple[bool, dict] | None = None
+        self._checked_at = 0.0
+
+    def register(self, name: str, check) -> None:
+        """
+        Add a readiness check; it must raise (or return False) when not ready.
+        """
+        self.checks[name] = check
+
+    def cached(self) -> tuple[bool, dict] | None:
+        if self._result is not None and time.monotonic() - self._checked_at < health_config.HEALTH_CACHE_SECONDS:
+            return self._result
+        return None
+
+    def run_checks(self) -> tuple[bool, dict]:
+        results = {}
+        for name, check in self.checks.items():
+            try:
+                results[name] = "error" if check() is False else "ok"
+            except Exception:
+                logger.warning("Readiness check %s failed", name, exc_info=True)
+                results[name] = "error"
+        return all(status == "ok" for status in results.values()), results
+
+    def readiness(self) -> tuple[bool, dict]:
+        result = self.cached()
+        if result is not None:
+            return result
+
+        with self._lock:
+            result = self.cached()
+            if result is not None:
+                return result
+            try:
+                result = self._executor.submit(self.run_checks).result(timeout=health_config.HEALTH_CHECK_TIMEOUT)
+            except FutureTimeoutError:
+                logger.warning("Readiness checks timed out after %ss", health_config.HEALTH_CHECK_TIMEOUT)
+                result = (False, {"timeout": "error"})
+            self._result, self._checked_at = result, time.monotonic()
+            return result
+
+
+readiness_checker = ReadinessChecker()
+
+
+def probe_response(ready: bool, checks: dict | None) -> tuple[int, bytes]:
+    body = {"status": "ok" if ready else "unavailable"}
+    if checks is not None:
+        body["checks"] = checks
+    return (200 if ready else 503), json.dumps(body).encode()
+
+
+class HealthCheckWSGIMiddleware:
+    """
+    WSGI wrapper answering probe paths before Django's handler.
+    """
+
+    def __init__(self, application):
+        self.application = application
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if path == health_config.HEALTH_LIVENESS_PATH:
+            status, body = probe_response(True, None)
+        elif path == health_config.HEALTH_READINESS_PATH:
+            status, body = probe_response(*readiness_checker.readiness())
+        else:
+            return self.application(environ, start_response)
+
+        start_response(
+            f"{status} {'OK' if status == 200 else 'Service Unavailable'}", [*JSON_HEADERS, ("Content-Length", str(len(body)))]
+        )
+        return [b"" if environ.get("REQUEST_METHOD") == "HEAD" else body]
+
+
+class HealthCheckASGIMiddleware:
+    """
+    ASGI wrapper answering probe paths before Django's handler.
+
+    A fresh cached readiness result is served on the event loop; otherwise
+    the checks run in a thread so the loop never blocks.
+    """
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "") if scope["type"] == "http" else None
+        if path == health_config.HEALTH_LIVENESS_PATH:
+            status, body = probe_response(True, None)
+        elif path == health_config.HEALTH_READINESS_PATH:
+            result = readiness_checker.cached() or await asyncio.to_thread(readiness_checker.readiness)
+            status, body = probe_response(*result)
+        else:
+            return await self.application(scope, receive, send)
+
+        headers = [(name.lower().encode(), value.encode()) for name, value in JSON_HEADERS]
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope.get("method") == "HEAD" else body})
@@ -0,0 +1,309 @@
+"""
+Logging pipeline used by config.django.logging.LoggingSettings.
+
+This module must stay importable before Django apps are loaded
+(logging is configured during django.setup()), so it never imports models.
+"""
+
+import atexit
+import copy
+from datetime import UTC, datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+import weakref
+
+from django.utils.module_loading import import_string
+
+# Attributes present on every LogRecord; anything else was passed via `extra=`
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, including `extra=` fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Per-call-site rate limiting for log storms.
+
+    At most `burst` records per (logger, level, call site, message template)
+    pass per `window` seconds. The first record after a suppressed period
+    reports how many duplicates were dropped in its `suppressed` attribute
+    (a field of JsonFormatter output); the message itself is left alone, as
+    other handlers see the same record. Records below `min_level` are never
+    limited.
+    """
+
+    def __init__(self, window: float = 60.0, burst: int = 10, min_level: str | int = "WARNING", max_keys: int = 10000):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.min_level = logging._checkLevel(min_level)
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> [window_started, passed, suppressed]
+        self._buckets: dict[tuple, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level:
+            return True
+
+        key = (record.name, record.levelno, record.pathname, record.lineno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or now - bucket[0] >= self.window:
+                suppressed = bucket[2] if bucket else 0
+                if len(self._buckets) >= self.max_keys:
+                    self._buckets.clear()
+                self._buckets[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if bucket[1] < self.burst:
+                bucket[1] += 1
+                return True
+            bucket[2] += 1
+            return False
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes and flushes a whole batch at once.
+    """
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if lines:
+            with self.lock:
+                self.stream.write(self.terminator.join(lines) + self.terminator)
+                self.flush()
+
+
+class BatchRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes a whole batch per rollover check.
+    """
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        data = self.terminator.join(lines) + self.terminator
+        with self.lock:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes and self.stream.tell() > 0:
+                self.doRollover()
+            self.stream.write(data)
+            self.stream.flush()
+
+
+class QueueBatchHandler(logging.Handler):
+    """
+    Non-blocking handler: request threads only enqueue records, a background
+    thread drains the queue in batches and writes them to the sink handlers.
+
+    - `sinks` are handler specs ({"class": dotted path, **kwargs}); sinks with
+      `emit_batch()` get one write per batch, others get per-record `handle()`.
+    - The queue is bounded; when full, records are dropped (never blocking the
+      caller) and a drop count is reported once the queue drains.
+    - The worker thread is restarted in forked children and flushed at exit.
+    """
+
+    # Live handlers, restarted after fork / closed at exit by the module-level hooks
+    instances: weakref.WeakSet = weakref.WeakSet()
+
+    def __init__(
+        self,
+        sinks: list[dict],
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+    ):
+        super().__init__()
+        self.sinks = [self.build_sink(spec) for spec in sinks]
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._start()
+        self.instances.add(self)
+
+    @staticmethod
+    def build_sink(spec: dict) -> logging.Handler:
+        spec = dict(spec)
+        handler_class = import_string(spec.pop("class"))
+        level = spec.pop("level", logging.NOTSET)
+        handler = handler_class(**spec)
+        handler.setLevel(level)
+        return handler
+
+    def setFormatter(self, fmt):
+        # dictConfig sets the formatter on this handler; formatting happens in the sinks
+        super().setFormatter(fmt)
+        for sink in self.sinks:
+            sink.setFormatter(fmt)
+
+    def _start(self) -> None:
+        # Fresh queue and lock: in a forked child the parent's may be held by a thread that no longer exists
+        self.queue: queue.Queue = queue.Queue(self.queue_size)
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._worker, name="log-writer", daemon=True)
+        self._thread.start()
+
+    # -------------------------
+    # Caller side
+    # -------------------------
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy of the record with its message and traceback frozen to text.
+
+        Args may be mutated after the call returns; the original record is
+        left intact for the handlers that run after this one.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    # -------------------------
+    # Writer thread
+    # -------------------------
+    def _worker(self) -> None:
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            if record is None:
+                self.queue.task_done()
+                return
+
+            batch = [record]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                batch.append(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": f"Dropped {dropped} log records (queue full)",
+                        }
+                    )
+                )
+
+            try:
+                self.write_batch(batch)
+            finally:
+                # Every queued item, the stop marker included, is done once its batch is written
+                for _ in range(len(batch) - bool(dropped) + stop):
+                    self.queue.task_done()
+            if stop:
+                return
+
+    def write_batch(self, batch: list[logging.LogRecord]) -> None:
+        for sink in self.sinks:
+            records = [record for record in batch if record.levelno >= sink.level]
+            if not records:
+                continue
+            if hasattr(sink, "emit_batch"):
+                sink.emit_batch(records)
+            else:
+                for record in records:
+                    sink.handle(record)
+
+    def flush(self) -> None:
+        # Best effort: wait until the writer has written everything queued so far (not just dequeued it)
+        deadline = time.monotonic() + 5
+        while self.queue.unfinished_tasks and self._thread.is_alive() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        self.instances.discard(self)
+        if self._thread.is_alive():
+            try:
+                self.queue.put(None, timeout=1)
+            except queue.Full:
+                pass
+            self._thread.join(timeout=5)
+        for sink in self.sinks:
+            sink.close()
+        super().close()
+
+
+def _restart_writers() -> None:
+    for handler in list(QueueBatchHandler.instances):
+        handler._start()
+
+
+def _close_writers() -> None:
+    for handler in list(QueueBatchHandler.instances):
+        handler.close()
+
+
+# Registered once for the class, not per handler (dictConfig may build several)
+os.register_at_fork(after_in_child=_restart_writers)
+atexit.register(_close_writers)
@@ -0,0 +1,99 @@
+import json
+import os
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_databases, teardown_databases
+
+from apps.common.benchmarks.http import run_asgi, run_wsgi
+from apps.common.benchmarks.stats import compare_to_baseline, load_baseline, save_baseline
+
+# Synthetic endpoints served by apps.common.benchmarks.endpoints
+SCENARIOS = {
+    "empty": "/__benchmark__/empty/",
+    "authenticated": "/__benchmark__/authenticated/",
+    "throttled": "/__benchmark__/throttled/",
+    "paginated": "/__benchmark__/paginated/?limit=50&offset=100",
+    "large_json": "/__benchmark__/large-json/",
+}
+
+# Metrics checked against the baseline
+COMPARED_METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+# Default baseline location (relative to BASE_DIR)
+DEFAULT_BASELINE = "benchmarks/http.json"
+
+
+class Command(BaseCommand):
+    help = "Benchmark the full middleware/DRF stack in-process over ASGI and WSGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per scenario and interface")
+        parser.add_argument("--concurrency", type=int, default=10, help="In-flight requests")
+        parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Run only these scenarios")
+        parser.add_argument("--interface", action="append", choices=["asgi", "wsgi"], help="Run only these interfaces")
+        parser.add_argument("--baseline", default=str(settings.BASE_DIR / DEFAULT_BASELINE), help="Baseline JSON path")
+        parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+        parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression ratio (0.10 = 10%%)")
+        parser.add_argument("--locmem-cache", action="store_true", help="Use in-memory caches instead of Redis")
+
+    def handle(self, *args, **options):
+        # Baselines are machine-specific and not committed: without one there is nothing to gate against
+        if not options["save_baseline"] and not os.path.exists(options["baseline"]):
+            raise CommandError(f"No baseline at {options['baseline']}; record one on this machine with --save-baseline")
+
+        host = next((host for host in settings.ALLOWED_HOSTS if host != "*"), "localhost")
+        overrides = {
+            "ROOT_URLCONF": "apps.common.benchmarks.endpoints",
+            "DEBUG": False,
+            "ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, host],
+        }
+        if options["locmem_cache"]:
+            overrides["CACHES"] = {
+                alias: {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": f"benchmark-{alias}"}
+                for alias in settings.CACHES
+            }
+
+        # Isolated test database so the benchmark never touches real data
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            with override_settings(**overrides):
+                results = self.run_scenarios(options, host)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+        if options["save_baseline"]:
+            save_baseline(options["baseline"], results)
+            self.stderr.write(f"Baseline saved to {options['baseline']}")
+            return
+
+        regressions = compare_to_baseline(results, load_baseline(options["baseline"]), options["tolerance"], COMPARED_METRICS)
+        if regressions:
+            raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+
+    def run_scenarios(self, options, host: str) -> dict:
+        from rest_framework.authtoken.models import Token
+
+        from config.asgi import application as asgi_application
+        from config.wsgi import application as wsgi_application
+
+        user = get_user_model().objects.create_user(username="benchmark", password=None)
+        token = Token.objects.create(user=user)
+
+        drivers = {"asgi": (run_asgi, asgi_application), "wsgi": (run_wsgi, wsgi_application)}
+
+        results = {}
+        for interface in options["interface"] or sorted(drivers):
+            driver, application = drivers[interface]
+            for scenario in options["scenario"] or SCENARIOS:
+                headers = {"Authorization": f"Token {token.key}"} if scenario == "authenticated" else {}
+                # Warm-up: imports, URL resolver, connection setup
+                driver(application, SCENARIOS[scenario], host, headers, min(20, options["requests"]), 1)
+                results[f"{interface}.{scenario}"] = driver(
+                    application, SCENARIOS[scenario], host, headers, options["requests"], options["concurrency"]
+                )
+                self.stderr.write(f"{interface}.{scenario}: {results[f'{interface}.{scenario}']['throughput_rps']} req/s")
+        return results
@@ -0,0 +1,79 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.functions.compression import BROTLI, GZIP, ZSTD, available_encodings, compress_bytes
+
+# Levels compared per encoding (fast ... max ratio)
+LEVELS = {
+    ZSTD: (1, 3, 6, 12, 19),
+    BROTLI: (1, 4, 6, 9, 11),
+    GZIP: (1, 4, 6, 9),
+}
+
+# Fixed seed keeps payloads comparable across runs
+SEED = 20260101
+
+
+class Command(BaseCommand):
+    help = "Report compression ratio vs CPU time per encoding and level for a representative JSON payload."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Rows in the generated JSON list payload")
+        parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to spend per measurement")
+
+    def handle(self, *args, **options):
+        payload = self.build_payload(options["rows"])
+        self.stderr.write(f"Payload: {len(payload)} bytes; encodings available: {sorted(available_encodings())}")
+
+        results = {}
+        for encoding in (ZSTD, BROTLI, GZIP):
+            if encoding not in available_encodings():
+                continue
+            for level in LEVELS[encoding]:
+                results[f"{encoding}-{level}"] = self.measure(payload, encoding, level, options["min_time"])
+                self.stderr.write(f"{encoding}-{level}: {results[f'{encoding}-{level}']}")
+
+        self.stdout.write(json.dumps({"payload_bytes": len(payload), "results": results}, indent=2))
+
+    @staticmethod
+    def build_payload(rows: int) -> bytes:
+        rng = random.Random(SEED)
+        words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+        return json.dumps(
+            {
+                "count": rows,
+                "results": [
+                    {
+                        "id": index,
+                        "name": " ".join(rng.choices(words, k=3)),
+                        "email": f"user{index}@example.com",
+                        "score": round(rng.random() * 100, 2),
+                        "active": rng.random() > 0.2,
+                        "created_at": f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00Z",
+                    }
+                    for index in range(rows)
+                ],
+            }
+        ).encode()
+
+    @staticmethod
+    def measure(payload: bytes, encoding: str, level: int, min_time: float) -> dict:
+        compressed = compress_bytes(payload, encoding, level)
+        iterations = 0
+        started = time.perf_counter()
+        while True:
+            compress_bytes(payload, encoding, level)
+            iterations += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        per_call = elapsed / iterations
+        return {
+            "bytes": len(compressed),
+            "ratio": round(len(payload) / len(compressed), 2),
+            "ms_per_response": round(per_call * 1000, 3),
+            "mb_per_sec": round(len(payload) / per_call / 1e6, 1),
+        }
@@ -0,0 +1,63 @@
+import json
+import os
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_databases, teardown_databases
+
+from apps.common.benchmarks.library import build_cases
+from apps.common.benchmarks.micro import measure
+from apps.common.benchmarks.stats import compare_to_baseline, load_baseline, save_baseline
+
+# Metrics checked against the baseline
+COMPARED_METRICS = ("ns_per_op", "peak_bytes_per_op")
+
+# Default baseline location (relative to BASE_DIR)
+DEFAULT_BASELINE = "benchmarks/library.json"
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark _library.functions helpers and gate regressions against a baseline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--case", action="append", help="Run only cases starting with this prefix")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is kept)")
+        parser.add_argument("--baseline", default=str(settings.BASE_DIR / DEFAULT_BASELINE), help="Baseline JSON path")
+        parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+        parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed regression ratio (0.15 = 15%%)")
+
+    def handle(self, *args, **options):
+        # Baselines are machine-specific and not committed: without one there is nothing to gate against
+        if not options["save_baseline"] and not os.path.exists(options["baseline"]):
+            raise CommandError(f"No baseline at {options['baseline']}; record one on this machine with --save-baseline")
+
+        # validate_foreign_key needs rows to hit; use an isolated test database
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            UserModel = get_user_model()
+            UserModel.objects.bulk_create(UserModel(username=f"benchmark-{index}") for index in range(50))
+            results = self.run_cases(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+        if options["save_baseline"]:
+            save_baseline(options["baseline"], results)
+            self.stderr.write(f"Baseline saved to {options['baseline']}")
+            return
+
+        regressions = compare_to_baseline(results, load_baseline(options["baseline"]), options["tolerance"], COMPARED_METRICS)
+        if regressions:
+            raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+
+    def run_cases(self, options) -> dict:
+        prefixes = tuple(options["case"] or ())
+        results = {}
+        for name, (func, inputs) in build_cases().items():
+            if prefixes and not name.startswith(prefixes):
+                continue
+            results[name] = measure(func, inputs, repeat=options["repeat"])
+            self.stderr.write(f"{name}: {results[name]['ns_per_op']} ns/op")
+        return results
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.benchmarks.stats import summarize_latencies
+from apps.common.logging_handlers import JsonFormatter, QueueBatchHandler
+
+
+class Command(BaseCommand):
+    help = "Benchmark log throughput and caller latency with and without the queued pipeline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--records", type=int, default=20000, help="Records per thread")
+        parser.add_argument("--threads", type=int, default=8, help="Concurrent logging threads")
+        parser.add_argument("--format", choices=["json", "verbose"], default="json", help="Formatter to use")
+
+    def handle(self, *args, **options):
+        formatter = (
+            JsonFormatter()
+            if options["format"] == "json"
+            else logging.Formatter("{levelname} {asctime} [{module}:{lineno}] {message}", style="{")
+        )
+
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            # Synchronous baseline: formatting + write + flush on the caller thread
+            with open(os.path.join(directory, "sync.log"), "w") as stream:
+                handler = logging.StreamHandler(stream)
+                handler.setFormatter(formatter)
+                results["sync_stream"] = self.run(handler, options)
+                handler.close()
+
+            # Queued pipeline: caller only enqueues, writer thread batches
+            with open(os.path.join(directory, "queued.log"), "w") as stream:
+                handler = QueueBatchHandler(
+                    sinks=[{"class": "apps.common.logging_handlers.BatchStreamHandler", "stream": stream}],
+                    queue_size=options["records"] * options["threads"],
+                )
+                handler.setFormatter(formatter)
+                results["queued_batch"] = self.run(handler, options, drain=handler)
+                handler.close()
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def run(self, handler: logging.Handler, options, drain: QueueBatchHandler | None = None) -> dict:
+        logger = logging.Logger("benchmark.logging", level=logging.DEBUG)
+        logger.addHandler(handler)
+
+        def worker(index):
+            latencies = []
+            for number in range(options["records"]):
+                started = time.perf_counter()
+                logger.info("request %s handled in %sms", number, index, extra={"path": "/api/items/"})
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            latencies = [latency for chunk in executor.map(worker, range(options["threads"])) for latency in chunk]
+        caller_elapsed = time.perf_counter() - started
+
+        # Include the time needed to get every record onto disk
+        if drain is not None:
+            drain.flush()
+        total_elapsed = time.perf_counter() - started
+
+        summary = summarize_latencies(latencies, caller_elapsed)
+        summary["durable_records_per_sec"] = round(len(latencies) / total_elapsed, 2)
+        if drain is not None:
+            summary["dropped"] = drain.dropped
+        return summary
@@ -0,0 +1,109 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_databases, teardown_databases
+from rest_framework import serializers
+
+from apps.common.benchmarks.micro import measure
+from apps.common.serializers import FastModelSerializer
+
+UserModel = get_user_model()
+
+# Fields serialized by both implementations (plain, datetime, nullable, FK-style PK list)
+FIELDS = ["id", "username", "email", "first_name", "is_active", "is_staff", "date_joined", "last_login", "groups"]
+
+
+class GroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Group
+        fields = ["id", "name"]
+
+
+class FastGroupSerializer(FastModelSerializer):
+    class Meta:
+        model = Group
+        fields = ["id", "name"]
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserModel
+        fields = FIELDS
+
+
+class FastUserSerializer(FastModelSerializer):
+    class Meta:
+        model = UserModel
+        fields = FIELDS
+
+
+class NestedUserSerializer(serializers.ModelSerializer):
+    groups = GroupSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = UserModel
+        fields = FIELDS
+
+
+class FastNestedUserSerializer(FastModelSerializer):
+    groups = FastGroupSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = UserModel
+        fields = FIELDS
+
+
+class Command(BaseCommand):
+    help = "Benchmark FastModelSerializer against ModelSerializer on a list of model instances."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--objects", type=int, default=10000, help="Instances serialized per run")
+        parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (best is kept)")
+
+    def handle(self, *args, **options):
+        # Serialization only: rows are fetched (with prefetched groups) once, before timing
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            users = self.build_users(options["objects"])
+            results = {}
+            for name, standard, fast in (
+                ("flat", UserSerializer, FastUserSerializer),
+                ("nested", NestedUserSerializer, FastNestedUserSerializer),
+            ):
+                if standard(users, many=True).data != fast(users, many=True).data:
+                    raise CommandError(f"{name}: FastModelSerializer output differs from ModelSerializer")
+                results[name] = {
+                    "model_serializer": self.run(standard, users, options["repeat"]),
+                    "fast_serializer": self.run(fast, users, options["repeat"]),
+                }
+                results[name]["speedup"] = round(
+                    results[name]["model_serializer"]["ms_per_list"] / results[name]["fast_serializer"]["ms_per_list"], 2
+                )
+                self.stderr.write(f"{name}: {results[name]['speedup']}x")
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps({"objects": options["objects"], "results": results}, indent=2))
+
+    @staticmethod
+    def build_users(count: int) -> list:
+        groups = Group.objects.bulk_create(Group(name=f"group-{index}") for index in range(5))
+        UserModel.objects.bulk_create(
+            UserModel(
+                username=f"user-{index}", email=f"user{index}@example.com", first_name=f"First {index}", is_staff=index % 7 == 0
+            )
+            for index in range(count)
+        )
+        users = list(UserModel.objects.order_by("pk"))
+        Membership = UserModel.groups.through
+        Membership.objects.bulk_create(
+            Membership(user_id=user.pk, group_id=groups[index % len(groups)].pk) for index, user in enumerate(users) if index % 3
+        )
+        return list(UserModel.objects.order_by("pk").prefetch_related("groups"))
+
+    @staticmethod
+    def run(serializer_class, users: list, repeat: int) -> dict:
+        result = measure(lambda: serializer_class(users, many=True).data, [()], repeat=repeat, min_time=0.1)
+        return {"ms_per_list": round(result["ns_per_op"] / 1e6, 2), "peak_bytes_per_list": result["peak_bytes_per_op"]}
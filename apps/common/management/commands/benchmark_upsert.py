@@ -0,0 +1,87 @@
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import setup_databases, teardown_databases
+
+from apps.common.functions.bulk_upsert import UpsertStrategyChoices
+from apps.common.models import BulkUpsertQuerySet
+
+# Columns rewritten by the update phase
+UPDATE_FIELDS = ["first_name", "last_name", "email"]
+
+
+class Command(BaseCommand):
+    help = "Benchmark bulk_upsert() strategies (rows/s for inserts and updates) against a save() loop."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20000, help="Rows per bulk strategy")
+        parser.add_argument("--loop-rows", type=int, default=2000, help="Rows for the save() loop baseline")
+        parser.add_argument("--batch-size", type=int, default=None, help="Override BULK_UPSERT_BATCH_SIZE")
+
+    def handle(self, *args, **options):
+        # Runs against an isolated test database on the configured backend
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            results = {"save_loop": self.run_save_loop(options["loop_rows"])}
+            strategies = [UpsertStrategyChoices.BULK_CREATE]
+            if connection.vendor == "postgresql":
+                strategies.append(UpsertStrategyChoices.COPY)
+            for strategy in strategies:
+                results[strategy.value] = self.run_strategy(strategy, options["rows"], options["batch_size"])
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps({"vendor": connection.vendor, "results": results}, indent=2))
+
+    @staticmethod
+    def build_users(rows: int, suffix: str) -> list:
+        UserModel = get_user_model()
+        return [
+            UserModel(
+                username=f"upsert-{index}",
+                first_name=f"first-{suffix}",
+                last_name=f"last-{suffix}",
+                email=f"{index}@{suffix}.test",
+            )
+            for index in range(rows)
+        ]
+
+    @staticmethod
+    def rate(rows: int, elapsed: float) -> dict:
+        return {"rows": rows, "seconds": round(elapsed, 4), "rows_per_sec": round(rows / elapsed, 1) if elapsed else None}
+
+    def run_save_loop(self, rows: int) -> dict:
+        UserModel = get_user_model()
+        results = {}
+        for phase, suffix in (("insert", "a"), ("update", "b")):
+            users = self.build_users(rows, suffix)
+            started = time.perf_counter()
+            with transaction.atomic():
+                for user in users:
+                    UserModel.objects.update_or_create(
+                        username=user.username, defaults={name: getattr(user, name) for name in UPDATE_FIELDS}
+                    )
+            results[phase] = self.rate(rows, time.perf_counter() - started)
+        UserModel.objects.all().delete()
+        self.stderr.write(f"save_loop: {results}")
+        return results
+
+    def run_strategy(self, strategy: UpsertStrategyChoices, rows: int, batch_size: int | None) -> dict:
+        UserModel = get_user_model()
+        queryset = BulkUpsertQuerySet(UserModel)
+        results = {}
+        for phase, suffix in (("insert", "a"), ("update", "b")):
+            users = self.build_users(rows, suffix)
+            started = time.perf_counter()
+            counts = queryset.bulk_upsert(users, ["username"], UPDATE_FIELDS, batch_size=batch_size, strategy=strategy)
+            results[phase] = {
+                **self.rate(rows, time.perf_counter() - started),
+                "created": counts.created,
+                "updated": counts.updated,
+            }
+        UserModel.objects.all().delete()
+        self.stderr.write(f"{strategy.value}: {results}")
+        return results
@@ -0,0 +1,80 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.functions.memory_profile import delete_profiles, load_profiles, merge_profiles
+
+# Sort keys accepted by --order
+ORDERINGS = ("peak_mean", "peak_max", "net_mean", "net_max", "samples")
+
+
+def human_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+class Command(BaseCommand):
+    help = "Report sampled per-route memory use and allocation hot spots published by the workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--worker", help="Only this worker (host:pid) instead of the merged fleet view")
+        parser.add_argument("--limit", type=int, default=20, help="Routes and sites to show")
+        parser.add_argument("--order", choices=ORDERINGS, default="peak_mean", help="Route sort key (default: mean peak)")
+        parser.add_argument("--json", action="store_true", help="Emit JSON instead of text")
+        parser.add_argument("--reset", action="store_true", help="Delete all published profiles and exit")
+
+    def handle(self, *args, **options):
+        try:
+            if options["reset"]:
+                delete_profiles()
+                self.stdout.write("Removed published memory profiles")
+                return
+            profiles = load_profiles()
+        except RuntimeError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["worker"]:
+            profiles = [profile for profile in profiles if profile["worker"] == options["worker"]]
+            if not profiles:
+                raise CommandError(f"No profile published by {options['worker']}")
+        report = merge_profiles(profiles)
+        limit = options["limit"]
+        report["routes"] = dict(
+            sorted(report["routes"].items(), key=lambda item: item[1][options["order"]], reverse=True)[:limit]
+        )
+        report["sites"] = report["sites"][:limit]
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        if not report["workers"]:
+            self.stdout.write("No memory profiles published (is MEMORY_PROFILING_ENABLED set?)")
+            return
+        self.write_report(report)
+
+    def write_report(self, report: dict) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING("Workers"))
+        for worker in report["workers"]:
+            memory = worker["memory"] or {}
+            resident = " ".join(
+                f"{key.removesuffix('_kb')}={human_size(memory[key] * 1024)}"
+                for key in ("rss_kb", "pss_kb", "private_kb")
+                if memory.get(key) is not None
+            )
+            self.stdout.write(f"  {worker['worker']}  sampled={worker['sampled']}  {resident}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Routes"))
+        for route, stats in report["routes"].items():
+            self.stdout.write(
+                f"  {route}  samples={stats['samples']}"
+                f" peak={human_size(stats['peak_mean'])} (max {human_size(stats['peak_max'])})"
+                f" net={human_size(stats['net_mean'])} (max {human_size(stats['net_max'])})"
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Allocation sites (retained at request end)"))
+        for site in report["sites"]:
+            self.stdout.write(f"  {human_size(site['size'])}  {site['count']} blocks  {site['samples']} samples  {site['site']}")
+            self.stdout.write(f"    routes: {', '.join(site['routes'])}")
@@ -0,0 +1,90 @@
+from datetime import UTC, datetime
+import json
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.functions.bulkhead import redis_client
+from apps.common.scheduler import JobError, autodiscover, select_jobs
+from apps.common.scheduler.engine import STATUS_OK, Scheduler
+from apps.common.scheduler.store import SchedulerStore
+
+
+def iso(timestamp) -> str:
+    return datetime.fromtimestamp(float(timestamp), UTC).isoformat(timespec="seconds") if timestamp not in (None, "") else "-"
+
+
+class Command(BaseCommand):
+    help = "Run the cluster-wide periodic job scheduler (one leader dispatches, other nodes stand by)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", action="append", help="Schedule only this job (repeatable)")
+        parser.add_argument("--list", action="store_true", help="Show jobs with their next and last runs, then exit")
+        parser.add_argument("--run", metavar="JOB", help="Run one job now on this node (still never overlapping) and exit")
+        parser.add_argument("--history", metavar="JOB", help="Show the recorded runs of one job and exit")
+        parser.add_argument("--json", action="store_true", help="Emit JSON with --list / --history")
+
+    def handle(self, *args, **options):
+        autodiscover()
+        client = redis_client()
+        if client is None:
+            raise CommandError("The scheduler needs the Redis shared cache")
+        store = SchedulerStore(client)
+        try:
+            jobs = select_jobs([options["run"]] if options["run"] else options["job"])
+        except JobError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["history"]:
+            self.write_history(store.history(options["history"]), options["json"])
+            return
+        if options["list"]:
+            self.list_jobs(store, jobs, options["json"])
+            return
+
+        scheduler = Scheduler(jobs, store)
+        if options["run"]:
+            run = scheduler.execute(jobs[0], None)
+            self.stdout.write(json.dumps(run))
+            if run["status"] != STATUS_OK:
+                raise CommandError(f"{jobs[0].name}: {run['status']} {run['error']}".rstrip())
+            return
+
+        # Finish running jobs and hand leadership over on shutdown
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: scheduler.stop())
+        self.stdout.write(f"Scheduler {scheduler.node} running {len(jobs)} jobs")
+        scheduler.run()
+
+    def list_jobs(self, store: SchedulerStore, jobs: list, as_json: bool) -> None:
+        now = datetime.now(UTC).timestamp()
+        rows = [
+            {
+                "name": job.name,
+                "schedule": job.schedule.expression,
+                "jitter": job.jitter,
+                "next_run": job.schedule.next_after(now),
+                **store.metrics(job.name),
+            }
+            for job in jobs
+        ]
+        if as_json:
+            self.stdout.write(json.dumps({"leader": store.leader(), "jobs": rows}, indent=2))
+            return
+        self.stdout.write(f"Leader: {store.leader() or '-'}")
+        for row in rows:
+            last = (
+                f"last {row['last_status']} at {iso(row['last_started'])} in {float(row['last_duration']):.2f}s"
+                f" on {row['last_node']} ({row['runs']} runs)"
+                if "last_status" in row
+                else "never run"
+            )
+            self.stdout.write(f"{row['name']}  [{row['schedule']}]  next {iso(row['next_run'])}  {last}")
+
+    def write_history(self, runs: list[dict], as_json: bool) -> None:
+        if as_json:
+            self.stdout.write(json.dumps(runs, indent=2))
+            return
+        for run in runs:
+            line = f"{iso(run['started'])}  {run['status']:<7}  {run['duration']:.2f}s  {run['node']}  {run['error']}"
+            self.stdout.write(line.rstrip())
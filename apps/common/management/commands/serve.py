@@ -0,0 +1,119 @@
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.server.memory import memory_report
+from apps.common.server.preload import preload
+from apps.common.server.resources import available_cpus, default_workers
+from config.django.server import ServerChoices, WorkerClassChoices, server_config
+
+# Gunicorn worker class per worker model
+WORKER_CLASSES = {
+    WorkerClassChoices.SYNC: "sync",
+    WorkerClassChoices.GTHREAD: "gthread",
+    WorkerClassChoices.UVICORN: "apps.common.server.uvicorn_worker.DjangoUvicornWorker",
+}
+
+
+class Command(BaseCommand):
+    help = "Serve the project in production: preloaded app, gc.freeze() before fork, recycled workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--server", choices=[choice.value for choice in ServerChoices], default=server_config.SERVER.value)
+        parser.add_argument(
+            "--worker-class",
+            choices=[choice.value for choice in WorkerClassChoices],
+            default=server_config.SERVER_WORKER_CLASS.value,
+        )
+        parser.add_argument("--bind", default=server_config.SERVER_BIND, help="host:port or unix:/path")
+        parser.add_argument("--workers", type=int, default=server_config.SERVER_WORKERS, help="0 = from available CPUs")
+        parser.add_argument("--threads", type=int, default=server_config.SERVER_THREADS, help="Threads per gthread worker")
+        parser.add_argument("--max-requests", type=int, default=server_config.SERVER_MAX_REQUESTS)
+        parser.add_argument("--max-requests-jitter", type=int, default=server_config.SERVER_MAX_REQUESTS_JITTER)
+        parser.add_argument("--pidfile", default=server_config.SERVER_PIDFILE)
+        parser.add_argument("--dry-run", action="store_true", help="Print the resolved configuration and exit")
+        parser.add_argument(
+            "--memory", action="store_true", help="Print RSS/PSS of a running server (--pid or --pidfile) and exit"
+        )
+        parser.add_argument("--pid", type=int, help="Master PID for --memory")
+
+    def handle(self, *args, **options):
+        if options["memory"]:
+            self.print_memory(options)
+            return
+
+        server = ServerChoices(options["server"])
+        worker_class = WorkerClassChoices(options["worker_class"])
+        asgi = server == ServerChoices.UVICORN or worker_class == WorkerClassChoices.UVICORN
+        cpus = available_cpus()
+        workers = options["workers"] or default_workers(worker_class, cpus)
+        if server == ServerChoices.UVICORN:
+            workers = 1
+
+        config = {
+            "server": server.value,
+            "interface": "asgi" if asgi else "wsgi",
+            "bind": options["bind"],
+            "cpus": cpus,
+            "workers": workers,
+            "max_requests": options["max_requests"],
+            "max_requests_jitter": options["max_requests_jitter"],
+        }
+        if server == ServerChoices.GUNICORN:
+            config["worker_class"] = worker_class.value
+            if worker_class == WorkerClassChoices.GTHREAD:
+                config["threads"] = options["threads"]
+        if options["dry_run"]:
+            self.stdout.write(json.dumps(config, indent=2))
+            return
+
+        # Import the server before preloading so a missing package fails fast
+        try:
+            if server == ServerChoices.GUNICORN:
+                from apps.common.server.gunicorn_app import run_gunicorn
+            else:
+                from apps.common.server.uvicorn_app import run_uvicorn
+        except ImportError as exc:
+            raise CommandError(f"{server.value} is not installed ({exc})") from exc
+
+        application = preload(asgi)
+        self.stderr.write(f"Serving {json.dumps(config)}")
+        if server == ServerChoices.UVICORN:
+            run_uvicorn(
+                application,
+                options["bind"],
+                server_config.SERVER_KEEPALIVE,
+                options["max_requests"],
+                options["max_requests_jitter"],
+            )
+            return
+
+        gunicorn_options = {
+            "bind": [options["bind"]],
+            "workers": workers,
+            "worker_class": WORKER_CLASSES[worker_class],
+            "max_requests": options["max_requests"],
+            "max_requests_jitter": options["max_requests_jitter"],
+            "timeout": server_config.SERVER_TIMEOUT,
+            "graceful_timeout": server_config.SERVER_GRACEFUL_TIMEOUT,
+            "keepalive": server_config.SERVER_KEEPALIVE,
+            "pidfile": options["pidfile"] or None,
+        }
+        if worker_class == WorkerClassChoices.GTHREAD:
+            gunicorn_options["threads"] = options["threads"]
+        run_gunicorn(application, gunicorn_options)
+
+    def print_memory(self, options) -> None:
+        pid = options["pid"]
+        if pid is None:
+            if not options["pidfile"]:
+                raise CommandError("--memory needs --pid or a pidfile (--pidfile / SERVER_PIDFILE)")
+            try:
+                pid = int(Path(options["pidfile"]).read_text().strip())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read pidfile {options['pidfile']}: {exc}") from exc
+        if not os.path.exists(f"/proc/{pid}"):
+            raise CommandError(f"No process {pid} (or /proc is not available)")
+        self.stdout.write(json.dumps(memory_report(pid), indent=2))
@@ -0,0 +1,69 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.common.slow_queries.advisor import suggest_indexes
+from apps.common.slow_queries.stats import load_stats, reset_stats
+
+# Sort keys accepted by --order
+ORDERINGS = ("total_ms", "count", "mean_ms", "p95_ms", "max_ms", "slow")
+
+# Characters of normalized SQL / plan shown per entry in text output
+SQL_PREVIEW = 300
+PLAN_PREVIEW_LINES = 8
+
+
+class Command(BaseCommand):
+    help = "Report the fleet's heaviest queries (by fingerprint) with captured plans and candidate indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=20, help="Fingerprints to show")
+        parser.add_argument("--order", choices=ORDERINGS, default="total_ms", help="Sort key (default: total time)")
+        parser.add_argument("--database", default="default", help="Connection used to introspect existing indexes")
+        parser.add_argument("--no-suggest", action="store_true", help="Skip index suggestions")
+        parser.add_argument("--json", action="store_true", help="Emit JSON instead of text")
+        parser.add_argument("--reset", action="store_true", help="Delete all collected statistics and exit")
+
+    def handle(self, *args, **options):
+        try:
+            if options["reset"]:
+                self.stdout.write(f"Removed {reset_stats()} keys")
+                return
+            # Ranking by total time comes from Redis; other orders need every fingerprint
+            stats = load_stats(options["limit"] if options["order"] == "total_ms" else None)
+        except RuntimeError as exc:
+            raise CommandError(str(exc)) from exc
+
+        stats = sorted(stats, key=lambda entry: entry[options["order"]], reverse=True)[: options["limit"]]
+        if not options["no_suggest"]:
+            connection = connections[options["database"]]
+            for entry in stats:
+                if entry["vendor"] == connection.vendor:
+                    plan = entry["plan"]["plan"] if entry["plan"] else None
+                    entry["suggestions"] = suggest_indexes(connection, entry["sql"], plan)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+        if not stats:
+            self.stdout.write("No query statistics collected (is SLOW_QUERY_LOG_ENABLED set?)")
+            return
+        for position, entry in enumerate(stats, 1):
+            self.write_entry(position, entry)
+
+    def write_entry(self, position: int, entry: dict) -> None:
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"#{position} {entry['fingerprint']}")
+            + f"  calls={entry['count']} slow={entry['slow']} total={entry['total_ms']:.1f}ms"
+            f" mean={entry['mean_ms']:.2f}ms p95≤{entry['p95_ms']:.1f}ms max={entry['max_ms']:.1f}ms"
+        )
+        sql = entry["sql"]
+        self.stdout.write(f"  {sql[:SQL_PREVIEW]}{'…' if len(sql) > SQL_PREVIEW else ''}")
+        if entry["plan"]:
+            self.stdout.write(f"  plan ({entry['plan']['duration_ms']:.1f}ms sample):")
+            for line in entry["plan"]["plan"].splitlines()[:PLAN_PREVIEW_LINES]:
+                self.stdout.write(f"    {line}")
+        for suggestion in entry.get("suggestions", ()):
+            self.stdout.write(self.style.SUCCESS(f"  suggest: {suggestion['statement']}") + f"  ({suggestion['reason']})")
+        self.stdout.write("")
@@ -0,0 +1,121 @@
+from dataclasses import asdict
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.cache_warming import WarmerError, autodiscover, select_warmers
+from apps.common.cache_warming.runner import STATUS_OK, WarmResult, run_warmers
+from apps.common.cache_warming.state import acquire_lock, clear_warm, mark_warm, release_lock, warm_state
+from config.django.cache_warming import cache_warming_config
+
+# Seconds between checks while another node is warming
+WAIT_INTERVAL = 1.0
+
+
+class Command(BaseCommand):
+    help = "Fill the shared cache by running the declared cache warmers, then mark it warm for readiness."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--warmer", action="append", help="Run only this warmer (repeatable; does not mark the cache warm)")
+        parser.add_argument(
+            "--tag", action="append", help="Run only warmers with this tag (repeatable; does not mark the cache warm)"
+        )
+        parser.add_argument("--workers", type=int, default=cache_warming_config.CACHE_WARMING_WORKERS, help="Concurrent warmers")
+        parser.add_argument(
+            "--timeout", type=float, default=cache_warming_config.CACHE_WARMING_TIMEOUT, help="Time budget in seconds"
+        )
+        parser.add_argument("--if-cold", action="store_true", help="Do nothing when the cache is already marked warm")
+        parser.add_argument("--list", action="store_true", help="List the selected warmers and exit")
+        parser.add_argument("--reset", action="store_true", help="Remove the warm marker and exit")
+        parser.add_argument("--json", action="store_true", help="Emit the results as JSON")
+
+    def handle(self, *args, **options):
+        autodiscover()
+        try:
+            warmers = select_warmers(options["warmer"], options["tag"])
+        except WarmerError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["list"]:
+            for entry in warmers:
+                flags = ", ".join([*sorted(entry.tags), *([] if entry.required else ["optional"])])
+                self.stdout.write(f"{entry.priority:>5}  {entry.name}{f'  ({flags})' if flags else ''}")
+            return
+        if options["reset"]:
+            clear_warm()
+            self.stdout.write("Cache marked cold")
+            return
+
+        # Only a run of every warmer makes the cache warm
+        full_run = not options["warmer"] and not options["tag"]
+        if full_run and options["if_cold"] and warm_state() is not None:
+            self.stdout.write("Cache already warm")
+            return
+        token = acquire_lock(options["timeout"]) if full_run else None
+        if full_run and token is None:
+            token = self.wait_for_other_node(options["timeout"])
+            if token is None:
+                self.stdout.write("Cache warmed by another node")
+                return
+
+        started = time.perf_counter()
+        try:
+            results = run_warmers(warmers, options["workers"], options["timeout"], self.progress(len(warmers), options["json"]))
+            duration = time.perf_counter() - started
+            failed = [result for result in results if result.status != STATUS_OK and result.required]
+            if full_run and not failed:
+                mark_warm(duration, len(results))
+        finally:
+            if token is not None:
+                release_lock(token)
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {"duration": duration, "warm": full_run and not failed, "results": [asdict(result) for result in results]},
+                    indent=2,
+                )
+            )
+        else:
+            warmed = sum(result.status == STATUS_OK for result in results)
+            self.stdout.write(f"{warmed}/{len(results)} warmers succeeded in {duration:.2f}s")
+        if failed:
+            raise CommandError(f"Required cache warmers did not succeed: {', '.join(result.name for result in failed)}")
+
+    def progress(self, total: int, quiet: bool):
+        done = 0
+
+        def on_result(result: WarmResult) -> None:
+            nonlocal done
+            done += 1
+            if quiet:
+                return
+            items = f" ({result.items} items)" if result.items is not None else ""
+            line = f"[{done}/{total}] {result.name} {result.status} {result.duration:.2f}s{items}"
+            if result.status == STATUS_OK:
+                self.stdout.write(line)
+            elif result.required:
+                self.stdout.write(self.style.ERROR(f"{line} {result.error}".rstrip()))
+            else:
+                self.stdout.write(self.style.WARNING(f"{line} {result.error}".rstrip()))
+
+        return on_result
+
+    def wait_for_other_node(self, timeout: float) -> str | None:
+        """
+        Wait while another node holds the warm-up lock.
+
+        Returns None once it marked the cache warm, or our lock token when it gave up.
+        """
+        self.stdout.write("Another node is warming the cache, waiting")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if warm_state() is not None:
+                return None
+            token = acquire_lock(timeout)
+            if token is not None:
+                # The other run ended without marking the cache warm: warm it here
+                return token
+            time.sleep(WAIT_INTERVAL)
+        raise CommandError(f"Cache was not warmed by another node within {timeout:.0f}s")
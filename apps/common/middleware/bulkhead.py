@@ -0,0 +1,20 @@
+from apps.common.functions.bulkhead import run_in_bulkhead
+from config.django.bulkhead import bulkhead_config
+
+
+class BulkheadMiddleware:
+    """
+    Apply BULKHEAD_ROUTES: requests under a configured path prefix run inside
+    their group's cluster-wide concurrency limit (503 + Retry-After when full).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Longest prefix first, so nested routes can use their own group
+        self.routes = sorted(bulkhead_config.BULKHEAD_ROUTES.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def __call__(self, request):
+        for prefix, group in self.routes:
+            if request.path_info.startswith(prefix):
+                return run_in_bulkhead(group, self.get_response, request)
+        return self.get_response(request)
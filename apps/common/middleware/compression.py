@@ -0,0 +1,159 @@
+from functools import lru_cache, wraps
+import hashlib
+
+from django.core.cache import caches
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from apps.common.functions.compression import (
+    BROTLI,
+    GZIP,
+    ZSTD,
+    available_encodings,
+    compress_async_iterator,
+    compress_bytes,
+    compress_iterator,
+    random_padding,
+)
+from apps.common.functions.tiered_cache import LOCAL_ALIAS
+from config.django.compression import compression_config
+
+# Media types worth compressing (besides text/*, +json and +xml)
+COMPRESSIBLE_TYPES = frozenset(
+    {"application/json", "application/javascript", "application/xml", "application/x-ndjson", "image/svg+xml"}
+)
+
+# Encodings that can carry random padding (see functions.compression)
+PADDABLE_ENCODINGS = (ZSTD, GZIP)
+
+
+def breach_sensitive(view):
+    """
+    Mark a view whose responses mix secrets with attacker-controlled input.
+
+    Such responses are only compressed with random-length padding.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = view(*args, **kwargs)
+        response.breach_sensitive = True
+        return response
+
+    return wrapper
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, sensitive: bool) -> str | None:
+    """
+    Pick the preferred encoding the client accepts (q > 0); cached per header value.
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    available = available_encodings()
+    for encoding in compression_config.COMPRESSION_ENCODINGS:
+        if encoding not in available or (sensitive and encoding not in PADDABLE_ENCODINGS):
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES or media_type.endswith(("+json", "+xml"))
+
+
+def encoding_level(encoding: str) -> int:
+    return {
+        ZSTD: compression_config.COMPRESSION_ZSTD_LEVEL,
+        BROTLI: compression_config.COMPRESSION_BROTLI_LEVEL,
+        GZIP: compression_config.COMPRESSION_GZIP_LEVEL,
+    }[encoding]
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Negotiate zstd, brotli or gzip from Accept-Encoding.
+
+    - Bodies below COMPRESSION_MIN_SIZE, non-200 responses, file responses
+      (sendfile / Range) and already-encoded responses pass through.
+    - Streaming responses are compressed chunk by chunk, flushing after each
+      chunk so streams (e.g. server-sent events) are not delayed.
+    - Compressed bytes of large bodies are kept in the local cache tier keyed
+      by a body hash, so identical responses (e.g. served from a cache) are
+      not compressed again.
+    - BREACH: HTML and responses marked with @breach_sensitive get random
+      padding (gzip FNAME / zstd skippable frame); brotli is not used for them
+      and their compressed bytes are never cached.
+    """
+
+    def process_response(self, request, response):
+        if (
+            not compression_config.COMPRESSION_ENABLED
+            or response.status_code != 200
+            or response.has_header("Content-Encoding")
+            or isinstance(response, FileResponse)
+            or not is_compressible(response.get("Content-Type", ""))
+        ):
+            return response
+        if not response.streaming and len(response.content) < compression_config.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        content_type = response.get("Content-Type", "")
+        sensitive = getattr(response, "breach_sensitive", False) or content_type.startswith("text/html")
+        encoding = negotiate(request.headers.get("Accept-Encoding", ""), sensitive)
+        if encoding is None:
+            return response
+
+        level = encoding_level(encoding)
+        padding = random_padding(compression_config.COMPRESSION_BREACH_PADDING) if sensitive else 0
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compress_async_iterator(response.streaming_content, encoding, level, padding)
+            else:
+                response.streaming_content = compress_iterator(response.streaming_content, encoding, level, padding)
+            # Compressed size is unknown until the stream ends
+            del response.headers["Content-Length"]
+        else:
+            compressed = self.compress_content(response.content, encoding, level, padding, cacheable=not sensitive)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # A strong ETag no longer describes the bytes sent (RFC 9110 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def compress_content(content: bytes, encoding: str, level: int, padding: int, cacheable: bool) -> bytes:
+        if not cacheable or len(content) < compression_config.COMPRESSION_CACHE_MIN_SIZE:
+            return compress_bytes(content, encoding, level, padding)
+
+        # Hashing is an order of magnitude cheaper than compressing
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        key = f"compress:{encoding}:{level}:{digest}"
+        cache = caches[LOCAL_ALIAS]
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress_bytes(content, encoding, level, padding)
+            if len(compressed) <= compression_config.COMPRESSION_CACHE_MAX_SIZE:
+                cache.set(key, compressed, compression_config.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
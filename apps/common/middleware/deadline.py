@@ -0,0 +1,147 @@
+import asyncio
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.http import JsonResponse
+
+from apps.common.deadlines import LAYER_VIEW, Deadline, DeadlineExceeded, current_deadline, exceeded, start_deadline
+from config.django.rest_framework import drf_config
+
+
+def timeout_response(layer: str) -> JsonResponse:
+    return JsonResponse({"detail": "Request timed out.", "layer": layer}, status=504)
+
+
+async def await_within(deadline: Deadline, awaitable):
+    """
+    Await `awaitable`, cancelling it and answering 504 once `deadline` expires.
+
+    The timer follows budget changes announced through `deadline.on_change`.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(awaitable)
+    timer = None
+    timed_out = False
+
+    def expire():
+        nonlocal timed_out
+        if deadline.remaining() <= 0 and not task.done():
+            timed_out = True
+            task.cancel()
+
+    def schedule():
+        nonlocal timer
+        if timer is not None:
+            timer.cancel()
+        timer = loop.call_later(max(deadline.remaining(), 0), expire)
+
+    # process_view may run in a worker thread; hop back to the loop to reschedule
+    previous_on_change = deadline.on_change
+    deadline.on_change = lambda: loop.call_soon_threadsafe(schedule)
+    schedule()
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if not timed_out:
+            raise
+        exceeded(LAYER_VIEW)
+        return timeout_response(LAYER_VIEW)
+    finally:
+        timer.cancel()
+        deadline.on_change = previous_on_change
+
+
+class DeadlineMiddleware:
+    """
+    Give every request a time budget (DEFAULT_TIMEOUT, or the view's
+    `deadline` attribute) and answer 504 when it runs out.
+
+    - Sync views cannot be interrupted; every DB query and Redis call they
+      make after the budget is spent raises DeadlineExceeded instead.
+    - Async views are cancelled when the budget expires. The chain usually
+      runs in sync mode (any sync-only middleware below forces it), so the
+      cancellation happens at the view layer (DeadlineHandlerMixin); in a
+      fully async chain this middleware cancels the rest of it as well.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        deadline = start_deadline(drf_config.DEFAULT_TIMEOUT)
+        token = current_deadline.set(deadline)
+        try:
+            return self.finalize(deadline, self.get_response(request))
+        finally:
+            current_deadline.reset(token)
+
+    async def __acall__(self, request):
+        deadline = start_deadline(drf_config.DEFAULT_TIMEOUT)
+        token = current_deadline.set(deadline)
+        try:
+            return self.finalize(deadline, await await_within(deadline, self.get_response(request)))
+        finally:
+            current_deadline.reset(token)
+
+    @staticmethod
+    def finalize(deadline: Deadline, response):
+        # DeadlineExceeded raised inside other middleware was turned into a 500 on the way out
+        if deadline.exceeded_in is not None and response.status_code == 500:
+            return timeout_response(deadline.exceeded_in)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Per-view budget: @deadline() on functions, `deadline` attribute on view classes
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        seconds = getattr(view_func, "deadline", None) or getattr(view_class, "deadline", None)
+        deadline = current_deadline.get()
+        if seconds and deadline is not None:
+            deadline.expires_at = deadline.started_at + seconds
+            if deadline.on_change is not None:
+                deadline.on_change()
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, DeadlineExceeded):
+            return timeout_response(exception.layer)
+        return None
+
+
+class DeadlineHandlerMixin:
+    """
+    Request handler that runs coroutine views under the request deadline.
+
+    In a sync middleware chain Django calls async views through async_to_sync;
+    the wrapper still awaits them on the event loop, so they can be cancelled.
+    """
+
+    def make_view_atomic(self, view):
+        view = super().make_view_atomic(view)
+        if not iscoroutinefunction(view):
+            return view
+
+        @wraps(view)
+        async def bounded_view(request, *args, **kwargs):
+            deadline = current_deadline.get()
+            if deadline is None:
+                return await view(request, *args, **kwargs)
+            return await await_within(deadline, view(request, *args, **kwargs))
+
+        return bounded_view
+
+
+class DeadlineWSGIHandler(DeadlineHandlerMixin, WSGIHandler):
+    pass
+
+
+class DeadlineASGIHandler(DeadlineHandlerMixin, ASGIHandler):
+    pass
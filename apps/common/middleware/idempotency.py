@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+
+from apps.common.functions.tiered_cache import SHARED_ALIAS, delete_if_value
+from config.django.idempotency import idempotency_config
+
+logger = logging.getLogger(__name__)
+
+# Cache key namespace for stored responses and in-flight locks
+IDEMPOTENCY_PREFIX = "idempotency:"
+
+# Headers never replayed (cookies belong to the original exchange)
+EXCLUDED_HEADERS = frozenset({"set-cookie", "content-length"})
+
+# Backoff bounds (seconds) while waiting for an in-flight duplicate
+POLL_MIN_INTERVAL = 0.01
+POLL_MAX_INTERVAL = 0.1
+
+
+class IdempotencyMiddleware:
+    """
+    Execute each (user, method, path, Idempotency-Key) at most once.
+
+    - The first request takes a short Redis lock, runs, and stores its
+      response (non-streaming, within the size limit, 2xx or one of the
+      deterministic IDEMPOTENCY_STORED_CLIENT_ERRORS; 429, 409 and other
+      transient answers stay retryable).
+    - Retries get the stored response replayed with `Idempotent-Replayed: true`.
+    - Concurrent duplicates wait for the first one instead of executing;
+      if it fails without a stored response, one of them takes over.
+    - Reusing a key with a different body is answered with 422. Bodies
+      above DATA_UPLOAD_MAX_MEMORY_SIZE are fingerprinted by length and
+      content type only, without reading them.
+    - Redis failures fail open: the request simply executes.
+
+    Must be placed after AuthenticationMiddleware: keys are scoped per user,
+    else per Authorization header, session, or (anonymous) client address.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        key = request.headers.get("Idempotency-Key")
+        if not key or request.method not in idempotency_config.IDEMPOTENCY_METHODS:
+            return self.get_response(request)
+        if len(key) > idempotency_config.IDEMPOTENCY_MAX_KEY_LENGTH:
+            return JsonResponse({"detail": "Idempotency-Key is too long."}, status=400)
+
+        cache = caches[SHARED_ALIAS]
+        record_key = self.record_key(request, key)
+        lock_key = record_key + ":lock"
+        fingerprint = self.fingerprint(request)
+        token = os.urandom(16).hex()
+
+        try:
+            response = self.acquire(cache, record_key, lock_key, token, fingerprint)
+        except Exception:
+            # Never let the idempotency store take the endpoint down
+            logger.warning("Idempotency store unavailable; executing request", exc_info=True)
+            return self.get_response(request)
+        if response is not None:
+            return response
+
+        # We hold the lock: execute once and store the outcome
+        try:
+            response = self.get_response(request)
+            if self.is_storable(response):
+                cache.set(record_key, self.build_record(response, fingerprint), idempotency_config.IDEMPOTENCY_TTL)
+            return response
+        finally:
+            try:
+                # Release only our own lock (it may have expired and been taken over)
+                delete_if_value(cache, lock_key, token)
+            except Exception:
+                logger.warning("Releasing idempotency lock failed", exc_info=True)
+
+    @staticmethod
+    def record_key(request, key: str) -> str:
+        user = getattr(request, "user", None)
+        session = getattr(request, "session", None)
+        authorization = request.headers.get("Authorization")
+        if user is not None and user.is_authenticated:
+            owner = f"user:{user.pk}"
+        elif authorization:
+            # Token-authenticated API clients are only known to DRF; scope by credentials instead
+            owner = "auth:" + hashlib.sha256(authorization.encode()).hexdigest()
+        elif session is not None and session.session_key:
+            owner = f"session:{session.session_key}"
+        else:
+            # Anonymous clients must not share one key space (and replay each other's responses)
+            owner = f"addr:{request.META.get('REMOTE_ADDR', '')}"
+        scope = f"{owner}:{request.method}:{request.path}:{key}"
+        return IDEMPOTENCY_PREFIX + hashlib.sha256(scope.encode()).hexdigest()
+
+    @staticmethod
+    def fingerprint(request) -> str:
+        try:
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        limit = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if limit is not None and length > limit:
+            # request.body would raise RequestDataTooBig (and buffer a streamed upload in memory)
+            return f"length:{length}:{request.content_type}"
+        return hashlib.sha256(request.body).hexdigest()
+
+    def acquire(self, cache, record_key: str, lock_key: str, token: str, fingerprint: str):
+        """
+        Return a response to send (replay or 409), or None once the lock is ours.
+        """
+        deadline = time.monotonic() + idempotency_config.IDEMPOTENCY_WAIT_TIMEOUT
+        interval = POLL_MIN_INTERVAL
+        while True:
+            record = cache.get(record_key)
+            if record is not None:
+                return self.replay(record, fingerprint)
+
+            if cache.add(lock_key, token, idempotency_config.IDEMPOTENCY_LOCK_TIMEOUT):
+                return None
+
+            # Another request with this key is in flight: wait for its result
+            if time.monotonic() >= deadline:
+                response = JsonResponse({"detail": "A request with this Idempotency-Key is still in progress."}, status=409)
+                response["Retry-After"] = "1"
+                return response
+            time.sleep(interval)
+            interval = min(interval * 2, POLL_MAX_INTERVAL)
+
+    @staticmethod
+    def is_storable(response) -> bool:
+        # Only outcomes a retry would reproduce are pinned; 5xx, 408, 409, 429... stay retryable
+        status = response.status_code
+        return (
+            not response.streaming
+            and (200 <= status < 300 or status in idempotency_config.IDEMPOTENCY_STORED_CLIENT_ERRORS)
+            and len(response.content) <= idempotency_config.IDEMPOTENCY_MAX_RESPONSE_BYTES
+        )
+
+    @staticmethod
+    def build_record(response, fingerprint: str) -> dict:
+        return {
+            "fingerprint": fingerprint,
+            "status": response.status_code,
+            "headers": [(name, value) for name, value in response.items() if name.lower() not in EXCLUDED_HEADERS],
+            "content": response.content,
+        }
+
+    @staticmethod
+    def replay(record: dict, fingerprint: str):
+        if record["fingerprint"] != fingerprint:
+            return JsonResponse({"detail": "Idempotency-Key was already used with a different request body."}, status=422)
+
+        response = HttpResponse(record["content"], status=record["status"])
+        for name, value in record["headers"]:
+            response[name] = value
+        response["Idempotent-Replayed"] = "true"
+        return response
@@ -0,0 +1,58 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.common.functions.memory_profile import memory_profiler
+from config.django.memory_profiling import memory_profiling_config
+
+
+def route_name(request) -> str:
+    # URL pattern, not the concrete path, so /users/1/ and /users/2/ share a route
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} /{match.route}" if match is not None and match.route else f"{request.method} <unresolved>"
+
+
+class MemoryProfileMiddleware:
+    """
+    Trace a sample of requests with tracemalloc (MEMORY_PROFILING_SAMPLE_RATE)
+    and record their peak / retained allocations per route.
+
+    Removed from the chain entirely unless MEMORY_PROFILING_ENABLED.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not memory_profiling_config.MEMORY_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not memory_profiler.start():
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self.get_response(request)
+            return response
+        finally:
+            memory_profiler.stop(route_name(request), started, getattr(response, "status_code", None))
+
+    async def __acall__(self, request):
+        if not memory_profiler.start():
+            return await self.get_response(request)
+
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await self.get_response(request)
+            return response
+        finally:
+            memory_profiler.stop(route_name(request), started, getattr(response, "status_code", None))
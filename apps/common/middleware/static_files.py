@@ -0,0 +1,78 @@
+import json
+import os
+from wsgiref.headers import Headers
+
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.responders import MissingFileError, StaticFile
+
+from apps.common.storages import ZSTD_SUFFIX, ParallelCompressedManifestStaticFilesStorage
+
+# Suffixes of every pre-compressed variant written at collectstatic time
+COMPRESSED_SUFFIXES = (".gz", ".br", ZSTD_SUFFIX)
+
+
+class IndexedWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise middleware that serves zstd variants and starts from the
+    precomputed STATIC_ROOT index instead of walking the directory tree.
+
+    Falls back to the upstream scan when the index has not been built
+    (e.g. before the first collectstatic) or autorefresh is enabled.
+    """
+
+    def update_files_dictionary(self, root, prefix):
+        stat_cache = self.load_index(root)
+        if stat_cache is None:
+            return super().update_files_dictionary(root, prefix)
+
+        for path in stat_cache:
+            relative_url = path[len(root) :].replace("\\", "/")
+            self.add_file_to_dictionary(prefix + relative_url, path, stat_cache=stat_cache)
+
+    @staticmethod
+    def load_index(root: str) -> dict[str, os.stat_result] | None:
+        # Only STATIC_ROOT is indexed; finder directories are scanned as usual
+        if not settings.STATIC_ROOT or os.path.normpath(root) != os.path.abspath(settings.STATIC_ROOT):
+            return None
+
+        try:
+            with open(os.path.join(root, ParallelCompressedManifestStaticFilesStorage.index_name), encoding="utf-8") as f:
+                files = json.load(f)["files"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # os.stat_result accepts the 10-field tuple (mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime)
+        return {
+            root + relative_path: os.stat_result((mode, 0, 0, 0, 0, 0, size, mtime, mtime, mtime))
+            for relative_path, (mode, size, mtime) in files.items()
+        }
+
+    @staticmethod
+    def is_compressed_variant(path, stat_cache=None):
+        for suffix in COMPRESSED_SUFFIXES:
+            if path.endswith(suffix):
+                uncompressed_path = path[: -len(suffix)]
+                if stat_cache is None:
+                    return os.path.isfile(uncompressed_path)
+                return uncompressed_path in stat_cache
+        return False
+
+    def get_static_file(self, path, url, stat_cache=None):
+        # Mirrors WhiteNoise.get_static_file with the zstd alternative added;
+        # StaticFile serves the smallest variant the client accepts
+        if stat_cache is None and not os.path.exists(path):
+            raise MissingFileError(path)
+        headers = Headers([])
+        self.add_mime_headers(headers, path, url)
+        self.add_cache_headers(headers, path, url)
+        if self.allow_all_origins:
+            headers["Access-Control-Allow-Origin"] = "*"
+        if self.add_headers_function is not None:
+            self.add_headers_function(headers, path, url)
+        return StaticFile(
+            path,
+            headers.items(),
+            stat_cache=stat_cache,
+            encodings={"gzip": path + ".gz", "br": path + ".br", "zstd": path + ZSTD_SUFFIX},
+        )
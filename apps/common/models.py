@@ -1,3 +1,250 @@
-from django.db import models
+import hashlib
+import logging
+import time
 
-# Create your models here.
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, models, router, transaction
+
+from apps.common.deadlines import DeadlineExceeded
+from apps.common.functions.bulk_upsert import UpsertResult, UpsertStrategyChoices, bulk_upsert
+from apps.common.functions.tiered_cache import LOCAL_ALIAS, MISSING, SHARED_ALIAS, tiered_get, tiered_set
+from config.django.cache import cache_config
+
+logger = logging.getLogger(__name__)
+
+# Cache key namespace for model reads
+MODEL_CACHE_PREFIX = "models:"
+
+
+def generation_key(model) -> str:
+    return f"{MODEL_CACHE_PREFIX}{model._meta.label_lower}:gen"
+
+
+def get_generation(model) -> int | None:
+    """
+    Return the model's current cache generation, or None when Redis is unavailable.
+
+    The generation is read through the local tier, so other workers observe a
+    bump within LOCAL_CACHE_TIMEOUT seconds.
+    """
+    key = generation_key(model)
+    generation = caches[LOCAL_ALIAS].get(key)
+    if generation is not None:
+        return generation
+
+    try:
+        shared = caches[SHARED_ALIAS]
+        generation = shared.get(key)
+        if generation is None:
+            # Start from a timestamp: if the counter was evicted, entries cached
+            # under an earlier generation must never become visible again
+            shared.add(key, time.time_ns(), None)
+            generation = shared.get(key)
+    except DeadlineExceeded:
+        raise
+    except Exception:
+        logger.warning("Reading cache generation of %s failed", model._meta.label, exc_info=True)
+        return None
+
+    if generation is not None and cache_config.LOCAL_CACHE_TIMEOUT:
+        caches[LOCAL_ALIAS].set(key, generation, cache_config.LOCAL_CACHE_TIMEOUT)
+    return generation
+
+
+def bump_generation(model) -> None:
+    """
+    Invalidate every cached read of `model` by moving to a new generation.
+    """
+    key = generation_key(model)
+    caches[LOCAL_ALIAS].delete(key)
+    try:
+        shared = caches[SHARED_ALIAS]
+        try:
+            shared.incr(key)
+        except ValueError:
+            # Counter missing (never read or evicted)
+            shared.set(key, time.time_ns(), None)
+    except Exception:
+        logger.error("Invalidating cached reads of %s failed", model._meta.label, exc_info=True)
+
+
+def invalidate_model(model, using: str | None = None) -> None:
+    """
+    Bump the generation once the current transaction commits.
+
+    Bumping after commit guarantees no reader can cache pre-commit rows under
+    the new generation. Call it after raw SQL writes to cached tables.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        bump_generation(model)
+        return
+
+    # One bump per model and transaction, however many rows changed
+    # (run_on_commit entries are (savepoint ids, func, robust) and dropped on rollback)
+    if any(getattr(entry[1], "cached_model", None) is model for entry in connection.run_on_commit):
+        return
+
+    def bump():
+        bump_generation(model)
+
+    bump.cached_model = model
+    transaction.on_commit(bump, using=using)
+
+
+class CachedQuerySet(models.QuerySet):
+    """
+    QuerySet with cache-aware reads and invalidating bulk writes.
+
+    `update()`, `bulk_create()` and `bulk_update()` send no model signals,
+    so they bump the generation themselves; `delete()` is covered by the
+    post_delete receiver (see apps.common.signals).
+    """
+
+    def cached(self, timeout: int | None = None) -> list:
+        """
+        Evaluate the queryset through the cache tiers.
+
+        Intended for small reference querysets; results larger than
+        MODEL_CACHE_MAX_ROWS are returned but not cached.
+        """
+        generation = get_generation(self.model)
+        if generation is None:
+            return list(self)
+
+        try:
+            sql, params = self.query.get_compiler(using=self.db).as_sql()
+        except EmptyResultSet:
+            # .none(), pk__in=[]: no query to run, nothing worth caching
+            return []
+        digest = hashlib.sha256(f"{self.db}:{sql}:{params!r}".encode()).hexdigest()
+        key = f"{MODEL_CACHE_PREFIX}{self.model._meta.label_lower}:{generation}:qs:{digest}"
+
+        rows = tiered_get(key, MISSING)
+        if rows is not MISSING:
+            return rows
+
+        rows = list(self)
+        if len(rows) <= cache_config.MODEL_CACHE_MAX_ROWS:
+            tiered_set(key, rows, self.model.cache_timeout if timeout is None else timeout)
+        return rows
+
+    def get_cached(self, pk):
+        """
+        `get(pk=pk)` served from the cache tiers.
+
+        Raises DoesNotExist like `get()`; misses are not cached.
+        """
+        generation = get_generation(self.model)
+        if generation is None:
+            return self.get(pk=pk)
+
+        key = f"{MODEL_CACHE_PREFIX}{self.model._meta.label_lower}:{generation}:pk:{pk}"
+        instance = tiered_get(key, MISSING)
+        if instance is not MISSING:
+            return instance
+
+        instance = self.get(pk=pk)
+        tiered_set(key, instance, self.model.cache_timeout)
+        return instance
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            invalidate_model(self.model, self.db)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            invalidate_model(self.model, self.db)
+        return objs
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        if rows:
+            invalidate_model(self.model, self.db)
+        return rows
+
+    def _raw_delete(self, using):
+        # Fast-path deletes (no signal receivers involved) skip post_delete
+        rows = super()._raw_delete(using)
+        if rows:
+            invalidate_model(self.model, using)
+        return rows
+
+
+class BulkUpsertQuerySet(models.QuerySet):
+    """
+    QuerySet exposing chunked `bulk_upsert()` (see apps.common.functions.bulk_upsert).
+    """
+
+    def bulk_upsert(
+        self,
+        objs,
+        unique_fields: list[str],
+        update_fields: list[str] | None = None,
+        batch_size: int | None = None,
+        strategy: UpsertStrategyChoices = UpsertStrategyChoices.AUTO,
+    ) -> UpsertResult:
+        """
+        Insert `objs`, updating rows that conflict on `unique_fields`.
+
+        Returns created/updated counts. Large loads on PostgreSQL go through
+        COPY + merge; model save() and signals are bypassed like bulk_create().
+        """
+        result = bulk_upsert(self, objs, unique_fields, update_fields, batch_size, strategy)
+        if (result.created or result.updated) and issubclass(self.model, CachedModel):
+            invalidate_model(self.model, self.db)
+        return result
+
+
+class BulkUpsertManager(models.Manager.from_queryset(BulkUpsertQuerySet)):
+    pass
+
+
+class CachedManager(models.Manager.from_queryset(CachedQuerySet)):
+    """
+    Manager exposing `get_cached()` and `.cached()` for reference data.
+    """
+
+    def get_cached(self, pk):
+        return self.get_queryset().get_cached(pk)
+
+
+class CachedBulkUpsertQuerySet(CachedQuerySet, BulkUpsertQuerySet):
+    """
+    Cached reads plus `bulk_upsert()`; every write path bumps the generation.
+    """
+
+
+class CachedBulkUpsertManager(models.Manager.from_queryset(CachedBulkUpsertQuerySet)):
+    """
+    Manager for cached models that are also bulk loaded (`objects = CachedBulkUpsertManager()`).
+    """
+
+    def get_cached(self, pk):
+        return self.get_queryset().get_cached(pk)
+
+
+class CachedModel(models.Model):
+    """
+    Abstract base for rarely written, frequently read models (lookup tables,
+    settings rows).
+
+    Reads through `objects.get_cached(pk)` / `objects.filter(...).cached()`
+    are stored in the cache tiers under a per-model generation. Any write
+    (save, delete, cascades, queryset update and bulk operations) bumps the
+    generation after commit, which invalidates every cached read at once.
+    Models that are also bulk loaded use `objects = CachedBulkUpsertManager()`.
+    """
+
+    # Seconds a cached read may live in Redis
+    cache_timeout: int = cache_config.MODEL_CACHE_TIMEOUT
+
+    objects = CachedManager()
+
+    class Meta:
+        abstract = True
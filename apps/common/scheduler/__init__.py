@@ -0,0 +1,90 @@
+"""
+Cluster-deduplicated periodic jobs.
+
+Apps declare jobs in a `jobs` module (discovered like `admin`):
+
+    @periodic("*/15 * * * *", jitter=60)
+    def purge_expired_tokens():
+        ...
+
+Every node runs `manage.py run_scheduler`; the node holding the Redis
+leader lease dispatches due jobs, and each occurrence is claimed in Redis
+before it runs, so a job runs once per scheduled time across the cluster
+even while leadership changes hands (see engine).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.utils.module_loading import autodiscover_modules
+
+from apps.common.scheduler.cron import CronSchedule, ScheduleError
+from config.django.scheduler import scheduler_config
+
+
+class JobError(Exception):
+    """
+    Invalid job declaration or selection.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodicJob:
+    name: str
+    func: Callable[[], object]
+    schedule: CronSchedule
+    # Up to this many seconds of delay, fixed per occurrence, so jobs sharing a schedule don't start together
+    jitter: float = 0.0
+    # Upper bound of one run; a crashed node's run stops blocking the next one after this long
+    timeout: float = 3600.0
+
+
+# Registered jobs by name
+scheduled_jobs: dict[str, PeriodicJob] = {}
+
+
+def register_job(
+    name: str,
+    func: Callable[[], object],
+    schedule: str,
+    jitter: float | None = None,
+    timeout: float | None = None,
+) -> PeriodicJob:
+    if name in scheduled_jobs and scheduled_jobs[name].func is not func:
+        raise JobError(f"Periodic job {name!r} is already registered")
+    try:
+        cron = CronSchedule(schedule, scheduler_config.SCHEDULER_TIME_ZONE)
+    except ScheduleError as exc:
+        raise JobError(f"Periodic job {name!r}: {exc}") from exc
+    scheduled_jobs[name] = PeriodicJob(
+        name,
+        func,
+        cron,
+        scheduler_config.SCHEDULER_DEFAULT_JITTER if jitter is None else jitter,
+        scheduler_config.SCHEDULER_JOB_TIMEOUT if timeout is None else timeout,
+    )
+    return scheduled_jobs[name]
+
+
+def periodic(schedule: str, name: str | None = None, jitter: float | None = None, timeout: float | None = None):
+    """
+    Decorator registering a periodic job (named after the function by default).
+    """
+
+    def decorator(func):
+        register_job(name or f"{func.__module__}.{func.__qualname__}", func, schedule, jitter, timeout)
+        return func
+
+    return decorator
+
+
+def autodiscover() -> None:
+    # Import `<app>.jobs` of every installed app
+    autodiscover_modules("jobs")
+
+
+def select_jobs(names: list[str] | None = None) -> list[PeriodicJob]:
+    unknown = set(names or ()) - scheduled_jobs.keys()
+    if unknown:
+        raise JobError(f"Unknown periodic jobs: {', '.join(sorted(unknown))}")
+    return [job for name, job in sorted(scheduled_jobs.items()) if not names or name in names]
@@ -0,0 +1,118 @@
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# Shorthands accepted in place of the five fields
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)
+}
+DAY_NAMES = {name: number for number, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# (low, high, names) per field: minute, hour, day of month, month, day of week
+FIELDS = ((0, 59, {}), (0, 23, {}), (1, 31, {}), (1, 12, MONTH_NAMES), (0, 7, DAY_NAMES))
+
+# Searching further than this means the expression never matches (e.g. 30 February)
+SEARCH_YEARS = 5
+
+
+class ScheduleError(ValueError):
+    """
+    Invalid cron expression.
+    """
+
+
+def parse_value(value: str, names: dict) -> int:
+    try:
+        return names[value.lower()] if value.lower() in names else int(value)
+    except ValueError:
+        raise ScheduleError(f"Invalid cron value {value!r}") from None
+
+
+def parse_field(field: str, low: int, high: int, names: dict) -> frozenset[int]:
+    values = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = parse_value(step_text, {}) if step_text else 1
+        if step < 1:
+            raise ScheduleError(f"Invalid cron step in {part!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start, end = (parse_value(value, names) for value in base.split("-", 1))
+        else:
+            start = parse_value(base, names)
+            # "5/15" means from 5 to the end in steps of 15
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ScheduleError(f"Cron field {part!r} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Five-field cron expression (minute hour day-of-month month day-of-week).
+
+    Supports *, ranges, steps, lists, month/day names and the @daily style
+    macros. As in cron, when both day fields are restricted a day matches
+    either of them. Times are evaluated in `tz`; a time skipped by a DST
+    change runs at the shifted wall time, a repeated one runs once.
+    """
+
+    def __init__(self, expression: str, tz: str = "UTC"):
+        self.expression = expression
+        fields = MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ScheduleError(f"Cron expression needs 5 fields: {expression!r}")
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            parse_field(field, *spec) for field, spec in zip(fields, FIELDS, strict=True)
+        )
+        # 7 is Sunday too
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+        self.tz = ZoneInfo(tz)
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        # isoweekday: Monday=1 .. Sunday=7
+        in_weekdays = moment.isoweekday() % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, timestamp: float) -> int:
+        """
+        First matching time strictly after `timestamp` (Unix seconds, whole minutes).
+        """
+        moment = datetime.fromtimestamp(timestamp, self.tz).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.replace(year=moment.year + SEARCH_YEARS, day=1)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self.day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                slot = int(moment.replace(tzinfo=self.tz).astimezone(UTC).timestamp())
+                if slot > timestamp:
+                    return slot
+                # Wall time repeated by a DST change, already passed in real time
+                moment += timedelta(minutes=1)
+        raise ScheduleError(f"Cron expression {self.expression!r} never matches")
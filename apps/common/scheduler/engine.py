@@ -0,0 +1,216 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+
+from django.db import connections
+
+from apps.common.scheduler import PeriodicJob
+from apps.common.scheduler.store import LEADER_KEY, SchedulerStore, job_key
+from config.django.scheduler import scheduler_config
+
+logger = logging.getLogger(__name__)
+
+# Run statuses
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_SKIPPED = "skipped"  # previous run still holds the job's run lease
+
+# Leadership is given up locally this long before the lease can expire in Redis
+LEASE_SAFETY = 0.8
+
+
+class SystemClock:
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout)
+
+
+def jitter_delay(job: PeriodicJob, slot: int) -> float:
+    # Same on every node, so a new leader starts an occurrence at the same time
+    if not job.jitter:
+        return 0.0
+    digest = hashlib.blake2b(f"{job.name}:{slot}".encode(), digest_size=4).digest()
+    return job.jitter * int.from_bytes(digest) / 2**32
+
+
+class Scheduler:
+    """
+    Dispatch periodic jobs from the node holding the leader lease.
+
+    - Leadership: a Redis key set with NX and a TTL, renewed every
+      SCHEDULER_RENEW_INTERVAL; standby nodes retry and take over once it
+      expires. Without Redis nobody dispatches (never everybody).
+    - Exactly once: an occurrence is claimed in Redis before it runs, and a
+      claim only succeeds for a later scheduled time than the last one, so
+      an old and a new leader cannot both run it.
+    - No overlap: a run holds the job's run lease (up to `job.timeout`);
+      an occurrence due while it is held is recorded as skipped.
+    - Occurrences missed by less than SCHEDULER_MISFIRE_GRACE still run
+      once; older ones are skipped.
+
+    `clock`, `store` (any redis-py compatible client) and `executor` are
+    injectable; see apps.common.scheduler.testing.
+    """
+
+    def __init__(self, jobs: list[PeriodicJob], store: SchedulerStore, clock=None, executor: Executor | None = None):
+        self.jobs = jobs
+        self.store = store
+        self.clock = clock or SystemClock()
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=scheduler_config.SCHEDULER_WORKERS, thread_name_prefix="scheduler"
+        )
+        self.node = f"{socket.gethostname()}:{os.getpid()}"
+        self.token = f"{self.node}|{os.urandom(8).hex()}"
+        self.stopping = threading.Event()
+        # Leadership as seen locally: valid until, next renewal
+        self.lease_until = 0.0
+        self.renew_at = 0.0
+        # Next occurrence (Unix seconds) per job, computed when leadership is gained
+        self.next_slots: dict[str, int] = {}
+
+    @property
+    def is_leader(self) -> bool:
+        return self.clock.monotonic() < self.lease_until
+
+    # -------------------------
+    # Leadership
+    # -------------------------
+    def maintain_lease(self) -> None:
+        now = self.clock.monotonic()
+        if now < self.renew_at:
+            return
+        ttl = scheduler_config.SCHEDULER_LEASE_TTL
+        was_leader = self.is_leader
+        try:
+            # Renew first: after a stall the lease may have lapsed locally but still be ours in Redis
+            held = self.store.renew_lease(LEADER_KEY, self.token, ttl) or self.store.acquire_lease(LEADER_KEY, self.token, ttl)
+        except Exception:
+            logger.warning("Scheduler lease update failed", exc_info=True)
+            held = False
+
+        if held:
+            if not was_leader:
+                logger.info("Scheduler %s became leader", self.node)
+                self.next_slots.clear()
+            self.lease_until = now + ttl * LEASE_SAFETY
+            self.renew_at = now + scheduler_config.SCHEDULER_RENEW_INTERVAL
+        else:
+            if was_leader:
+                logger.warning("Scheduler %s lost leadership", self.node)
+            self.lease_until = 0.0
+            self.renew_at = now + scheduler_config.SCHEDULER_RENEW_INTERVAL
+
+    def resign(self) -> None:
+        if self.lease_until:
+            try:
+                self.store.release_lease(LEADER_KEY, self.token)
+            except Exception:
+                logger.warning("Releasing the scheduler lease failed", exc_info=True)
+        self.lease_until = 0.0
+
+    # -------------------------
+    # Dispatch
+    # -------------------------
+    def tick(self) -> float:
+        """
+        Dispatch every due occurrence; returns seconds until the next check.
+        """
+        self.maintain_lease()
+        wait = min(scheduler_config.SCHEDULER_TICK, max(self.renew_at - self.clock.monotonic(), 0.0))
+        if not self.is_leader:
+            return wait
+
+        now = self.clock.time()
+        grace = scheduler_config.SCHEDULER_MISFIRE_GRACE
+        for job in self.jobs:
+            slot = self.next_slots.get(job.name)
+            if slot is None:
+                slot = self.next_slots[job.name] = job.schedule.next_after(now - grace)
+            due_at = slot + jitter_delay(job, slot)
+            if now < due_at:
+                wait = min(wait, due_at - now)
+                continue
+
+            # Advance first: a failing dispatch must not retry the same occurrence forever
+            self.next_slots[job.name] = job.schedule.next_after(max(slot, now - grace))
+            if now - due_at > grace:
+                logger.warning("Periodic job %s skipped its %s occurrence (%.0fs late)", job.name, slot, now - due_at)
+                continue
+            self.dispatch(job, slot)
+        return max(wait, 0.0)
+
+    def dispatch(self, job: PeriodicJob, slot: int) -> None:
+        try:
+            if not self.store.claim_occurrence(job.name, slot):
+                # Already run by a previous leader
+                return
+        except Exception:
+            logger.warning("Claiming periodic job %s failed", job.name, exc_info=True)
+            return
+        self.executor.submit(self.execute, job, slot)
+
+    def execute(self, job: PeriodicJob, slot: int | None) -> dict:
+        """
+        Run one occurrence under the job's run lease and record it (`slot` None: manual run).
+        """
+        run_key = job_key(job.name, ":running")
+        run_token = f"{self.node}|{os.urandom(8).hex()}"
+        run = {"slot": "" if slot is None else slot, "node": self.node, "started": self.clock.time(), "error": ""}
+        try:
+            acquired = self.store.acquire_lease(run_key, run_token, job.timeout)
+        except Exception:
+            logger.warning("Periodic job %s: run lease failed", job.name, exc_info=True)
+            return {**run, "status": STATUS_ERROR, "error": "run lease unavailable"}
+
+        started = self.clock.monotonic()
+        if not acquired:
+            logger.warning("Periodic job %s skipped: previous run still in progress", job.name)
+            run["status"] = STATUS_SKIPPED
+        else:
+            try:
+                job.func()
+                run["status"] = STATUS_OK
+            except Exception as exc:
+                logger.exception("Periodic job %s failed", job.name)
+                run.update(status=STATUS_ERROR, error=repr(exc))
+            finally:
+                # Job threads are not request threads: nothing else closes their connections
+                connections.close_all()
+                try:
+                    self.store.release_lease(run_key, run_token)
+                except Exception:
+                    logger.warning("Periodic job %s: releasing the run lease failed", job.name, exc_info=True)
+
+        run.update(finished=self.clock.time(), duration=round(self.clock.monotonic() - started, 6))
+        try:
+            self.store.record_run(job.name, run)
+        except Exception:
+            logger.warning("Recording periodic job %s failed", job.name, exc_info=True)
+        return run
+
+    # -------------------------
+    # Loop
+    # -------------------------
+    def run(self) -> None:
+        """
+        Dispatch until stop() is called, then hand leadership over and wait for running jobs.
+        """
+        logger.info("Scheduler %s started with %d jobs", self.node, len(self.jobs))
+        try:
+            while not self.stopping.is_set():
+                self.clock.wait(self.stopping, self.tick())
+        finally:
+            self.resign()
+            self.executor.shutdown(wait=True)
+
+    def stop(self) -> None:
+        self.stopping.set()
@@ -0,0 +1,107 @@
+import json
+
+from config.django.scheduler import scheduler_config
+
+KEY_PREFIX = "scheduler:"
+LEADER_KEY = f"{KEY_PREFIX}leader"
+
+# Occurrence claims outlive any failover window by far; expiry only cleans up removed jobs
+CLAIM_TTL = 7 * 24 * 3600
+# Metrics of jobs not run for this long expire
+METRICS_TTL = 30 * 24 * 3600
+
+# Extend / drop a lease only while it still holds our token (atomic)
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Claim an occurrence: only a later scheduled time than the last claimed one wins (atomic)
+CLAIM_SCRIPT = """
+local last = tonumber(redis.call('GET', KEYS[1]) or '-1')
+if tonumber(ARGV[1]) > last then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+def job_key(name: str, suffix: str = "") -> str:
+    return f"{KEY_PREFIX}job:{name}{suffix}"
+
+
+def decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class SchedulerStore:
+    """
+    Redis state of the scheduler: leader lease, occurrence claims, run
+    leases and per-job metrics. Works with any client exposing the redis-py
+    commands used here (see apps.common.scheduler.testing.FakeRedis).
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.renew = client.register_script(RENEW_SCRIPT)
+        self.release = client.register_script(RELEASE_SCRIPT)
+        self.claim = client.register_script(CLAIM_SCRIPT)
+
+    # -------------------------
+    # Leases
+    # -------------------------
+    def acquire_lease(self, key: str, token: str, ttl: float) -> bool:
+        return bool(self.client.set(key, token, nx=True, px=int(ttl * 1000)))
+
+    def renew_lease(self, key: str, token: str, ttl: float) -> bool:
+        return bool(self.renew(keys=[key], args=[token, int(ttl * 1000)]))
+
+    def release_lease(self, key: str, token: str) -> bool:
+        return bool(self.release(keys=[key], args=[token]))
+
+    def leader(self) -> str | None:
+        value = self.client.get(LEADER_KEY)
+        return decode(value).split("|", 1)[0] if value is not None else None
+
+    # -------------------------
+    # Occurrences
+    # -------------------------
+    def claim_occurrence(self, name: str, slot: int) -> bool:
+        return bool(self.claim(keys=[job_key(name, ":slot")], args=[slot, CLAIM_TTL]))
+
+    def record_run(self, name: str, run: dict) -> None:
+        key = job_key(name)
+        fields = {
+            "last_slot": run["slot"],
+            "last_status": run["status"],
+            "last_node": run["node"],
+            "last_started": run["started"],
+            "last_finished": run["finished"],
+            "last_duration": run["duration"],
+            "last_error": run["error"],
+        }
+        self.client.hset(key, mapping=fields)
+        self.client.hincrby(key, "runs", 1)
+        if run["status"] != "ok":
+            self.client.hincrby(key, f"{run['status']}_total", 1)
+        self.client.expire(key, METRICS_TTL)
+        history = job_key(name, ":history")
+        self.client.lpush(history, json.dumps(run))
+        self.client.ltrim(history, 0, scheduler_config.SCHEDULER_HISTORY - 1)
+        self.client.expire(history, METRICS_TTL)
+
+    def metrics(self, name: str) -> dict:
+        return {decode(field): decode(value) for field, value in self.client.hgetall(job_key(name)).items()}
+
+    def history(self, name: str, limit: int | None = None) -> list[dict]:
+        end = (limit or scheduler_config.SCHEDULER_HISTORY) - 1
+        return [json.loads(entry) for entry in self.client.lrange(job_key(name, ":history"), 0, end)]
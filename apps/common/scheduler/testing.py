@@ -0,0 +1,182 @@
+"""
+Deterministic doubles for exercising the scheduler without Redis or waiting:
+
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=UTC).timestamp())
+    store = SchedulerStore(FakeRedis(clock))
+    scheduler = Scheduler(jobs, store, clock=clock, executor=InlineExecutor())
+    clock.advance(60)
+    scheduler.tick()
+"""
+
+from concurrent.futures import Executor, Future
+import threading
+
+from apps.common.scheduler.store import CLAIM_SCRIPT, RELEASE_SCRIPT, RENEW_SCRIPT
+
+
+class FakeClock:
+    """
+    Clock that only moves when told to; waiting advances it instantly.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = float(start)
+        self.started = self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now - self.started
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        if not event.is_set():
+            self.advance(timeout)
+        return event.is_set()
+
+
+class InlineExecutor(Executor):
+    """
+    Runs submitted jobs immediately on the calling thread.
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def encode(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis-py commands and scripts the scheduler
+    uses; key expiry follows the given clock. Values come back as bytes,
+    like redis-py without decode_responses.
+    """
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.data: dict[str, object] = {}
+        self.expires: dict[str, float] = {}
+        self.scripts = {RENEW_SCRIPT: self.renew_script, RELEASE_SCRIPT: self.release_script, CLAIM_SCRIPT: self.claim_script}
+        # Set to make every command raise ConnectionError (Redis outage)
+        self.down = False
+
+    def check(self, key: str) -> None:
+        if self.down:
+            raise ConnectionError("FakeRedis is down")
+        if key in self.expires and self.expires[key] <= self.clock.time():
+            self.data.pop(key, None)
+            del self.expires[key]
+
+    # -------------------------
+    # Strings and keys
+    # -------------------------
+    def get(self, key: str):
+        self.check(key)
+        return self.data.get(key)
+
+    def set(self, key: str, value, nx: bool = False, px: int | None = None, ex: int | None = None):
+        self.check(key)
+        if nx and key in self.data:
+            return None
+        self.data[key] = encode(value)
+        self.expires.pop(key, None)
+        if px is not None or ex is not None:
+            self.expires[key] = self.clock.time() + (px / 1000 if px is not None else ex)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            self.check(key)
+            removed += self.data.pop(key, None) is not None
+            self.expires.pop(key, None)
+        return removed
+
+    def expire(self, key: str, seconds: float) -> bool:
+        self.check(key)
+        if key not in self.data:
+            return False
+        self.expires[key] = self.clock.time() + seconds
+        return True
+
+    def pexpire(self, key: str, milliseconds: int) -> bool:
+        return self.expire(key, milliseconds / 1000)
+
+    # -------------------------
+    # Hashes and lists
+    # -------------------------
+    def hset(self, key: str, mapping: dict) -> int:
+        self.check(key)
+        values = self.data.setdefault(key, {})
+        # Fields are stored as bytes, so compare encoded names
+        encoded = {encode(field): encode(value) for field, value in mapping.items()}
+        added = len(encoded.keys() - values.keys())
+        values.update(encoded)
+        return added
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        self.check(key)
+        values = self.data.setdefault(key, {})
+        value = int(values.get(encode(field), b"0")) + amount
+        values[encode(field)] = encode(value)
+        return value
+
+    def hgetall(self, key: str) -> dict:
+        self.check(key)
+        return dict(self.data.get(key, {}))
+
+    def lpush(self, key: str, *values) -> int:
+        self.check(key)
+        items = self.data.setdefault(key, [])
+        for value in values:
+            items.insert(0, encode(value))
+        return len(items)
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        self.check(key)
+        if key in self.data:
+            self.data[key] = self.data[key][start : end + 1 if end != -1 else None]
+        return True
+
+    def lrange(self, key: str, start: int, end: int) -> list:
+        self.check(key)
+        return list(self.data.get(key, [])[start : end + 1 if end != -1 else None])
+
+    # -------------------------
+    # Scripts (Python equivalents of the scheduler's Lua)
+    # -------------------------
+    def register_script(self, script: str):
+        implementation = self.scripts[script]
+
+        def call(keys=(), args=(), client=None):
+            return implementation(list(keys), list(args))
+
+        return call
+
+    def renew_script(self, keys: list, args: list) -> int:
+        if self.get(keys[0]) != encode(args[0]):
+            return 0
+        return int(self.pexpire(keys[0], int(args[1])))
+
+    def release_script(self, keys: list, args: list) -> int:
+        if self.get(keys[0]) != encode(args[0]):
+            return 0
+        return self.delete(keys[0])
+
+    def claim_script(self, keys: list, args: list) -> int:
+        last = self.get(keys[0])
+        if int(args[0]) > (int(last) if last is not None else -1):
+            self.set(keys[0], args[0], ex=int(args[1]))
+            return 1
+        return 0
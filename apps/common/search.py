@@ -0,0 +1,154 @@
+from functools import reduce
+import operator
+
+from django.db import connections, models
+from django.db.migrations.operations.base import Operation
+from django.db.models.expressions import RawSQL
+
+
+def fts_table_name(db_table: str) -> str:
+    # SQLite FTS5 shadow table kept in sync by triggers
+    return f"{db_table}_fts"
+
+
+def fts5_query(value: str) -> str:
+    # Quote every term so user input can never hit FTS5 query syntax errors
+    return " ".join('"' + term.replace('"', '""') + '"' for term in value.split())
+
+
+def full_text_filter(queryset, fields: list[str], value: str, config: str = "english", vector_column: str = "search_vector"):
+    """
+    Filter `queryset` to rows matching the search `value`.
+
+    - PostgreSQL: precomputed tsvector column + GIN index (websearch syntax).
+    - SQLite: FTS5 table (every term must match).
+    - Other backends: every term must icontains-match one of `fields`.
+
+    The column / FTS5 table is created by the CreateFullTextIndex migration operation.
+    """
+    value = value.strip()
+    if not value:
+        return queryset
+
+    connection = connections[queryset.db]
+    quote = connection.ops.quote_name
+    db_table = queryset.model._meta.db_table
+
+    if connection.vendor == "postgresql":
+        return queryset.filter(
+            RawSQL(
+                f"{quote(db_table)}.{quote(vector_column)} @@ websearch_to_tsquery(%s::regconfig, %s)",
+                [config, value],
+                output_field=models.BooleanField(),
+            )
+        )
+
+    if connection.vendor == "sqlite":
+        fts_table = quote(fts_table_name(db_table))
+        return queryset.filter(pk__in=RawSQL(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s", [fts5_query(value)]))
+
+    for term in value.split():
+        queryset = queryset.filter(reduce(operator.or_, (models.Q(**{f"{field}__icontains": term}) for field in fields)))
+    return queryset
+
+
+class CreateFullTextIndex(Operation):
+    """
+    Migration operation building the full-text index used by full_text_filter().
+
+    - PostgreSQL: a STORED generated tsvector column over `fields` plus a GIN index.
+    - SQLite: an external-content FTS5 table with insert/update/delete
+      triggers (requires an integer primary key), rebuilt from existing rows.
+    - Other backends: no-op (full_text_filter falls back to icontains).
+
+    Model state is untouched: the column / table is only read via raw SQL.
+    """
+
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name: str, fields: list[str], config: str = "english", vector_column: str = "search_vector"):
+        self.model_name = model_name
+        self.fields = list(fields)
+        self.config = config
+        self.vector_column = vector_column
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        for sql in self.forwards_sql(model, schema_editor):
+            schema_editor.execute(sql, params=None)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        for sql in self.backwards_sql(model, schema_editor):
+            schema_editor.execute(sql, params=None)
+
+    def index_name(self, model, connection) -> str:
+        return f"{model._meta.db_table}_{self.vector_column}_gin"[: connection.ops.max_name_length()]
+
+    def forwards_sql(self, model, schema_editor) -> list[str]:
+        connection = schema_editor.connection
+        quote = schema_editor.quote_name
+        meta = model._meta
+        table = quote(meta.db_table)
+        columns = [quote(meta.get_field(name).column) for name in self.fields]
+
+        if connection.vendor == "postgresql":
+            document = " || ' ' || ".join(f"coalesce({column}::text, '')" for column in columns)
+            return [
+                f"ALTER TABLE {table} ADD COLUMN {quote(self.vector_column)} tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector({schema_editor.quote_value(self.config)}::regconfig, {document})) STORED",
+                f"CREATE INDEX {quote(self.index_name(model, connection))} ON {table} USING GIN ({quote(self.vector_column)})",
+            ]
+
+        if connection.vendor == "sqlite":
+            fts_name = fts_table_name(meta.db_table)
+            fts = quote(fts_name)
+            pk = quote(meta.pk.column)
+            column_list = ", ".join(columns)
+            new_values = ", ".join(f"new.{column}" for column in columns)
+            old_values = ", ".join(f"old.{column}" for column in columns)
+            delete_row = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{pk}, {old_values});"
+            insert_row = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{pk}, {new_values});"
+            return [
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, content={schema_editor.quote_value(meta.db_table)}, "
+                f"content_rowid={schema_editor.quote_value(meta.pk.column)})",
+                f"CREATE TRIGGER {quote(fts_name + '_ai')} AFTER INSERT ON {table} BEGIN {insert_row} END",
+                f"CREATE TRIGGER {quote(fts_name + '_ad')} AFTER DELETE ON {table} BEGIN {delete_row} END",
+                f"CREATE TRIGGER {quote(fts_name + '_au')} AFTER UPDATE ON {table} BEGIN {delete_row} {insert_row} END",
+                f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+            ]
+
+        return []
+
+    def backwards_sql(self, model, schema_editor) -> list[str]:
+        connection = schema_editor.connection
+        quote = schema_editor.quote_name
+        meta = model._meta
+
+        if connection.vendor == "postgresql":
+            # Dropping the column drops its index too
+            return [f"ALTER TABLE {quote(meta.db_table)} DROP COLUMN IF EXISTS {quote(self.vector_column)}"]
+
+        if connection.vendor == "sqlite":
+            fts_name = fts_table_name(meta.db_table)
+            return [
+                *(f"DROP TRIGGER IF EXISTS {quote(fts_name + suffix)}" for suffix in ("_ai", "_ad", "_au")),
+                f"DROP TABLE IF EXISTS {quote(fts_name)}",
+            ]
+
+        return []
+
+    def describe(self):
+        return f"Create full-text index on {self.model_name} ({', '.join(self.fields)})"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name.lower()}_fulltext"
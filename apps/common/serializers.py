@@ -0,0 +1,164 @@
+from functools import cached_property
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+# Field classes whose to_representation() is the identity for values of the given exact type
+IDENTITY_TYPES = {
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.SlugField: str,
+    serializers.URLField: str,
+    serializers.IntegerField: int,
+    serializers.BooleanField: bool,
+    serializers.FloatField: float,
+}
+
+
+def fallback_value(field, instance):
+    """
+    Standard DRF path for one field; returns SKIP when the field is skipped.
+    """
+    try:
+        attribute = field.get_attribute(instance)
+    except SkipField:
+        return SKIP
+    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+    return None if check_for_none is None else field.to_representation(attribute)
+
+
+SKIP = object()
+
+
+class FastModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer with a generated `to_representation()`.
+
+    Declarations are plain DRF. On first use, per class and field layout, the
+    readable fields are compiled into one Python function:
+
+    - model fields read as attributes; str/int/bool/float values of matching
+      fields are emitted as-is, anything else goes through the field's
+      `to_representation()` (so dates, decimals, choices stay exact);
+    - PrimaryKeyRelatedField reads the FK column (`author_id`), many-to-many
+      PK fields become `[obj.pk for obj in ...all()]`;
+    - nested FastModelSerializers (single or many=True) call their own
+      compiled function;
+    - everything else (dotted sources, method fields, custom fields, reverse
+      one-to-one relations) falls back to the standard get_attribute() /
+      to_representation() pair.
+
+    Compilation cannot happen at class creation: bound fields depend on the
+    instance (context, `fields` overrides), so each distinct layout is
+    compiled once, when first serialized, and shared by later instances.
+
+    Writes (validation, create/update) are plain ModelSerializer behaviour.
+    """
+
+    # (class, layout signature) -> generated function
+    _compiled_functions: dict = {}
+
+    @cached_property
+    def _compiled_representation(self):
+        # Bound once per serializer instance (not per object) so list serialization pays it once
+        fields = list(self._readable_fields)
+        plan = [self.plan_field(field) for field in fields]
+        signature = (type(self), tuple((field.field_name, kind, code) for field, (kind, code) in zip(fields, plan, strict=True)))
+
+        function = self._compiled_functions.get(signature)
+        if function is None:
+            function = self._compiled_functions[signature] = self.compile_plan(fields, plan)
+
+        helpers = tuple(self.field_helper(field, kind) for field, (kind, _) in zip(fields, plan, strict=True))
+        return lambda instance: function(instance, helpers)
+
+    def to_representation(self, instance):
+        return self._compiled_representation(instance)
+
+    # -------------------------
+    # Planning
+    # -------------------------
+    def model_attribute(self, source: str) -> str | None:
+        """
+        Return the attribute name to read for `source` when it is a concrete model field.
+        """
+        if "." in source or source == "*" or not source.isidentifier():
+            return None
+        try:
+            model_field = self.Meta.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        return source if model_field.concrete or model_field.is_relation else None
+
+    def plan_field(self, field) -> tuple[str, str]:
+        """
+        Classify a bound field as (kind, attribute expression).
+        """
+        attribute = self.model_attribute(field.source)
+        if attribute is None:
+            return "fallback", ""
+
+        model_field = self.Meta.model._meta.get_field(attribute)
+        if model_field.is_relation and not model_field.concrete and not (model_field.many_to_many or model_field.one_to_many):
+            # Reverse one-to-one: the accessor raises when the row is missing, DRF's get_attribute() maps that to None
+            return "fallback", ""
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None and model_field.many_to_one:
+            return "value", f"instance.{model_field.attname}"
+        if (
+            isinstance(field, serializers.ManyRelatedField)
+            and type(field.child_relation) is serializers.PrimaryKeyRelatedField
+            and field.child_relation.pk_field is None
+        ):
+            return "pk_list", f"instance.{attribute}"
+        if isinstance(field, FastModelSerializer):
+            return "nested", f"instance.{attribute}"
+        if isinstance(field, serializers.ListSerializer) and isinstance(field.child, FastModelSerializer):
+            return "nested_many", f"instance.{attribute}"
+        if model_field.is_relation:
+            return "fallback", ""
+        if type(field) in IDENTITY_TYPES:
+            return f"identity:{IDENTITY_TYPES[type(field)].__name__}", f"instance.{attribute}"
+        return "convert", f"instance.{attribute}"
+
+    @staticmethod
+    def field_helper(field, kind: str):
+        if kind == "nested":
+            return field.to_representation
+        if kind == "nested_many":
+            return field.child.to_representation
+        if kind == "fallback":
+            return field
+        return field.to_representation
+
+    # -------------------------
+    # Code generation
+    # -------------------------
+    @classmethod
+    def compile_plan(cls, fields: list, plan: list):
+        lines = ["def represent(instance, H):", "    ret = {}"]
+        for index, (field, (kind, expression)) in enumerate(zip(fields, plan, strict=True)):
+            key = repr(field.field_name)
+            helper = f"H[{index}]"
+            if kind == "fallback":
+                lines += [f"    v = fallback_value({helper}, instance)", "    if v is not SKIP:", f"        ret[{key}] = v"]
+            elif kind == "value":
+                lines.append(f"    ret[{key}] = {expression}")
+            elif kind.startswith("identity:"):
+                type_name = kind.split(":", 1)[1]
+                lines += [
+                    f"    v = {expression}",
+                    f"    ret[{key}] = v if v is None or v.__class__ is {type_name} else {helper}(v)",
+                ]
+            elif kind in ("convert", "nested"):
+                lines += [f"    v = {expression}", f"    ret[{key}] = None if v is None else {helper}(v)"]
+            elif kind == "pk_list":
+                lines.append(f"    ret[{key}] = [] if instance.pk is None else [o.pk for o in {expression}.all()]")
+            elif kind == "nested_many":
+                lines.append(f"    ret[{key}] = [{helper}(o) for o in {expression}.all()]")
+        lines.append("    return ret")
+
+        namespace = {"fallback_value": fallback_value, "SKIP": SKIP}
+        exec(compile("\n".join(lines), f"<{cls.__module__}.{cls.__qualname__}.to_representation>", "exec"), namespace)
+        return namespace["represent"]
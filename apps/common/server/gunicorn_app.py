@@ -0,0 +1,67 @@
+import logging
+import os
+import time
+
+from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
+
+from apps.common.server.memory import log_memory_report, process_memory
+from config.django.server import server_config
+
+logger = logging.getLogger(__name__)
+
+# First memory report once the initial workers have booted
+FIRST_REPORT_DELAY = 15
+
+
+def worker_exit(server, worker):
+    # Memory at recycle time shows how much a worker grows over max_requests
+    usage = process_memory(os.getpid())
+    if usage:
+        logger.info(
+            "Worker %s exiting after %s requests: rss=%s kB pss=%s kB", worker.pid, worker.nr, usage["rss_kb"], usage["pss_kb"]
+        )
+
+
+class MemoryReportingArbiter(Arbiter):
+    """
+    Arbiter that logs per-worker RSS/PSS every SERVER_MEMORY_REPORT_INTERVAL seconds.
+
+    Runs on the master's main loop (no extra thread that could hold a lock across fork).
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.next_report = time.monotonic() + FIRST_REPORT_DELAY
+
+    def manage_workers(self):
+        super().manage_workers()
+        interval = server_config.SERVER_MEMORY_REPORT_INTERVAL
+        if interval and time.monotonic() >= self.next_report:
+            self.next_report = time.monotonic() + interval
+            log_memory_report(self.pid, list(self.WORKERS))
+
+
+class PreloadedApplication(BaseApplication):
+    """
+    Gunicorn application serving an already imported (preloaded) callable.
+    """
+
+    def __init__(self, application, options: dict):
+        self.application = application
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+    def run(self):
+        MemoryReportingArbiter(self).run()
+
+
+def run_gunicorn(application, options: dict) -> None:
+    PreloadedApplication(application, {"preload_app": True, "worker_exit": worker_exit, **options}).run()
@@ -0,0 +1,97 @@
+import glob
+import logging
+
+logger = logging.getLogger(__name__)
+
+# smaps_rollup fields summed into the report (kB)
+SHARED_FIELDS = ("Shared_Clean", "Shared_Dirty")
+PRIVATE_FIELDS = ("Private_Clean", "Private_Dirty")
+
+
+def read_kb_fields(path: str) -> dict[str, int]:
+    fields = {}
+    with open(path, encoding="ascii") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            parts = rest.split()
+            if len(parts) == 2 and parts[1] == "kB":
+                fields[key] = int(parts[0])
+    return fields
+
+
+def process_memory(pid: int) -> dict | None:
+    """
+    RSS, PSS, shared and private memory (kB) of one process, from /proc (Linux).
+
+    PSS divides each shared page between the processes mapping it, so the
+    sum of PSS over master and workers is the real footprint; RSS counts
+    copy-on-write pages once per worker. Returns None when unavailable.
+    """
+    try:
+        fields = read_kb_fields(f"/proc/{pid}/smaps_rollup")
+    except FileNotFoundError:
+        # Kernels before 4.14: RSS only
+        try:
+            fields = {"Rss": read_kb_fields(f"/proc/{pid}/status")["VmRSS"]}
+        except (OSError, KeyError):
+            return None
+    except OSError:
+        return None
+
+    return {
+        "pid": pid,
+        "rss_kb": fields.get("Rss"),
+        "pss_kb": fields.get("Pss"),
+        "shared_kb": sum(fields[name] for name in SHARED_FIELDS if name in fields) if "Pss" in fields else None,
+        "private_kb": sum(fields[name] for name in PRIVATE_FIELDS if name in fields) if "Pss" in fields else None,
+    }
+
+
+def child_pids(pid: int) -> list[int]:
+    pids = []
+    for path in glob.glob(f"/proc/{pid}/task/*/children"):
+        try:
+            with open(path, encoding="ascii") as f:
+                pids.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return sorted(pids)
+
+
+def memory_report(master_pid: int, worker_pids: list[int] | None = None) -> dict:
+    """
+    Memory of the master and each worker (children of the master by default), plus totals.
+    """
+    master = process_memory(master_pid)
+    workers = [
+        usage for pid in (child_pids(master_pid) if worker_pids is None else worker_pids) if (usage := process_memory(pid))
+    ]
+    processes = ([master] if master else []) + workers
+    pss = [usage["pss_kb"] for usage in processes]
+    return {
+        "master": master,
+        "workers": workers,
+        "total_rss_kb": sum(usage["rss_kb"] or 0 for usage in processes),
+        "total_pss_kb": None if None in pss else sum(pss),
+    }
+
+
+def log_memory_report(master_pid: int, worker_pids: list[int] | None = None) -> dict:
+    report = memory_report(master_pid, worker_pids)
+    if report["master"] is None:
+        logger.debug("Process memory is not available on this platform")
+        return report
+    for role, usage in [("master", report["master"])] + [("worker", usage) for usage in report["workers"]]:
+        logger.info(
+            "Memory %s %s: rss=%s kB pss=%s kB shared=%s kB private=%s kB",
+            role,
+            usage["pid"],
+            usage["rss_kb"],
+            usage["pss_kb"],
+            usage["shared_kb"],
+            usage["private_kb"],
+        )
+    logger.info(
+        "Memory total (%d workers): rss=%s kB pss=%s kB", len(report["workers"]), report["total_rss_kb"], report["total_pss_kb"]
+    )
+    return report
@@ -0,0 +1,66 @@
+import math
+import os
+
+from config.django.server import WorkerClassChoices
+
+# cgroup v2 / v1 CPU quota files (containers)
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def read_first_line(path: str) -> str | None:
+    try:
+        with open(path, encoding="ascii") as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit() -> float | None:
+    """
+    CPU quota of this container in cores (None when unlimited or not in a cgroup).
+    """
+    line = read_first_line(CGROUP_V2_CPU_MAX)
+    if line:
+        quota, _, period = line.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota, period = read_first_line(CGROUP_V1_QUOTA), read_first_line(CGROUP_V1_PERIOD)
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process may actually use: scheduler affinity, capped by the cgroup quota.
+
+    os.cpu_count() reports the host's cores, which overcommits workers inside containers.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+
+def default_workers(worker_class: WorkerClassChoices, cpus: int) -> int:
+    """
+    Worker processes for `cpus` cores.
+
+    - sync: 2 × cores + 1 (processes block on I/O, oversubscribe to keep cores busy)
+    - gthread: cores + 1 (threads already overlap I/O within a process)
+    - uvicorn: one event loop per core
+    """
+    if worker_class == WorkerClassChoices.SYNC:
+        return 2 * cpus + 1
+    if worker_class == WorkerClassChoices.GTHREAD:
+        return cpus + 1
+    return cpus
@@ -0,0 +1,32 @@
+import os
+import random
+
+import uvicorn
+
+from apps.common.server.memory import log_memory_report
+
+
+def run_uvicorn(application, bind: str, keepalive: int, max_requests: int, max_requests_jitter: int) -> None:
+    """
+    Serve the preloaded ASGI application in this process (one worker per container).
+
+    uvicorn's own multi-worker mode spawns fresh interpreters, which would
+    throw the preload away; scale with more containers instead. With
+    max_requests the process exits after that many requests (plus jitter)
+    and the orchestrator restarts it.
+    """
+    if bind.startswith("unix:"):
+        address = {"uds": bind.removeprefix("unix:")}
+    else:
+        host, _, port = bind.rpartition(":")
+        address = {"host": host or "0.0.0.0", "port": int(port)}
+
+    config = uvicorn.Config(
+        application,
+        lifespan="off",
+        timeout_keep_alive=keepalive,
+        limit_max_requests=max_requests + random.randint(0, max_requests_jitter) if max_requests else None,
+        **address,
+    )
+    log_memory_report(os.getpid(), [])
+    uvicorn.Server(config).run()
@@ -0,0 +1,13 @@
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:  # older uvicorn ships the gunicorn worker itself
+    from uvicorn.workers import UvicornWorker
+
+
+class DjangoUvicornWorker(UvicornWorker):
+    """
+    Gunicorn worker running the preloaded ASGI application on uvicorn.
+    """
+
+    # Django's ASGI handler does not implement the lifespan protocol
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "lifespan": "off"}
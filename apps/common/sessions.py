@@ -0,0 +1,221 @@
+import time
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.contrib.sessions.backends.base import CreateError, UpdateError
+from django.contrib.sessions.backends.cache import SessionStore as CacheSessionStore
+from django.contrib.sessions.models import Session
+from django.utils import timezone
+
+from apps.common.deadlines import DeadlineExceeded
+from config.django.sessions import sessions_config
+
+# Payload markers: plain or zlib-compressed envelope
+PLAIN = b"j"
+COMPRESSED = b"z"
+
+
+def encode_payload(refreshed_at: float, persisted_at: float, dirty: bool, data: bytes) -> bytes:
+    """
+    Build the compact cache envelope: b"<refreshed>:<persisted>:<dirty>:" + serialized data.
+
+    `dirty` marks a change not flushed to the database yet (write-behind).
+    Envelopes above SESSION_COMPRESS_MIN_BYTES are zlib-compressed.
+    """
+    body = b"%d:%d:%d:%s" % (refreshed_at, persisted_at, dirty, data)
+    if len(body) >= sessions_config.SESSION_COMPRESS_MIN_BYTES:
+        return COMPRESSED + zlib.compress(body)
+    return PLAIN + body
+
+
+def decode_payload(payload) -> tuple[float, float, bool, bytes] | None:
+    # Anything not written by this backend (e.g. a stale engine) counts as a miss
+    if not isinstance(payload, bytes) or not payload:
+        return None
+    marker, body = payload[:1], payload[1:]
+    try:
+        if marker == COMPRESSED:
+            body = zlib.decompress(body)
+        elif marker != PLAIN:
+            return None
+        refreshed_at, persisted_at, dirty, data = body.split(b":", 3)
+        if dirty not in (b"0", b"1"):
+            return None
+        return float(refreshed_at), float(persisted_at), dirty == b"1", data
+    except (zlib.error, ValueError):
+        return None
+
+
+class SessionStore(CacheSessionStore):
+    """
+    Cache session store that coalesces writes.
+
+    Compared to `django.contrib.sessions.backends.cache`:
+    - Session data is stored as compact JSON, zlib-compressed when large.
+    - save() only writes when the serialized data actually changed.
+    - Unchanged sessions get their TTL refreshed at most once per
+      SESSION_REFRESH_INTERVAL, so sliding sessions may expire up to one
+      interval earlier than SESSION_COOKIE_AGE.
+    - With SESSION_WRITE_BEHIND the database is a durable fallback: cache
+      misses are reloaded from it and changes are flushed to it at most once
+      per SESSION_DB_FLUSH_INTERVAL (and always on create). A change made
+      within the interval stays marked dirty in the cache envelope and is
+      flushed by the next save, TTL refresh or load once the interval has
+      passed; TTL refreshes also extend the row's expire_date.
+    """
+
+    cache_key_prefix = "apps.common.sessions"
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # Serialized data as last read from / written to the cache
+        self._stored_data: bytes | None = None
+        self._refreshed_at = 0.0
+        self._persisted_at = 0.0
+        # A change is in the cache but not yet in the database
+        self._dirty = False
+
+    # -------------------------
+    # Load
+    # -------------------------
+    def load(self):
+        try:
+            decoded = decode_payload(self._cache.get(self.cache_key))
+        except DeadlineExceeded:
+            # Out of time, not a cache failure: an empty session would log the user out
+            raise
+        except Exception:
+            decoded = None
+
+        if decoded is None and sessions_config.SESSION_WRITE_BEHIND:
+            decoded = self._load_from_db()
+
+        if decoded is None:
+            self._session_key = None
+            return {}
+
+        self._refreshed_at, self._persisted_at, self._dirty, self._stored_data = decoded
+        session = self.serializer().loads(self._stored_data)
+        if self._flush_due(time.time()):
+            # Read-only traffic must not keep a pending change out of the database forever
+            self._flush(session, self._stored_data)
+        return session
+
+    def _load_from_db(self) -> tuple[float, float, bool, bytes] | None:
+        session = Session.objects.filter(session_key=self.session_key, expire_date__gt=timezone.now()).first()
+        if session is None:
+            return None
+
+        # Re-populate the cache so the next request is a cache hit
+        now = time.time()
+        decoded = self.decode(session.session_data)
+        data = self.serializer().dumps(decoded)
+        # Explicit expiry: called from load(), before the session cache is set
+        expiry_age = self.get_expiry_age(expiry=decoded.get("_session_expiry"))
+        self._cache.set(self.cache_key, encode_payload(now, now, False, data), expiry_age)
+        return now, now, False, data
+
+    # -------------------------
+    # Save
+    # -------------------------
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        session = self._get_session(no_load=must_create)
+        data = self.serializer().dumps(session)
+        now = time.time()
+
+        # Skip the write entirely when nothing changed, the TTL is still fresh and no flush is due
+        changed = must_create or data != self._stored_data
+        refresh = now - self._refreshed_at >= sessions_config.SESSION_REFRESH_INTERVAL
+        self._dirty = sessions_config.SESSION_WRITE_BEHIND and (self._dirty or changed)
+        flush = self._dirty and (must_create or self._flush_due(now))
+        if not changed and not refresh and not flush:
+            return
+
+        if not must_create and not self.exists(self.session_key):
+            # Session was deleted by a concurrent request (e.g. logout); never resurrect it
+            raise UpdateError
+
+        if flush:
+            self._save_to_db(session)
+            self._persisted_at, self._dirty = now, False
+        elif refresh and sessions_config.SESSION_WRITE_BEHIND:
+            # Keep the fallback row alive as long as the cached session
+            Session.objects.filter(session_key=self.session_key).update(expire_date=self.get_expiry_date())
+
+        payload = encode_payload(now, self._persisted_at, self._dirty, data)
+        if must_create:
+            if not self._cache.add(self.cache_key, payload, self.get_expiry_age()):
+                raise CreateError
+        else:
+            self._cache.set(self.cache_key, payload, self.get_expiry_age())
+
+        self._stored_data, self._refreshed_at = data, now
+
+    def _flush_due(self, now: float) -> bool:
+        return (
+            sessions_config.SESSION_WRITE_BEHIND
+            and self._dirty
+            and now - self._persisted_at >= sessions_config.SESSION_DB_FLUSH_INTERVAL
+        )
+
+    def _flush(self, session: dict, data: bytes) -> None:
+        # Persist a pending change and clear the flag in the cache envelope
+        now = time.time()
+        self._save_to_db(session)
+        # Explicit expiry: called from load(), before the session cache is set
+        expiry_age = self.get_expiry_age(expiry=session.get("_session_expiry"))
+        self._cache.set(self.cache_key, encode_payload(now, now, False, data), expiry_age)
+        self._refreshed_at, self._persisted_at, self._dirty = now, now, False
+
+    def _save_to_db(self, session: dict) -> None:
+        Session(
+            session_key=self.session_key,
+            session_data=self.encode(session),
+            expire_date=self.get_expiry_date(expiry=session.get("_session_expiry")),
+        ).save()
+
+    # -------------------------
+    # Existence / deletion
+    # -------------------------
+    def exists(self, session_key):
+        if super().exists(session_key):
+            return True
+        return sessions_config.SESSION_WRITE_BEHIND and Session.objects.filter(session_key=session_key).exists()
+
+    def delete(self, session_key=None):
+        if session_key is None and self.session_key is None:
+            return
+        target_key = session_key or self.session_key
+        super().delete(session_key)
+        if sessions_config.SESSION_WRITE_BEHIND:
+            Session.objects.filter(session_key=target_key).delete()
+
+    @classmethod
+    def clear_expired(cls):
+        if sessions_config.SESSION_WRITE_BEHIND:
+            Session.objects.filter(expire_date__lt=timezone.now()).delete()
+
+    # -------------------------
+    # Async API (same logic, run in a thread)
+    # -------------------------
+    async def aload(self):
+        return await sync_to_async(self.load)()
+
+    async def acreate(self):
+        return await sync_to_async(self.create)()
+
+    async def asave(self, must_create=False):
+        return await sync_to_async(self.save)(must_create=must_create)
+
+    async def aexists(self, session_key):
+        return await sync_to_async(self.exists)(session_key)
+
+    async def adelete(self, session_key=None):
+        return await sync_to_async(self.delete)(session_key)
+
+    @classmethod
+    async def aclear_expired(cls):
+        return await sync_to_async(cls.clear_expired)()
@@ -0,0 +1,150 @@
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from apps.common.authentication import invalidate_tokens
+from apps.common.backends import invalidate_users
+from apps.common.deadlines.db import install_deadline_wrapper
+from apps.common.models import CachedModel, invalidate_model
+from apps.common.slow_queries.db import install_query_stats
+from apps.common.tracing.db import install_query_tracing
+from config.django.slow_queries import slow_query_config
+from config.django.tracing import tracing_config
+
+UserModel = get_user_model()
+
+# m2m actions after which cached permission sets are stale
+M2M_INVALIDATING_ACTIONS = ("post_add", "post_remove", "post_clear")
+
+# Instance attribute carrying the ids a reverse clear() affects from pre_clear to post_clear
+CLEARED_IDS_ATTR = "_common_cleared_ids"
+
+
+# -------------------------
+# Cached token authentication
+# -------------------------
+# Invalidation runs after commit: before it, a concurrent request would re-cache the old rows
+@receiver(post_delete, sender=Token, dispatch_uid="common_token_deleted")
+def token_deleted(sender, instance, using, **kwargs):
+    # Revocation: logout / key rotation deletes the token row
+    key = instance.key
+    transaction.on_commit(lambda: invalidate_tokens([key]), using=using)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="common_user_saved_tokens")
+def user_saved_tokens(sender, instance, using, **kwargs):
+    # Any user change (deactivation, staff flag, password) must not be served from a stale snapshot
+    keys = list(Token.objects.using(using).filter(user=instance).values_list("key", flat=True))
+    if keys:
+        transaction.on_commit(lambda: invalidate_tokens(keys), using=using)
+
+
+# -------------------------
+# Cached session users (apps.common.backends.CachedModelBackend)
+# -------------------------
+def invalidate_users_on_commit(user_ids, using) -> None:
+    # Ids are collected now, while the rows still say who is affected
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: invalidate_users(user_ids), using=using)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="common_user_saved")
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="common_user_deleted")
+def user_changed(sender, instance, using, **kwargs):
+    invalidate_users_on_commit([instance.pk], using)
+
+
+@receiver(m2m_changed, sender=UserModel.groups.through, dispatch_uid="common_user_groups_changed")
+@receiver(m2m_changed, sender=UserModel.user_permissions.through, dispatch_uid="common_user_permissions_changed")
+def user_m2m_changed(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action == "pre_clear" and reverse:
+        # group.user_set / permission.user_set is empty by post_clear
+        setattr(instance, CLEARED_IDS_ATTR, list(instance.user_set.values_list("pk", flat=True)))
+        return
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if not reverse:
+        # user.groups / user.user_permissions changed
+        invalidate_users_on_commit([instance.pk], using)
+    elif pk_set:
+        # group.user_set / permission.user_set changed
+        invalidate_users_on_commit(pk_set, using)
+    else:
+        # Reverse clear: every user attached to the group/permission before it
+        invalidate_users_on_commit(instance.__dict__.pop(CLEARED_IDS_ATTR, []), using)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through, dispatch_uid="common_group_permissions_changed")
+def group_permissions_changed(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action == "pre_clear" and reverse:
+        setattr(instance, CLEARED_IDS_ATTR, list(instance.group_set.values_list("pk", flat=True)))
+        return
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if not reverse:
+        groups = [instance.pk]
+    elif pk_set:
+        groups = pk_set
+    else:
+        groups = instance.__dict__.pop(CLEARED_IDS_ATTR, [])
+    if groups:
+        users = UserModel.objects.using(using).filter(groups__in=groups).values_list("pk", flat=True).distinct()
+        invalidate_users_on_commit(users, using)
+
+
+@receiver(pre_delete, sender=Group, dispatch_uid="common_group_deleted")
+def group_deleted(sender, instance, using, **kwargs):
+    # Membership rows cascade without m2m_changed, so collect users first
+    invalidate_users_on_commit(instance.user_set.values_list("pk", flat=True), using)
+
+
+@receiver(pre_delete, sender=Permission, dispatch_uid="common_permission_deleted")
+def permission_deleted(sender, instance, using, **kwargs):
+    direct = instance.user_set.values_list("pk", flat=True)
+    via_groups = UserModel.objects.using(using).filter(groups__permissions=instance).values_list("pk", flat=True)
+    invalidate_users_on_commit(set(direct) | set(via_groups), using)
+
+
+# -------------------------
+# Cached models
+# -------------------------
+def cached_model_changed(sender, instance, using, **kwargs):
+    invalidate_model(sender, using)
+
+
+# Connected per concrete model: a catch-all receiver would disable fast deletes everywhere
+for model in apps.get_models():
+    if issubclass(model, CachedModel):
+        post_save.connect(cached_model_changed, sender=model, dispatch_uid=f"common_cached_model_saved_{model._meta.label_lower}")
+        post_delete.connect(
+            cached_model_changed, sender=model, dispatch_uid=f"common_cached_model_deleted_{model._meta.label_lower}"
+        )
+
+
+# -------------------------
+# Database connection wrappers
+# -------------------------
+@receiver(connection_created, dispatch_uid="common_connection_traced")
+def connection_traced(sender, connection, **kwargs):
+    if tracing_config.TRACING_ENABLED:
+        install_query_tracing(connection)
+
+
+@receiver(connection_created, dispatch_uid="common_connection_deadline")
+def connection_deadline(sender, connection, **kwargs):
+    # Request budget (see apps.common.deadlines)
+    install_deadline_wrapper(connection)
+
+
+@receiver(connection_created, dispatch_uid="common_connection_query_stats")
+def connection_query_stats(sender, connection, **kwargs):
+    # Fleet-wide query statistics (see apps.common.slow_queries)
+    if slow_query_config.SLOW_QUERY_LOG_ENABLED:
+        install_query_stats(connection)
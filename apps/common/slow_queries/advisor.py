@@ -0,0 +1,113 @@
+import re
+
+# Django quotes identifiers with "..." (PostgreSQL, SQLite, Oracle) or `...` (MySQL)
+IDENTIFIER = r"[\"`]?(\w+)[\"`]?"
+COLUMN_RE = re.compile(rf"{IDENTIFIER}\.{IDENTIFIER}")
+TABLE_RE = re.compile(rf"\b(?:FROM|JOIN)\s+{IDENTIFIER}", re.I)
+
+# Predicates on a bare column: equality first in an index, then one range column
+# (LIKE is left out: after normalization a prefix match cannot be told from %contains%)
+EQUALITY_RE = re.compile(rf"{IDENTIFIER}\.{IDENTIFIER}\s*(?:=|\bIN\b|\bIS\b(?!\s+NOT))", re.I)
+RANGE_RE = re.compile(rf"{IDENTIFIER}\.{IDENTIFIER}\s*(?:<=|>=|<|>|\bBETWEEN\b)", re.I)
+
+# Clause boundaries
+WHERE_RE = re.compile(
+    r"\bWHERE\b(.*?)(?:\bGROUP BY\b|\bHAVING\b|\bORDER BY\b|\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)", re.I | re.S
+)
+ORDER_RE = re.compile(r"\bORDER BY\b(.*?)(?:\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)", re.I | re.S)
+
+# Full scans in captured plans, per vendor
+SCAN_PATTERNS = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    "sqlite": re.compile(r"^\s*SCAN (\w+)(?! USING (?:COVERING )?INDEX)", re.M),
+    "mysql": re.compile(r"\| (\w+) \|[^\n]*\| ALL \|"),
+}
+
+# Widest suggested index
+MAX_COLUMNS = 3
+
+
+def ordered_unique(items) -> list:
+    return list(dict.fromkeys(items))
+
+
+def scanned_tables(vendor: str, plan: str | None) -> set[str] | None:
+    """
+    Tables read with a full scan according to the plan (None when no plan or vendor pattern).
+    """
+    pattern = SCAN_PATTERNS.get(vendor)
+    if not plan or pattern is None:
+        return None
+    return set(pattern.findall(plan))
+
+
+def candidate_columns(sql: str) -> dict[str, list[str]]:
+    """
+    Index column candidates per table from the WHERE and ORDER BY clauses of normalized SQL.
+
+    Equality columns come first, then the first range column, then ORDER BY
+    columns of the same table (so the index can also serve the sort).
+    """
+    where = WHERE_RE.search(sql)
+    where_clause = where.group(1) if where else ""
+    order = ORDER_RE.search(sql)
+    order_clause = order.group(1) if order else ""
+
+    candidates: dict[str, list[str]] = {}
+    for table, column in ordered_unique(EQUALITY_RE.findall(where_clause)):
+        candidates.setdefault(table, []).append(column)
+    ranged = set()
+    for table, column in RANGE_RE.findall(where_clause):
+        if table not in ranged:
+            ranged.add(table)
+            candidates.setdefault(table, []).append(column)
+    for table, column in COLUMN_RE.findall(order_clause):
+        if table in candidates or not where_clause:
+            candidates.setdefault(table, []).append(column)
+
+    return {table: ordered_unique(columns)[:MAX_COLUMNS] for table, columns in candidates.items()}
+
+
+def existing_indexes(connection, table: str) -> list[list[str]]:
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return [
+        info["columns"] for info in constraints.values() if info.get("index") or info.get("primary_key") or info.get("unique")
+    ]
+
+
+def suggest_indexes(connection, sql: str, plan: str | None = None) -> list[dict]:
+    """
+    Candidate indexes for one normalized statement.
+
+    A candidate is dropped when an existing index already starts with its
+    leading column, or when a captured plan shows the table is not fully
+    scanned. Suggestions are heuristics to review, not migrations to apply.
+    """
+    known_tables = set(connection.introspection.table_names())
+    referenced = set(TABLE_RE.findall(sql))
+    scanned = scanned_tables(connection.vendor, plan)
+
+    suggestions = []
+    for table, columns in candidate_columns(sql).items():
+        if table not in known_tables or table not in referenced or not columns:
+            continue
+        if scanned is not None and table not in scanned:
+            continue
+        if any(index[:1] == columns[:1] for index in existing_indexes(connection, table)):
+            continue
+
+        quote = connection.ops.quote_name
+        name = f"{table}_{'_'.join(columns)}_idx"[:63]
+        concurrently = " CONCURRENTLY" if connection.vendor == "postgresql" else ""
+        column_list = ", ".join(quote(column) for column in columns)
+        reason = "full scan in captured plan" if scanned is not None else "filtered/sorted columns without a leading index"
+        suggestions.append(
+            {
+                "table": table,
+                "columns": columns,
+                "reason": reason,
+                "statement": f"CREATE INDEX{concurrently} {quote(name)} ON {quote(table)} ({column_list});",
+            }
+        )
+    return suggestions
@@ -0,0 +1,102 @@
+from contextvars import ContextVar
+import logging
+import re
+import time
+
+from django.db import transaction
+
+from apps.common.slow_queries.fingerprint import fingerprint
+from apps.common.slow_queries.stats import claim_explain, query_stats, store_plan
+from config.django.slow_queries import slow_query_config
+
+logger = logging.getLogger(__name__)
+
+# Only read statements are explained (plain EXPLAIN, the query itself is not re-run)
+EXPLAINABLE_RE = re.compile(r"^\s*(?:SELECT|WITH)\b", re.I)
+
+# Normalized SQL in log records is truncated to this length
+MAX_LOGGED_SQL = 1000
+
+# Set while a plan is being captured so the EXPLAIN itself is not recorded
+_explaining: ContextVar[bool] = ContextVar("slow_query_explaining", default=False)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    connection.execute_wrapper() hook: time every statement under its fingerprint.
+
+    Failed statements are counted too (a statement_timeout is the slowest
+    query of all); plans are only captured for successful slow SELECTs.
+    """
+    if _explaining.get():
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    succeeded = False
+    try:
+        result = execute(sql, params, many, context)
+        succeeded = True
+        return result
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        connection = context["connection"]
+        digest, normalized = fingerprint(sql)
+        slow = elapsed_ms >= slow_query_config.SLOW_QUERY_THRESHOLD_MS
+        query_stats.record(digest, normalized, connection.vendor, elapsed_ms, slow)
+        if slow:
+            logger.warning("Slow query %s on %s (%.1f ms): %s", digest, connection.alias, elapsed_ms, normalized[:MAX_LOGGED_SQL])
+            if succeeded and not many and slow_query_config.SLOW_QUERY_EXPLAIN:
+                capture_plan(connection, sql, params, digest, normalized, elapsed_ms)
+
+
+def capture_plan(connection, sql, params, digest: str, normalized: str, elapsed_ms: float) -> None:
+    """
+    EXPLAIN one sample of a slow statement, at most once per fingerprint per SLOW_QUERY_EXPLAIN_TTL fleet-wide.
+
+    Runs on a fresh cursor inside a savepoint so a failing EXPLAIN cannot
+    abort the caller's transaction; the caller's results are untouched.
+    """
+    if not EXPLAINABLE_RE.match(sql) or connection.needs_rollback or not claim_explain(digest):
+        return
+
+    token = _explaining.set(True)
+    try:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            rows = cursor.fetchall()
+    except Exception:
+        logger.debug("EXPLAIN failed for %s", digest, exc_info=True)
+        return
+    finally:
+        _explaining.reset(token)
+
+    store_plan(
+        digest,
+        {
+            "plan": format_plan(connection.vendor, rows),
+            "sql": normalized,
+            "duration_ms": round(elapsed_ms, 3),
+            "captured_at": int(time.time()),
+        },
+    )
+
+
+def format_plan(vendor: str, rows: list[tuple]) -> str:
+    """
+    Render EXPLAIN output as text (SQLite's QUERY PLAN rows become an indented tree).
+    """
+    if vendor == "sqlite":
+        depth = {0: -1}
+        lines = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node] + str(detail))
+        return "\n".join(lines)
+    if all(len(row) == 1 for row in rows):
+        return "\n".join(str(row[0]) for row in rows)
+    return "\n".join(" | ".join("" if value is None else str(value) for value in row) for row in rows)
+
+
+def install_query_stats(connection) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
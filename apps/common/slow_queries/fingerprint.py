@@ -0,0 +1,40 @@
+from functools import lru_cache
+import hashlib
+import re
+
+# Comments (including sqlcommenter-style tags) never change the statement shape
+COMMENT_RE = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+
+# Literals and placeholders of every paramstyle Django backends use
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+NUMBER_RE = re.compile(r"(?<![\w\"`.$])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.I)
+
+# IN (?, ?, ?) and multi-row VALUES lists vary with the data, not the query
+LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+ROWS_RE = re.compile(r"\((?:\?|\.\.\.)\)(?:\s*,\s*\((?:\?|\.\.\.)\))+")
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> tuple[str, str]:
+    """
+    Return (digest, normalized SQL) identifying the statement shape.
+
+    Literals and placeholders become `?`, value lists collapse to `(...)`,
+    so `WHERE id IN (%s, %s)` and `WHERE id IN (%s, %s, %s)` share a fingerprint.
+    Django emits the same parametrized text for the same query, hence the cache.
+
+    Example:
+        fingerprint("SELECT * FROM t WHERE a = 1 AND b IN (2, 3)")[1]
+        -> "SELECT * FROM t WHERE a = ? AND b IN (...)"
+    """
+    normalized = COMMENT_RE.sub(" ", str(sql))
+    normalized = STRING_RE.sub("?", normalized)
+    normalized = PLACEHOLDER_RE.sub("?", normalized)
+    normalized = NUMBER_RE.sub("?", normalized)
+    normalized = LIST_RE.sub("(...)", normalized)
+    normalized = ROWS_RE.sub("(...)", normalized)
+    normalized = WHITESPACE_RE.sub(" ", normalized).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest(), normalized
@@ -0,0 +1,235 @@
+import atexit
+from bisect import bisect_left
+import json
+import logging
+import os
+import threading
+import time
+
+from apps.common.functions.bulkhead import redis_client
+from config.django.slow_queries import slow_query_config
+
+logger = logging.getLogger(__name__)
+
+# Redis keys: one hash per fingerprint, sorted sets ranking fingerprints, one string per captured plan
+KEY_PREFIX = "slowq:"
+STATS_PREFIX = KEY_PREFIX + "fp:"
+PLAN_PREFIX = KEY_PREFIX + "plan:"
+EXPLAIN_LOCK_PREFIX = KEY_PREFIX + "explain:"
+TOTAL_INDEX = KEY_PREFIX + "index:total"
+MAX_INDEX = KEY_PREFIX + "index:max"
+
+# Latency histogram upper bounds (ms); merged across workers, p95 is read from it
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+def percentile(buckets: list[int], fraction: float, max_ms: float) -> float:
+    """
+    Upper bound of the histogram bucket holding the given fraction of calls (max_ms past the last bound).
+    """
+    total = sum(buckets)
+    if not total:
+        return 0.0
+    rank = fraction * total
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if seen >= rank:
+            return min(float(BUCKETS_MS[index]), max_ms) if index < len(BUCKETS_MS) else max_ms
+    return max_ms
+
+
+class QueryStatsBuffer:
+    """
+    Per-worker aggregation of query timings, merged into Redis in batches.
+
+    Recording is a dict update under a lock; at most every
+    SLOW_QUERY_FLUSH_INTERVAL seconds (or when too many fingerprints are
+    buffered) one thread pipelines the deltas into Redis. Redis failures drop
+    the batch: statistics are best effort and never fail a query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._last_flush = time.monotonic()
+        self.flush_errors = 0
+
+    def record(self, digest: str, normalized: str, vendor: str, elapsed_ms: float, slow: bool) -> None:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                entry = self._entries[digest] = {
+                    "sql": normalized,
+                    "vendor": vendor,
+                    "count": 0,
+                    "slow": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "buckets": [0] * (len(BUCKETS_MS) + 1),
+                }
+            entry["count"] += 1
+            entry["slow"] += slow
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["buckets"][bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+            due = (
+                len(self._entries) >= slow_query_config.SLOW_QUERY_MAX_FINGERPRINTS
+                or time.monotonic() - self._last_flush >= slow_query_config.SLOW_QUERY_FLUSH_INTERVAL
+            )
+        if due:
+            self.flush()
+
+    def discard(self) -> None:
+        # Forked workers start empty: the parent's unflushed deltas are flushed by the parent
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries = {}
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        # One flushing thread at a time; the others keep recording into a fresh buffer
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                entries, self._entries = self._entries, {}
+                self._last_flush = time.monotonic()
+            if entries:
+                self.write(entries)
+        finally:
+            self._flush_lock.release()
+
+    def write(self, entries: dict[str, dict]) -> None:
+        client = redis_client()
+        if client is None:
+            return
+        ttl = slow_query_config.SLOW_QUERY_STATS_TTL
+        now = int(time.time())
+        try:
+            pipe = client.pipeline(transaction=False)
+            for digest, entry in entries.items():
+                key = STATS_PREFIX + digest
+                pipe.hincrby(key, "count", entry["count"])
+                pipe.hincrby(key, "slow", entry["slow"])
+                pipe.hincrbyfloat(key, "total_ms", entry["total_ms"])
+                for index, count in enumerate(entry["buckets"]):
+                    if count:
+                        pipe.hincrby(key, f"b{index}", count)
+                pipe.hsetnx(key, "sql", entry["sql"])
+                pipe.hset(key, mapping={"vendor": entry["vendor"], "last_seen": now})
+                pipe.expire(key, ttl)
+                pipe.zincrby(TOTAL_INDEX, entry["total_ms"], digest)
+                pipe.zadd(MAX_INDEX, {digest: entry["max_ms"]}, gt=True)
+            pipe.expire(TOTAL_INDEX, ttl)
+            pipe.expire(MAX_INDEX, ttl)
+            pipe.execute()
+        except Exception:
+            self.flush_errors += 1
+            logger.warning("Dropped query statistics for %d fingerprints", len(entries), exc_info=True)
+
+
+query_stats = QueryStatsBuffer()
+atexit.register(query_stats.flush)
+os.register_at_fork(after_in_child=query_stats.discard)
+
+
+# -------------------------
+# Plans
+# -------------------------
+def claim_explain(digest: str) -> bool:
+    """
+    True for the one worker in the fleet allowed to capture this fingerprint's plan now.
+    """
+    client = redis_client()
+    if client is None:
+        return False
+    try:
+        return bool(client.set(EXPLAIN_LOCK_PREFIX + digest, 1, nx=True, ex=slow_query_config.SLOW_QUERY_EXPLAIN_TTL))
+    except Exception:
+        logger.debug("Explain claim failed for %s", digest, exc_info=True)
+        return False
+
+
+def store_plan(digest: str, plan: dict) -> None:
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        client.set(PLAN_PREFIX + digest, json.dumps(plan), ex=slow_query_config.SLOW_QUERY_STATS_TTL)
+    except Exception:
+        logger.debug("Plan for %s not stored", digest, exc_info=True)
+
+
+# -------------------------
+# Reading (report command)
+# -------------------------
+def decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def load_stats(limit: int | None = None) -> list[dict]:
+    """
+    Fleet-wide statistics per fingerprint, ordered by total time (heaviest first).
+    """
+    client = redis_client()
+    if client is None:
+        raise RuntimeError("Query statistics need the Redis shared cache")
+
+    digests = [decode(digest) for digest in client.zrevrange(TOTAL_INDEX, 0, -1 if limit is None else limit - 1)]
+    if not digests:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for digest in digests:
+        pipe.hgetall(STATS_PREFIX + digest)
+        pipe.zscore(MAX_INDEX, digest)
+        pipe.get(PLAN_PREFIX + digest)
+    replies = pipe.execute()
+
+    results = []
+    expired = []
+    for index, digest in enumerate(digests):
+        raw, max_ms, plan = replies[index * 3 : index * 3 + 3]
+        if not raw:
+            expired.append(digest)
+            continue
+        fields = {decode(key): decode(value) for key, value in raw.items()}
+        count = int(fields.get("count", 0))
+        total_ms = float(fields.get("total_ms", 0))
+        max_ms = float(max_ms or 0)
+        buckets = [int(fields.get(f"b{bucket}", 0)) for bucket in range(len(BUCKETS_MS) + 1)]
+        results.append(
+            {
+                "fingerprint": digest,
+                "sql": fields.get("sql", ""),
+                "vendor": fields.get("vendor", ""),
+                "count": count,
+                "slow": int(fields.get("slow", 0)),
+                "total_ms": round(total_ms, 3),
+                "mean_ms": round(total_ms / count, 3) if count else 0.0,
+                "p95_ms": percentile(buckets, 0.95, max_ms),
+                "max_ms": round(max_ms, 3),
+                "last_seen": int(fields.get("last_seen", 0)),
+                "plan": json.loads(plan) if plan else None,
+            }
+        )
+
+    if expired:
+        # Hashes expire on their own; drop their ranking entries too
+        client.zrem(TOTAL_INDEX, *expired)
+        client.zrem(MAX_INDEX, *expired)
+    return results
+
+
+def reset_stats() -> int:
+    """
+    Delete every statistic, plan and explain claim; returns the number of keys removed.
+    """
+    client = redis_client()
+    if client is None:
+        raise RuntimeError("Query statistics need the Redis shared cache")
+    keys = list(client.scan_iter(match=KEY_PREFIX + "*", count=1000))
+    if keys:
+        client.delete(*keys)
+    return len(keys)
@@ -0,0 +1,164 @@
+"""
+Server-Sent Events push channel.
+
+Publishing (from any sync code, e.g. after a write):
+
+    publish_event_on_commit("order.updated", {"id": order.pk}, topic=f"orders:{order.pk}")
+    publish_event("notification", {...}, user=request.user.pk)
+
+Subscribing: `GET /events/?topic=orders:42` with a session cookie
+(EventSource) or `Authorization: Token ...`. Every stream also receives
+the user's own channel. Topics are allowed by authorizers declared in a
+`topics` module (discovered like `admin`); undeclared topics are refused:
+
+    @topic("orders")
+    def can_follow_order(user, name):  # name: "orders:42"
+        return Order.objects.filter(pk=name.split(":")[1], owner=user).exists()
+
+Each event is appended to a bounded per-channel Redis stream (for
+`Last-Event-ID` resume) and published on the channel in one script.
+Event ids come from one counter, so they are ordered across channels.
+"""
+
+from collections.abc import Callable
+import json
+import logging
+import re
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import autodiscover_modules
+
+from apps.common.functions.bulkhead import redis_client
+from config.django.sse import sse_config
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "sse:"
+SEQUENCE_KEY = f"{KEY_PREFIX}seq"
+
+# "orders", "orders:42", "reports.daily:eu-1"
+TOPIC_RE = re.compile(r"^[\w.-]+(?::[\w.-]+)*$")
+MAX_TOPIC_LENGTH = 200
+
+# Append to the channel log and publish, under one id from the shared counter (atomic).
+# If the counter was evicted while the log survived, it continues after the log's last id.
+PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local top = redis.call('XREVRANGE', KEYS[2], '+', '-', 'COUNT', 1)[1]
+if top then
+    local last = tonumber(string.match(top[1], '^%d+'))
+    if seq <= last then
+        seq = last + 1
+        redis.call('SET', KEYS[1], seq)
+    end
+end
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[1], seq .. '-0', 'event', ARGV[3], 'data', ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('PUBLISH', KEYS[3], seq .. '\\n' .. ARGV[3] .. '\\n' .. ARGV[4])
+return seq
+"""
+
+_publish_script = None
+
+
+class TopicError(Exception):
+    """
+    Invalid topic name or declaration.
+    """
+
+
+def topic_channel(name: str) -> str:
+    if len(name) > MAX_TOPIC_LENGTH or not TOPIC_RE.match(name):
+        raise TopicError(f"Invalid topic {name!r}")
+    return f"{KEY_PREFIX}topic:{name}"
+
+
+def user_channel(user_id) -> str:
+    return f"{KEY_PREFIX}user:{user_id}"
+
+
+def log_key(channel: str) -> str:
+    return f"{channel}:log"
+
+
+# -------------------------
+# Topic authorization
+# -------------------------
+# Authorizers by topic prefix ("orders" covers "orders" and "orders:42")
+topic_authorizers: dict[str, Callable] = {}
+
+
+def register_topic(prefix: str, authorize: Callable) -> None:
+    if prefix in topic_authorizers and topic_authorizers[prefix] is not authorize:
+        raise TopicError(f"Topic {prefix!r} is already registered")
+    topic_authorizers[prefix] = authorize
+
+
+def topic(prefix: str):
+    """
+    Decorator declaring who may subscribe to topics under `prefix`: authorize(user, name) -> bool.
+    """
+
+    def decorator(func):
+        register_topic(prefix, func)
+        return func
+
+    return decorator
+
+
+def autodiscover() -> None:
+    # Import `<app>.topics` of every installed app
+    autodiscover_modules("topics")
+
+
+def authorize_topic(user, name: str) -> bool:
+    authorize = topic_authorizers.get(name.split(":", 1)[0])
+    return authorize is not None and bool(authorize(user, name))
+
+
+# -------------------------
+# Publishing
+# -------------------------
+def publish(channel: str, event: str, data) -> int | None:
+    """
+    Publish one event on `channel`; returns its id (None when Redis is unavailable).
+    """
+    global _publish_script
+    if "\n" in event:
+        raise ValueError("Event names cannot contain newlines")
+    client = redis_client()
+    if client is None:
+        logger.warning("Event %s not published: no Redis shared cache", event)
+        return None
+    if _publish_script is None:
+        _publish_script = client.register_script(PUBLISH_SCRIPT)
+    payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    try:
+        keys = [SEQUENCE_KEY, log_key(channel), channel]
+        args = [sse_config.SSE_STREAM_MAXLEN, sse_config.SSE_STREAM_TTL, event, payload]
+        return int(_publish_script(keys=keys, args=args, client=client))
+    except Exception:
+        logger.warning("Publishing event %s on %s failed", event, channel, exc_info=True)
+        return None
+
+
+def publish_event(event: str, data, topic: str | None = None, user=None) -> list[int | None]:
+    """
+    Publish to a topic, a user's channel, or both (`user`: user or primary key).
+    """
+    channels = []
+    if topic is not None:
+        channels.append(topic_channel(topic))
+    if user is not None:
+        channels.append(user_channel(getattr(user, "pk", user)))
+    if not channels:
+        raise TopicError("publish_event() needs a topic or a user")
+    return [publish(channel, event, data) for channel in channels]
+
+
+def publish_event_on_commit(event: str, data, topic: str | None = None, user=None, using: str | None = None) -> None:
+    # Subscribers refetch on events: never announce rows they cannot read yet
+    if topic is not None:
+        topic_channel(topic)
+    transaction.on_commit(lambda: publish_event(event, data, topic, user), using=using)
@@ -0,0 +1,156 @@
+import asyncio
+from importlib import import_module
+import io
+import json
+import logging
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from redis.exceptions import RedisError
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.common.authentication import CachedTokenAuthentication
+from apps.common.sse import TopicError, authorize_topic, autodiscover, topic_channel, user_channel
+from apps.common.sse.broker import CLOSED_DISCONNECT, get_broker
+from config.django.sse import sse_config
+
+logger = logging.getLogger(__name__)
+
+STREAM_HEADERS = [
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+    (b"cache-control", b"no-store"),
+    # nginx would otherwise buffer the stream
+    (b"x-accel-buffering", b"no"),
+]
+
+_discovered = False
+
+
+class StreamRefused(Exception):
+    def __init__(self, status: int, detail: str, headers: list | None = None):
+        super().__init__(detail)
+        self.status = status
+        self.headers = headers or []
+
+
+def authenticate(scope) -> tuple[object, list[str]]:
+    """
+    Resolve the user (session cookie, then token header) and the channels they may follow.
+
+    Runs once per connection in the default thread pool (not the shared
+    sync thread, so a reconnect storm does not queue behind requests).
+    """
+    global _discovered
+    close_old_connections()
+    try:
+        if not _discovered:
+            autodiscover()
+            _discovered = True
+        request = ASGIRequest(scope, io.BytesIO())
+        engine = import_module(settings.SESSION_ENGINE)
+        request.session = engine.SessionStore(request.COOKIES.get(settings.SESSION_COOKIE_NAME))
+        user = get_user(request)
+        if not user.is_authenticated:
+            try:
+                resolved = CachedTokenAuthentication().authenticate(request)
+            except AuthenticationFailed:
+                resolved = None
+            if resolved is None:
+                raise StreamRefused(401, "Authentication credentials were not provided.")
+            user = resolved[0]
+
+        topics = list(dict.fromkeys(request.GET.getlist("topic")))
+        if len(topics) > sse_config.SSE_MAX_TOPICS:
+            raise StreamRefused(400, f"At most {sse_config.SSE_MAX_TOPICS} topics per stream.")
+        channels = [user_channel(user.pk)]
+        for name in topics:
+            try:
+                channel = topic_channel(name)
+            except TopicError as exc:
+                raise StreamRefused(400, str(exc)) from exc
+            if not authorize_topic(user, name):
+                raise StreamRefused(403, f"Not allowed to follow {name}.")
+            channels.append(channel)
+        return user, channels
+    finally:
+        close_old_connections()
+
+
+def last_event_id(scope) -> int | None:
+    # Header from EventSource reconnects; query parameter for the first connection of a reloaded page
+    for name, value in scope.get("headers", ()):
+        if name == b"last-event-id":
+            raw = value.decode("latin-1")
+            break
+    else:
+        raw = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("lastEventId", [""])[0]
+    return int(raw) if raw.isdigit() else None
+
+
+async def refuse(send, status: int, detail: str, headers: list | None = None) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    response_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()), *(headers or [])]
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def stream_events(scope, receive, send) -> None:
+    if scope["method"] != "GET":
+        await refuse(send, 405, "Method not allowed.", [(b"allow", b"GET")])
+        return
+    broker = get_broker()
+    if broker.connections >= sse_config.SSE_MAX_CONNECTIONS:
+        await refuse(send, 503, "Too many event streams.", [(b"retry-after", b"5")])
+        return
+    try:
+        _, channels = await sync_to_async(authenticate, thread_sensitive=False)(scope)
+        subscriber = await broker.attach(channels, last_event_id(scope))
+    except StreamRefused as exc:
+        await refuse(send, exc.status, str(exc), exc.headers)
+        return
+    except (OSError, RedisError):
+        logger.warning("Event stream refused: broker unavailable", exc_info=True)
+        await refuse(send, 503, "Event stream unavailable.", [(b"retry-after", b"5")])
+        return
+
+    async def watch_disconnect():
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        subscriber.close(CLOSED_DISCONNECT)
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        await send({"type": "http.response.start", "status": 200, "headers": STREAM_HEADERS})
+        await send({"type": "http.response.body", "body": f"retry: {sse_config.SSE_RETRY_MS}\n\n".encode(), "more_body": True})
+        while frames := await subscriber.drain():
+            # Awaiting send() is the backpressure: a slow client stops draining and its buffer fills up
+            await send({"type": "http.response.body", "body": b"".join(frames), "more_body": True})
+        if subscriber.closed != CLOSED_DISCONNECT:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+    except OSError:
+        # Client went away mid-write
+        pass
+    finally:
+        watcher.cancel()
+        await broker.detach(subscriber)
+
+
+class EventStreamASGIMiddleware:
+    """
+    ASGI wrapper serving SSE_PATH before Django's handler.
+
+    Streams skip middleware, URL resolution and the per-request thread hop;
+    an idle stream costs one coroutine, one task and a small Subscriber.
+    """
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and sse_config.SSE_ENABLED and scope.get("path") == sse_config.SSE_PATH:
+            return await stream_events(scope, receive, send)
+        return await self.application(scope, receive, send)
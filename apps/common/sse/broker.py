@@ -0,0 +1,354 @@
+import asyncio
+from collections import deque
+import logging
+import time
+import weakref
+
+from redis import asyncio as aioredis
+
+from apps.common.sse import KEY_PREFIX, log_key
+from config.django.cache import cache_config
+from config.django.sse import sse_config
+
+logger = logging.getLogger(__name__)
+
+# Keeps the pub/sub connection subscribed while no client is
+CONTROL_CHANNEL = f"{KEY_PREFIX}control"
+
+HEARTBEAT_FRAME = b":\n\n"
+
+# Why a stream ended
+CLOSED_DISCONNECT = "disconnect"
+CLOSED_OVERFLOW = "overflow"  # client too slow; it resumes from the channel log
+CLOSED_MAX_AGE = "max_age"
+CLOSED_BROKER = "broker"  # pub/sub connection lost; events may have been missed, clients resume
+
+# Seconds to wait for Redis to confirm a subscription
+SUBSCRIBE_TIMEOUT = 5.0
+# Backoff bounds (seconds) while the pub/sub connection is down
+RECONNECT_MIN = 0.5
+RECONNECT_MAX = 10.0
+
+
+def event_frame(seq: int, event: str, data: str) -> bytes:
+    # Payloads are compact JSON: a single data line
+    return f"id: {seq}\nevent: {event}\ndata: {data}\n\n".encode()
+
+
+class Subscriber:
+    """
+    One open stream: a bounded frame buffer and a wake-up future.
+
+    Deliberately small (no task, queue or timer of its own): a worker keeps
+    tens of thousands of them, almost all idle.
+    """
+
+    __slots__ = ("channels", "frames", "waiter", "closed", "last_id", "held", "connected_at", "active")
+
+    def __init__(self, channels: list[str], last_id: int | None):
+        self.channels = channels
+        self.frames: deque[bytes] = deque()
+        self.waiter: asyncio.Future | None = None
+        self.closed: str | None = None
+        self.last_id = last_id or 0
+        # Live frames arriving while the replay is read
+        self.held: list[tuple[int, bytes]] | None = [] if last_id is not None else None
+        self.connected_at = time.monotonic()
+        # Something was sent since the last heartbeat round
+        self.active = False
+
+    def push(self, seq: int, frame: bytes) -> bool:
+        """
+        Queue a frame; False (and the stream closed) when the buffer is full.
+        """
+        if self.closed is not None:
+            return False
+        if self.held is not None:
+            self.held.append((seq, frame))
+            if len(self.held) > sse_config.SSE_BUFFER_SIZE:
+                self.close(CLOSED_OVERFLOW)
+                return False
+            return True
+        if seq and seq <= self.last_id:
+            # Already delivered by the replay
+            return True
+        if len(self.frames) >= sse_config.SSE_BUFFER_SIZE:
+            self.close(CLOSED_OVERFLOW)
+            return False
+        self.frames.append(frame)
+        if seq:
+            self.last_id = seq
+        self.active = True
+        self.wake()
+        return True
+
+    def release_held(self, replayed: list[tuple[int, bytes]]) -> None:
+        # Replay first, then what went live meanwhile, without duplicates
+        held, self.held = self.held or [], None
+        for seq, frame in replayed:
+            self.frames.append(frame)
+            self.last_id = max(self.last_id, seq)
+        for seq, frame in held:
+            self.push(seq, frame)
+        self.wake()
+
+    def close(self, reason: str) -> None:
+        if self.closed is None:
+            self.closed = reason
+            self.wake()
+
+    def wake(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def drain(self) -> list[bytes]:
+        """
+        Wait for frames; an empty list means the stream is closed and flushed.
+        """
+        while not self.frames and self.closed is None:
+            self.waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self.waiter
+            finally:
+                self.waiter = None
+        frames = list(self.frames)
+        self.frames.clear()
+        return frames
+
+
+class Broker:
+    """
+    Per-worker fan-out: one Redis pub/sub connection, subscribed to each
+    channel while at least one local stream wants it.
+
+    A frame is encoded once per event and shared by every subscriber. When
+    the pub/sub connection fails, every stream is closed so clients resume
+    from the channel logs instead of silently missing events.
+    """
+
+    def __init__(self):
+        self.redis = aioredis.Redis(
+            host=cache_config.REDIS_HOST,
+            port=cache_config.REDIS_PORT,
+            db=cache_config.REDIS_DB,
+            password=cache_config.REDIS_PASSWORD.get_secret_value() or None,
+            socket_connect_timeout=cache_config.SOCKET_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        self.pubsub = None
+        self.subscribers: dict[str, set[Subscriber]] = {}
+        self.confirmed: dict[str, asyncio.Future] = {}
+        self.connections = 0
+        self.connected = False
+        self.started = False
+        self.ready: asyncio.Future | None = None
+        self.tasks: set[asyncio.Task] = set()
+        self.stats = {"delivered": 0, "replayed": 0, "resets": 0, "heartbeats": 0, "closed_overflow": 0, "broker_errors": 0}
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    async def start(self) -> None:
+        if not self.started:
+            self.started = True
+            self.ready = asyncio.get_running_loop().create_future()
+            for coroutine in (self.read(), self.heartbeat()):
+                self.tasks.add(asyncio.create_task(coroutine))
+        await asyncio.wait_for(asyncio.shield(self.ready), SUBSCRIBE_TIMEOUT)
+        if not self.connected:
+            raise ConnectionError("Event broker is not connected")
+
+    async def connect(self) -> None:
+        self.pubsub = self.redis.pubsub()
+        await self.pubsub.subscribe(CONTROL_CHANNEL)
+
+    def reset(self) -> None:
+        # Streams can no longer be trusted to be complete
+        for subscribers in list(self.subscribers.values()):
+            for subscriber in list(subscribers):
+                subscriber.close(CLOSED_BROKER)
+        self.subscribers.clear()
+        for future in self.confirmed.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Event broker disconnected"))
+                # Waiters (if any) see it through shield(); don't report it as never retrieved
+                future.exception()
+        self.confirmed.clear()
+
+    async def read(self) -> None:
+        delay = RECONNECT_MIN
+        while True:
+            try:
+                await self.connect()
+                self.connected = True
+                if not self.ready.done():
+                    self.ready.set_result(None)
+                delay = RECONNECT_MIN
+                while True:
+                    message = await self.pubsub.get_message(timeout=sse_config.SSE_HEARTBEAT_INTERVAL)
+                    if message is not None:
+                        self.dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.stats["broker_errors"] += 1
+                self.connected = False
+                if not self.ready.done():
+                    # First attempt failed: new streams are refused instead of waiting
+                    self.ready.set_result(None)
+                logger.warning("Event broker connection failed, retrying in %.1fs", delay, exc_info=True)
+                self.reset()
+                if self.pubsub is not None:
+                    try:
+                        await self.pubsub.aclose()
+                    except Exception:
+                        pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX)
+
+    def dispatch(self, message: dict) -> None:
+        channel = message["channel"].decode()
+        if message["type"] == "subscribe":
+            future = self.confirmed.get(channel)
+            if future is not None and not future.done():
+                future.set_result(None)
+            return
+        if message["type"] != "message":
+            return
+        subscribers = self.subscribers.get(channel)
+        if not subscribers:
+            return
+        seq, event, data = message["data"].decode().split("\n", 2)
+        frame = event_frame(int(seq), event, data)
+        for subscriber in list(subscribers):
+            was_open = subscriber.closed is None
+            if subscriber.push(int(seq), frame):
+                self.stats["delivered"] += 1
+            elif was_open:
+                self.stats["closed_overflow"] += 1
+
+    async def heartbeat(self) -> None:
+        # One loop for every stream instead of a timer per connection
+        while True:
+            await asyncio.sleep(sse_config.SSE_HEARTBEAT_INTERVAL)
+            now = time.monotonic()
+            seen = set()
+            for subscribers in self.subscribers.values():
+                for subscriber in subscribers:
+                    if subscriber in seen:
+                        continue
+                    seen.add(subscriber)
+                    if now - subscriber.connected_at > sse_config.SSE_MAX_AGE:
+                        subscriber.close(CLOSED_MAX_AGE)
+                    elif not subscriber.active and not subscriber.frames:
+                        subscriber.frames.append(HEARTBEAT_FRAME)
+                        subscriber.wake()
+                        self.stats["heartbeats"] += 1
+                    subscriber.active = False
+
+    # -------------------------
+    # Streams
+    # -------------------------
+    async def attach(self, channels: list[str], last_id: int | None) -> Subscriber:
+        """
+        Subscribe a new stream; with `last_id`, events after it are replayed first.
+        """
+        await self.start()
+        subscriber = Subscriber(channels, last_id)
+        new_channels = []
+        for channel in channels:
+            if channel not in self.subscribers:
+                self.subscribers[channel] = set()
+                self.confirmed[channel] = asyncio.get_running_loop().create_future()
+                new_channels.append(channel)
+            self.subscribers[channel].add(subscriber)
+        self.connections += 1
+        try:
+            if new_channels:
+                await self.pubsub.subscribe(*new_channels)
+            confirmations = [self.confirmed.get(channel) for channel in channels]
+            if None in confirmations:
+                # reset() ran while subscribing: the pub/sub connection was lost
+                raise ConnectionError("Event broker disconnected")
+            # Live events flow once Redis confirmed every subscription; the replay can't leave a gap
+            await asyncio.wait_for(asyncio.gather(*(asyncio.shield(future) for future in confirmations)), SUBSCRIBE_TIMEOUT)
+            if last_id is not None:
+                subscriber.release_held(await self.replay(subscriber, channels, last_id))
+        except BaseException:
+            await self.detach(subscriber)
+            raise
+        return subscriber
+
+    async def replay(self, subscriber: Subscriber, channels: list[str], last_id: int) -> list[tuple[int, bytes]]:
+        entries = []
+        gap = False
+        for channel in channels:
+            key = log_key(channel)
+            rows = await self.redis.xrange(key, min=f"({last_id}-0", max="+", count=sse_config.SSE_STREAM_MAXLEN + 1)
+            entries.extend((int(entry_id.split(b"-")[0]), fields) for entry_id, fields in rows)
+            if rows or await self.redis.exists(key):
+                gap = gap or await self.trimmed_after(key, last_id)
+
+        if gap or len(entries) > sse_config.SSE_STREAM_MAXLEN:
+            # Events were trimmed away: the client has to reload its state
+            self.stats["resets"] += 1
+            return [(0, b"event: reset\ndata: {}\n\n")]
+        entries.sort(key=lambda entry: entry[0])
+        self.stats["replayed"] += len(entries)
+        return [(seq, event_frame(seq, fields[b"event"].decode(), fields[b"data"].decode())) for seq, fields in entries]
+
+    async def trimmed_after(self, key: str, last_id: int) -> bool:
+        # Redis 7+: the highest id trimmed away; older servers can't tell
+        try:
+            info = await self.redis.xinfo_stream(key)
+        except Exception:
+            return False
+        deleted = info.get("max-deleted-entry-id")
+        if not deleted:
+            return False
+        deleted = deleted.decode() if isinstance(deleted, bytes) else deleted
+        return int(deleted.split("-")[0]) > last_id
+
+    async def detach(self, subscriber: Subscriber) -> None:
+        self.connections -= 1
+        subscriber.close(CLOSED_DISCONNECT)
+        gone = []
+        for channel in subscriber.channels:
+            subscribers = self.subscribers.get(channel)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.subscribers[channel]
+                self.confirmed.pop(channel, None)
+                gone.append(channel)
+        if gone and self.pubsub is not None:
+            try:
+                await self.pubsub.unsubscribe(*gone)
+            except Exception:
+                # The reader notices the broken connection and resets
+                logger.debug("Unsubscribing %s failed", gone, exc_info=True)
+
+    def metrics(self) -> dict:
+        return {"connections": self.connections, "channels": len(self.subscribers), **self.stats}
+
+
+# One broker per event loop (per ASGI worker process)
+_brokers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_broker() -> Broker:
+    loop = asyncio.get_running_loop()
+    broker = _brokers.get(loop)
+    if broker is None:
+        broker = _brokers[loop] = Broker()
+    return broker
+
+
+def event_stream_metrics() -> dict:
+    totals: dict[str, int] = {}
+    for broker in list(_brokers.values()):
+        for name, value in broker.metrics().items():
+            totals[name] = totals.get(name, 0) + value
+    return totals
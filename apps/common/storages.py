@@ -0,0 +1,160 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import json
+import os
+
+from django.conf import settings
+from whitenoise.compress import Compressor
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from config.django.static import static_config
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstd variants are optional
+    zstandard = None
+
+
+# Suffix used for zstd variants (served by apps.common.middleware.static_files)
+ZSTD_SUFFIX = ".zst"
+
+
+def _compress_file(full_path: str, extensions: list[str] | None, zstd_level: int) -> list[str]:
+    """
+    Compress a single file into every enabled codec.
+
+    Runs inside a worker process, so it only receives picklable arguments
+    and builds its own whitenoise Compressor.
+    """
+    compressor = Compressor(extensions=extensions, quiet=True)
+    written = list(compressor.compress(full_path))
+
+    # -------------------------
+    # zstd variant
+    # -------------------------
+    if zstandard is not None and zstd_level:
+        with open(full_path, "rb") as f:
+            stat_result = os.fstat(f.fileno())
+            data = f.read()
+        compressed = zstandard.ZstdCompressor(level=zstd_level).compress(data)
+        if compressor.is_compressed_effectively("Zstd", full_path, len(data), compressed):
+            written.append(compressor.write_data(full_path, compressed, ZSTD_SUFFIX, stat_result))
+
+    return written
+
+
+def _content_hash(full_path: str) -> str:
+    # Streamed hash keeps memory flat for large assets
+    digest = hashlib.blake2b(digest_size=16)
+    with open(full_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParallelCompressedManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    WhiteNoise manifest storage with parallel, multi-codec compression.
+
+    Differences from the upstream storage:
+    - Compression runs in a process pool instead of a GIL-bound thread pool.
+    - zstd variants are written next to gzip/brotli when `zstandard` is installed.
+    - Files whose content hash is unchanged since the last build are skipped.
+    - A stat index of STATIC_ROOT is written for IndexedWhiteNoiseMiddleware.
+    """
+
+    # Persisted content hashes of compressed files (relative to STATIC_ROOT)
+    compress_manifest_name = "staticfiles-compress.json"
+
+    # Precomputed stat index consumed at server startup
+    index_name = "staticfiles-index.json"
+
+    def post_process(self, *args, **kwargs):
+        yield from super().post_process(*args, **kwargs)
+
+        if not kwargs.get("dry_run"):
+            self.write_index()
+
+    def compress_files(self, paths):
+        extensions = getattr(settings, "WHITENOISE_SKIP_COMPRESS_EXTENSIONS", None)
+        self.compressor = self.create_compressor(extensions=extensions, quiet=True)
+
+        previous = self.load_compress_manifest()
+        current: dict[str, dict] = {}
+        pending: dict[str, str] = {}
+
+        for path in paths:
+            if not self.compressor.should_compress(path):
+                continue
+
+            # -------------------------
+            # Skip unchanged files
+            # -------------------------
+            full_path = self.path(path)
+            content_hash = _content_hash(full_path)
+            entry = previous.get(path)
+            if entry and entry["hash"] == content_hash and self._variants_exist(entry["variants"]):
+                current[path] = entry
+                for variant in entry["variants"]:
+                    yield path, variant
+                continue
+
+            current[path] = {"hash": content_hash, "variants": []}
+            pending[full_path] = path
+
+        # -------------------------
+        # Parallel compression
+        # -------------------------
+        if pending:
+            zstd_level = static_config.STATIC_COMPRESS_ZSTD_LEVEL
+            with ProcessPoolExecutor(max_workers=static_config.STATIC_COMPRESS_WORKERS or None) as executor:
+                futures = {executor.submit(_compress_file, full_path, extensions, zstd_level): full_path for full_path in pending}
+                for future in as_completed(futures):
+                    full_path = futures[future]
+                    path = pending[full_path]
+                    prefix_len = len(full_path) - len(path)
+                    for compressed_path in future.result():
+                        compressed_name = compressed_path[prefix_len:]
+                        current[path]["variants"].append(compressed_name)
+                        yield path, compressed_name
+
+        self.save_compress_manifest(current)
+
+    def _variants_exist(self, variants: list[str]) -> bool:
+        return all(os.path.exists(self.path(variant)) for variant in variants)
+
+    def load_compress_manifest(self) -> dict:
+        try:
+            with open(self.path(self.compress_manifest_name), encoding="utf-8") as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_compress_manifest(self, files: dict) -> None:
+        with open(self.path(self.compress_manifest_name), "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": files}, f)
+
+    def write_index(self) -> None:
+        """
+        Write a {relative_path: [mode, size, mtime]} index of STATIC_ROOT.
+
+        Lets the middleware build its file table without walking the tree.
+        """
+        root = self.location.rstrip(os.path.sep) + os.path.sep
+        skip = {self.compress_manifest_name, self.index_name}
+        files = {}
+
+        stack = [root]
+        while stack:
+            for entry in os.scandir(stack.pop()):
+                if entry.is_dir():
+                    stack.append(entry.path)
+                    continue
+                relative_path = entry.path[len(root) :]
+                if relative_path in skip:
+                    continue
+                stat_result = entry.stat()
+                files[relative_path] = [stat_result.st_mode, stat_result.st_size, stat_result.st_mtime]
+
+        with open(self.path(self.index_name), "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": files}, f)
@@ -0,0 +1,33 @@
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_login_failed
+from django.test import TestCase
+
+
+class CachedModelBackendAuthenticateTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="alice", password="correct horse")
+        self.check = self.enterContext(
+            mock.patch.object(ModelBackend, "authenticate", autospec=True, side_effect=ModelBackend.authenticate)
+        )
+
+    def test_valid_credentials_record_the_cached_backend(self):
+        user = authenticate(username="alice", password="correct horse")
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.backend, "apps.common.backends.CachedModelBackend")
+        self.assertEqual(self.check.call_count, 1)
+
+    def test_invalid_credentials_are_checked_once(self):
+        failed = mock.Mock()
+        user_login_failed.connect(failed)
+        self.addCleanup(user_login_failed.disconnect, failed)
+
+        self.assertIsNone(authenticate(username="alice", password="wrong"))
+        self.assertIsNone(authenticate(username="nobody", password="wrong"))
+
+        # ModelBackend (listed for existing sessions) is not consulted again
+        self.assertEqual(self.check.call_count, 2)
+        self.assertEqual(failed.call_count, 2)
@@ -0,0 +1,81 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection, models
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import isolate_apps
+
+from apps.common.functions.bulk_upsert import UpsertStrategyChoices, array_literal, copy_value
+from apps.common.models import BulkUpsertQuerySet
+
+
+class CopyValueTests(SimpleTestCase):
+    def test_array_literal(self):
+        self.assertEqual(array_literal([1, 2]), '{"1","2"}')
+        self.assertEqual(array_literal([]), "{}")
+        self.assertEqual(array_literal([[1, None], [True, False]]), '{{"1",NULL},{"t","f"}}')
+        # Array quoting first, then CSV quoting in copy_value()
+        self.assertEqual(array_literal(["a,b", 'say "hi"', "back\\slash"]), '{"a,b","say \\"hi\\"","back\\\\slash"}')
+
+    def test_json_null(self):
+        field = models.JSONField(null=True)
+        self.assertEqual(copy_value(field, None, connection), "\\N")
+        self.assertEqual(copy_value(field, models.Value(None, models.JSONField()), connection), '"null"')
+        self.assertEqual(copy_value(field, {"a": [1, None]}, connection), '"{""a"": [1, null]}"')
+
+
+class BatchedUpsertTests(TestCase):
+    def test_insert_then_update(self):
+        UserModel = get_user_model()
+        queryset = BulkUpsertQuerySet(UserModel)
+        users = [UserModel(username=f"user-{index}", first_name="a") for index in range(5)]
+
+        created = queryset.bulk_upsert(users, ["username"], ["first_name"], strategy=UpsertStrategyChoices.BULK_CREATE)
+        users = [UserModel(username=f"user-{index}", first_name="b") for index in range(3, 8)]
+        updated = queryset.bulk_upsert(users, ["username"], ["first_name"], strategy=UpsertStrategyChoices.BULK_CREATE)
+
+        self.assertEqual((created.created, created.updated), (5, 0))
+        self.assertEqual((updated.created, updated.updated), (3, 2))
+        self.assertEqual(UserModel.objects.filter(first_name="b").count(), 5)
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY upserts require PostgreSQL")
+class CopyUpsertPostgreSQLTests(TestCase):
+    @isolate_apps("apps.common")
+    def test_arrays_and_json_round_trip(self):
+        from django.contrib.postgres.fields import ArrayField
+
+        class Reading(models.Model):
+            sensor = models.CharField(max_length=50, unique=True)
+            values = ArrayField(models.IntegerField(null=True), default=list)
+            labels = ArrayField(models.TextField(), default=list)
+            payload = models.JSONField(null=True)
+
+            class Meta:
+                app_label = "common"
+
+        with connection.schema_editor() as editor:
+            editor.create_model(Reading)
+
+        queryset = BulkUpsertQuerySet(Reading)
+        rows = [
+            Reading(sensor="a", values=[1, None, 3], labels=["x,y", 'say "hi"', "back\\slash"], payload={"k": [1, None]}),
+            Reading(sensor="b", values=[], labels=[], payload=None),
+            Reading(sensor="c", payload=models.Value(None, models.JSONField())),
+        ]
+        result = queryset.bulk_upsert(rows, ["sensor"], strategy=UpsertStrategyChoices.COPY)
+        self.assertEqual((result.created, result.updated), (3, 0))
+
+        a = Reading.objects.get(sensor="a")
+        self.assertEqual(a.values, [1, None, 3])
+        self.assertEqual(a.labels, ["x,y", 'say "hi"', "back\\slash"])
+        self.assertEqual(a.payload, {"k": [1, None]})
+        # None is SQL NULL (as with bulk_create); Value(None, JSONField()) is JSON null
+        self.assertTrue(Reading.objects.filter(sensor="b", payload__isnull=True).exists())
+        self.assertTrue(Reading.objects.filter(sensor="c", payload=None).exists())
+
+        result = queryset.bulk_upsert(
+            [Reading(sensor="a", values=[9]), Reading(sensor="d")], ["sensor"], ["values"], strategy=UpsertStrategyChoices.COPY
+        )
+        self.assertEqual((result.created, result.updated), (1, 1))
+        self.assertEqual(Reading.objects.get(sensor="a").values, [9])
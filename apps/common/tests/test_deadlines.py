@@ -0,0 +1,109 @@
+import asyncio
+import time
+from unittest import mock
+
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import path
+
+from apps.common.deadlines import LAYER_DATABASE, LAYER_VIEW, DeadlineExceeded, current_deadline, deadline, start_deadline
+from apps.common.deadlines.db import APPLIED_ATTR, enforce_deadline
+from apps.common.middleware.deadline import DeadlineASGIHandler
+
+# Set by the view when it is cancelled (instead of finishing its work)
+cancelled = asyncio.Event()
+
+
+class SyncOnlyMiddleware:
+    # Like most project middleware: forces the chain above it into sync mode
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+
+@deadline(0.05)
+async def slow_view(request):
+    try:
+        await asyncio.sleep(5)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+    return HttpResponse("done")
+
+
+async def fast_view(request):
+    return HttpResponse("done")
+
+
+urlpatterns = [path("slow/", slow_view), path("fast/", fast_view)]
+
+
+@override_settings(
+    ROOT_URLCONF=__name__,
+    MIDDLEWARE=["apps.common.middleware.deadline.DeadlineMiddleware", f"{__name__}.SyncOnlyMiddleware"],
+)
+class AsyncViewDeadlineTests(SimpleTestCase):
+    def setUp(self):
+        cancelled.clear()
+
+    async def test_async_view_over_budget_is_cancelled(self):
+        started = time.monotonic()
+        response = await DeadlineASGIHandler().get_response_async(RequestFactory().get("/slow/"))
+
+        self.assertEqual(response.status_code, 504)
+        self.assertIn(f'"layer": "{LAYER_VIEW}"', response.content.decode())
+        self.assertTrue(cancelled.is_set())
+        self.assertLess(time.monotonic() - started, 2)
+
+    async def test_async_view_within_budget(self):
+        response = await DeadlineASGIHandler().get_response_async(RequestFactory().get("/fast/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(cancelled.is_set())
+
+
+class PostgreSQLStatementTimeoutTests(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self):
+        # The PostgreSQL branch, without PostgreSQL: a recording DB-API cursor behind Django's wrapper
+        self.raw = mock.Mock()
+        self.cursor = CursorWrapper(self.raw, connection)
+        self.enterContext(mock.patch.object(connection, "vendor", "postgresql"))
+        self.enterContext(connection.execute_wrapper(enforce_deadline))
+        self.addCleanup(lambda: connection.__dict__.pop(APPLIED_ATTR, None))
+
+    def run_in_deadline(self, seconds: float, sql: str = "SELECT 1") -> None:
+        token = current_deadline.set(start_deadline(seconds))
+        try:
+            self.cursor.execute(sql)
+        finally:
+            current_deadline.reset(token)
+
+    def executed(self) -> list[str]:
+        return [call.args[0] for call in self.raw.execute.call_args_list]
+
+    def test_timeout_is_set_on_the_raw_cursor_once(self):
+        self.run_in_deadline(10)
+        self.run_in_deadline(10)
+
+        self.assertEqual(len(self.executed()), 3)
+        self.assertRegex(self.executed()[0], r"^SET statement_timeout = \d+$")
+        self.assertEqual(self.executed()[1:], ["SELECT 1", "SELECT 1"])
+
+    def test_timeout_is_cleared_outside_a_request(self):
+        self.run_in_deadline(10)
+        self.cursor.execute("SELECT 1")
+
+        self.assertEqual(self.executed()[-2:], ["SET statement_timeout = 0", "SELECT 1"])
+
+    def test_spent_budget_refuses_the_query(self):
+        with self.assertRaises(DeadlineExceeded) as raised:
+            self.run_in_deadline(0)
+
+        self.assertEqual(raised.exception.layer, LAYER_DATABASE)
+        self.raw.execute.assert_not_called()
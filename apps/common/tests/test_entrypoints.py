@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+
+class EntrypointImportTests(SimpleTestCase):
+    """
+    Servers (uvicorn, daphne, gunicorn) import the entrypoint module in a fresh
+    interpreter, before anything has set Django up.
+    """
+
+    def assert_imports(self, module: str) -> None:
+        env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}; print(callable({module}.application))"],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "True")
+
+    def test_asgi_application_imports(self):
+        self.assert_imports("config.asgi")
+
+    def test_wsgi_application_imports(self):
+        self.assert_imports("config.wsgi")
@@ -0,0 +1,33 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, SimpleTestCase
+
+from apps.common.middleware.idempotency import IdempotencyMiddleware
+
+
+class RecordKeyTests(SimpleTestCase):
+    def make_request(self, remote_addr: str = "203.0.113.1", session_key: str | None = None, **headers):
+        request = RequestFactory().post("/orders/", REMOTE_ADDR=remote_addr, headers=headers)
+        request.user = AnonymousUser()
+        if session_key is not None:
+            request.session = type("Session", (), {"session_key": session_key})()
+        return request
+
+    def record_key(self, request) -> str:
+        return IdempotencyMiddleware.record_key(request, "key-1")
+
+    def test_anonymous_clients_do_not_share_keys(self):
+        self.assertNotEqual(self.record_key(self.make_request("203.0.113.1")), self.record_key(self.make_request("203.0.113.2")))
+        self.assertNotEqual(
+            self.record_key(self.make_request(session_key="a" * 32)), self.record_key(self.make_request(session_key="b" * 32))
+        )
+
+    def test_anonymous_session_is_scoped_by_session_not_address(self):
+        self.assertEqual(
+            self.record_key(self.make_request("203.0.113.1", session_key="a" * 32)),
+            self.record_key(self.make_request("203.0.113.2", session_key="a" * 32)),
+        )
+
+    def test_credentials_scope_token_clients(self):
+        first = self.make_request("203.0.113.1", Authorization="Token one")
+        self.assertEqual(self.record_key(first), self.record_key(self.make_request("203.0.113.2", Authorization="Token one")))
+        self.assertNotEqual(self.record_key(first), self.record_key(self.make_request("203.0.113.1", Authorization="Token two")))
@@ -0,0 +1,33 @@
+import json
+import logging
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.common.logging_handlers import JsonFormatter, RateLimitFilter
+
+
+class RateLimitFilterTests(SimpleTestCase):
+    def make_record(self, *args) -> logging.LogRecord:
+        return logging.LogRecord("app", logging.ERROR, "/app/views.py", 10, "Payment %s failed", args, None)
+
+    def test_suppression_count_is_reported_without_touching_the_message(self):
+        rate_limit = RateLimitFilter(window=60, burst=1)
+        with mock.patch("time.monotonic", return_value=0.0):
+            self.assertTrue(rate_limit.filter(self.make_record(1)))
+            self.assertFalse(rate_limit.filter(self.make_record(2)))
+            self.assertFalse(rate_limit.filter(self.make_record(3)))
+
+        record = self.make_record(4)
+        with mock.patch("time.monotonic", return_value=61.0):
+            self.assertTrue(rate_limit.filter(record))
+
+        self.assertEqual(record.msg, "Payment %s failed")
+        self.assertEqual(record.getMessage(), "Payment 4 failed")
+        self.assertEqual(record.suppressed, 2)
+        self.assertEqual(json.loads(JsonFormatter().format(record))["suppressed"], 2)
+
+    def test_records_without_suppression_have_no_count(self):
+        record = self.make_record(1)
+        self.assertTrue(RateLimitFilter().filter(record))
+        self.assertFalse(hasattr(record, "suppressed"))
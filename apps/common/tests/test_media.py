@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase
+
+from apps.common.functions.media import parse_range
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_satisfiable_ranges(self):
+        self.assertEqual(parse_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(parse_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=90-500", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=-500", 100), (0, 99))
+
+    def test_invalid_ranges_are_ignored(self):
+        # Served as a full 200, never as 416
+        for header in ("bytes=5-2", "bytes=-", "bytes=0-1,5-9", "items=0-9", "bytes=a-b"):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 100))
+
+    def test_unsatisfiable_ranges_raise(self):
+        for header, size in (("bytes=100-", 100), ("bytes=100-200", 100), ("bytes=-0", 100), ("bytes=0-", 0)):
+            with self.subTest(header=header, size=size), self.assertRaises(ValueError):
+                parse_range(header, size)
+
+    def test_suffix_range_of_empty_file_serves_full_body(self):
+        self.assertIsNone(parse_range("bytes=-10", 0))
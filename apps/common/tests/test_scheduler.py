@@ -0,0 +1,143 @@
+from datetime import UTC, datetime
+
+from django.test import SimpleTestCase
+
+from apps.common.scheduler import PeriodicJob
+from apps.common.scheduler.cron import CronSchedule
+from apps.common.scheduler.engine import STATUS_SKIPPED, Scheduler
+from apps.common.scheduler.store import SchedulerStore, job_key
+from apps.common.scheduler.testing import FakeClock, FakeRedis, InlineExecutor
+from config.django.scheduler import scheduler_config
+
+START = datetime(2030, 1, 1, tzinfo=UTC).timestamp()
+
+
+class SchedulerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock(START)
+        self.redis = FakeRedis(self.clock)
+        self.store = SchedulerStore(self.redis)
+        self.runs = []
+
+    def make_job(self, schedule: str = "* * * * *") -> PeriodicJob:
+        return PeriodicJob("test.job", lambda: self.runs.append(self.clock.time()), CronSchedule(schedule), timeout=300)
+
+    def make_scheduler(self, job: PeriodicJob) -> Scheduler:
+        return Scheduler([job], self.store, clock=self.clock, executor=InlineExecutor())
+
+
+class LeaderFailoverTests(SchedulerTestCase):
+    def test_standby_takes_over_without_running_an_occurrence_twice(self):
+        job = self.make_job()
+        leader, standby = self.make_scheduler(job), self.make_scheduler(job)
+
+        self.clock.advance(30)
+        leader.tick()
+        standby.tick()
+        self.assertTrue(leader.is_leader)
+        self.assertFalse(standby.is_leader)
+        self.assertEqual(self.runs, [START + 30])
+
+        # The leader runs 00:01, then dies without releasing its lease
+        self.clock.advance(40)
+        leader.tick()
+        self.assertEqual(len(self.runs), 2)
+
+        # Its lease still blocks the standby until it expires in Redis
+        self.clock.advance(scheduler_config.SCHEDULER_LEASE_TTL - 5)
+        standby.tick()
+        self.assertFalse(standby.is_leader)
+        self.clock.advance(10)
+        standby.tick()
+        self.assertTrue(standby.is_leader)
+        # 00:01 is still within the misfire grace, but it was claimed by the old leader
+        self.assertEqual(len(self.runs), 2)
+
+        self.clock.advance(60)
+        standby.tick()
+        self.assertEqual(len(self.runs), 3)
+
+        # The old leader comes back as a standby
+        leader.tick()
+        self.assertFalse(leader.is_leader)
+        self.assertEqual(len(self.runs), 3)
+
+    def test_no_leader_while_redis_is_down(self):
+        scheduler = self.make_scheduler(self.make_job())
+        self.redis.down = True
+        self.clock.advance(30)
+        scheduler.tick()
+        self.assertFalse(scheduler.is_leader)
+        self.assertEqual(self.runs, [])
+
+
+class MisfireGraceTests(SchedulerTestCase):
+    def test_occurrence_within_grace_runs_once(self):
+        scheduler = self.make_scheduler(self.make_job("0 * * * *"))
+        self.clock.advance(scheduler_config.SCHEDULER_MISFIRE_GRACE - 1)
+        scheduler.tick()
+        scheduler.tick()
+        self.assertEqual(self.runs, [START + scheduler_config.SCHEDULER_MISFIRE_GRACE - 1])
+
+    def test_occurrence_older_than_grace_is_skipped(self):
+        scheduler = self.make_scheduler(self.make_job("0 * * * *"))
+        self.clock.advance(scheduler_config.SCHEDULER_MISFIRE_GRACE + 1)
+        scheduler.tick()
+        self.assertEqual(self.runs, [])
+
+        # The next occurrence runs on time
+        self.clock.now = START + 3600
+        scheduler.tick()
+        self.assertEqual(self.runs, [START + 3600])
+
+
+class RunLeaseTests(SchedulerTestCase):
+    def test_occurrence_is_skipped_while_the_previous_run_holds_the_lease(self):
+        job = self.make_job()
+        scheduler = self.make_scheduler(job)
+        # A run started elsewhere (e.g. a manual run) is still in progress
+        self.store.acquire_lease(job_key(job.name, ":running"), "other", job.timeout)
+
+        scheduler.tick()
+        self.assertEqual(self.runs, [])
+        self.assertEqual(self.store.metrics(job.name)["last_status"], STATUS_SKIPPED)
+        self.assertEqual(self.store.metrics(job.name)[f"{STATUS_SKIPPED}_total"], "1")
+
+        # Once the lease expires the next occurrence runs
+        self.clock.advance(job.timeout)
+        scheduler.tick()
+        self.assertEqual(len(self.runs), 1)
+        self.assertEqual(self.store.metrics(job.name)["runs"], "2")
+
+
+class CronScheduleDSTTests(SimpleTestCase):
+    def test_time_skipped_by_spring_forward_runs_at_shifted_wall_time(self):
+        schedule = CronSchedule("30 2 * * *", "Europe/Berlin")
+        # 2030-03-31 02:00 CET jumps to 03:00 CEST: 02:30 does not exist and runs at 03:30 CEST
+        slot = schedule.next_after(datetime(2030, 3, 30, 12, tzinfo=UTC).timestamp())
+        self.assertEqual(datetime.fromtimestamp(slot, UTC), datetime(2030, 3, 31, 1, 30, tzinfo=UTC))
+
+    def test_time_repeated_by_fall_back_runs_once(self):
+        schedule = CronSchedule("30 2 * * *", "Europe/Berlin")
+        # 2030-10-27 03:00 CEST falls back to 02:00 CET: 02:30 happens twice
+        first = schedule.next_after(datetime(2030, 10, 26, 12, tzinfo=UTC).timestamp())
+        self.assertEqual(datetime.fromtimestamp(first, UTC), datetime(2030, 10, 27, 0, 30, tzinfo=UTC))
+        following = schedule.next_after(first)
+        self.assertEqual(datetime.fromtimestamp(following, UTC), datetime(2030, 10, 28, 1, 30, tzinfo=UTC))
+
+    def test_hourly_schedule_fires_the_repeated_hour_once(self):
+        schedule = CronSchedule("0 * * * *", "Europe/Berlin")
+        slot = datetime(2030, 10, 26, 23, 30, tzinfo=UTC).timestamp()
+        slots = []
+        for _ in range(3):
+            slot = schedule.next_after(slot)
+            slots.append(datetime.fromtimestamp(slot, UTC).hour)
+        # 02:00 CEST (00:00 UTC), then 03:00 CET (02:00 UTC): the second 02:00 is not run again
+        self.assertEqual(slots, [0, 2, 3])
+
+
+class FakeRedisTests(SimpleTestCase):
+    def test_hset_counts_only_new_fields(self):
+        redis = FakeRedis(FakeClock())
+        self.assertEqual(redis.hset("key", mapping={"a": 1, "b": 2}), 2)
+        self.assertEqual(redis.hset("key", mapping={"a": 3, "c": 4}), 1)
@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.contrib.sessions.models import Session
+from django.test import TestCase, override_settings
+
+from apps.common.sessions import SessionStore
+from config.django.sessions import sessions_config
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "sessions"},
+    "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "local"},
+}
+
+
+@override_settings(CACHES=CACHES)
+class WriteBehindFallbackTests(TestCase):
+    def setUp(self):
+        self.enterContext(mock.patch.object(sessions_config, "SESSION_WRITE_BEHIND", True))
+
+    def create_session(self, **data) -> SessionStore:
+        session = SessionStore()
+        session.update(data)
+        session.save()
+        return session
+
+    def test_evicted_session_is_reloaded_from_the_database(self):
+        session = self.create_session(cart=[1, 2])
+        self.assertTrue(Session.objects.filter(session_key=session.session_key).exists())
+        session._cache.delete(session.cache_key)
+
+        reloaded = SessionStore(session.session_key)
+        self.assertEqual(reloaded["cart"], [1, 2])
+        # The cache is re-populated: the next load does not touch the database
+        self.assertIsNotNone(reloaded._cache.get(reloaded.cache_key))
+        with self.assertNumQueries(0):
+            self.assertEqual(SessionStore(session.session_key)["cart"], [1, 2])
+
+    def test_reloaded_session_keeps_its_own_expiry(self):
+        session = SessionStore()
+        session["cart"] = [1]
+        session.set_expiry(600)
+        session.save()
+        session._cache.delete(session.cache_key)
+
+        reloaded = SessionStore(session.session_key)
+        self.assertEqual(reloaded["cart"], [1])
+        self.assertEqual(reloaded.get_expiry_age(), 600)
+
+    def test_missing_session_loads_empty(self):
+        session = SessionStore("x" * 32)
+        self.assertEqual(dict(session.items()), {})
+        self.assertIsNone(session.session_key)
@@ -0,0 +1,68 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from apps.common.functions.single_flight import LOCK_SUFFIX, Entry, get_or_compute
+from config.django.cache import cache_config
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "single-flight"},
+    "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "local"},
+}
+
+
+@override_settings(CACHES=CACHES)
+class ColdMissTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = caches["default"]
+        self.addCleanup(self.cache.clear)
+        self.compute = mock.Mock(return_value="computed")
+
+    def test_unavailable_cache_computes_without_waiting(self):
+        # What django-redis with IGNORE_EXCEPTIONS answers while Redis is down
+        self.enterContext(mock.patch.object(type(self.cache), "add", return_value=False))
+        self.enterContext(mock.patch.object(type(self.cache), "get", return_value=None))
+
+        started = time.monotonic()
+        self.assertEqual(get_or_compute("report", self.compute, soft_ttl=60), "computed")
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.compute.assert_called_once_with()
+
+    def test_failing_cache_computes_without_waiting(self):
+        self.enterContext(mock.patch.object(type(self.cache), "add", side_effect=ConnectionError))
+
+        started = time.monotonic()
+        self.assertEqual(get_or_compute("report", self.compute, soft_ttl=60), "computed")
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.compute.assert_called_once_with()
+
+    def test_lost_race_waits_for_the_lock_holder(self):
+        # Another node holds the lock and stores its value shortly after
+        self.cache.add("report" + LOCK_SUFFIX, "other", 30)
+        timer = threading.Timer(0.1, lambda: self.cache.set("report", Entry("remote", time.time() + 60, 0.1), 120))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertGreater(cache_config.COMPUTE_WAIT_TIMEOUT, 0.1)
+        self.assertEqual(get_or_compute("report", self.compute, soft_ttl=60), "remote")
+
+        self.compute.assert_not_called()
+
+    def test_released_lock_without_value_is_taken_over(self):
+        self.cache.add("report" + LOCK_SUFFIX, "other", 30)
+        # The holder fails and releases its lock without storing anything
+        timer = threading.Timer(0.05, lambda: self.cache.delete("report" + LOCK_SUFFIX))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        started = time.monotonic()
+        self.assertEqual(get_or_compute("report", self.compute, soft_ttl=60), "computed")
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertIsNone(self.cache.get("report" + LOCK_SUFFIX))
+        self.assertEqual(self.cache.get("report").value, "computed")
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import JsonResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import path
+
+from apps.common.tracing import exporters
+from apps.common.tracing.db import install_query_tracing, trace_query
+from apps.common.tracing.exporters import BatchSpanProcessor, FileExporter
+from apps.common.tracing.handlers import TracingWSGIHandler
+from apps.common.tracing.spans import KIND_CLIENT, KIND_SERVER, STATUS_OK
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+MIDDLEWARE = ["django.middleware.security.SecurityMiddleware", "django.middleware.common.CommonMiddleware"]
+
+
+def user_count(request):
+    return JsonResponse({"users": get_user_model().objects.count()})
+
+
+urlpatterns = [path("users/count/", user_count)]
+
+
+@override_settings(ROOT_URLCONF=__name__, MIDDLEWARE=MIDDLEWARE)
+class FileExporterTraceTests(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+        # Exported synchronously by flush(); the interval never elapses during a test
+        self.processor = BatchSpanProcessor(FileExporter(self.path), queue_size=100, batch_size=10, interval=3600)
+        self.addCleanup(self.processor.shutdown)
+        patcher = mock.patch.object(exporters, "_processor", self.processor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        install_query_tracing(connection)
+        self.addCleanup(connection.execute_wrappers.remove, trace_query)
+
+    def trace_request(self) -> dict[str, dict]:
+        request = RequestFactory().get("/users/count/", HTTP_TRACEPARENT=f"00-{TRACE_ID}-{PARENT_ID}-01")
+        response = TracingWSGIHandler().get_response(request)
+        self.assertEqual(response.status_code, 200)
+
+        self.processor.flush()
+        with open(self.path, encoding="utf-8") as f:
+            spans = [json.loads(line) for line in f]
+        return {span["name"]: span for span in spans}
+
+    def test_spans_and_parent_links(self):
+        spans = self.trace_request()
+        root = spans["GET users/count/"]
+        security = spans["middleware django.middleware.security.SecurityMiddleware"]
+        common = spans["middleware django.middleware.common.CommonMiddleware"]
+        view = spans["view"]
+        query = spans["db.query"]
+
+        self.assertEqual({span["trace_id"] for span in spans.values()}, {TRACE_ID})
+        # Root continues the incoming trace; middleware nest in MIDDLEWARE order, then the view, then its query
+        self.assertEqual(root["parent_id"], PARENT_ID)
+        self.assertEqual(security["parent_id"], root["span_id"])
+        self.assertEqual(common["parent_id"], security["span_id"])
+        self.assertEqual(view["parent_id"], common["span_id"])
+        self.assertEqual(query["parent_id"], view["span_id"])
+
+        self.assertEqual(root["kind"], KIND_SERVER)
+        self.assertEqual(root["status"], STATUS_OK)
+        self.assertEqual(root["attributes"]["http.route"], "users/count/")
+        self.assertEqual(root["attributes"]["http.status_code"], 200)
+        self.assertEqual(query["kind"], KIND_CLIENT)
+        self.assertIn("COUNT", query["attributes"]["db.statement"])
+        # Children finish inside their parent
+        self.assertLessEqual(root["start_ns"], view["start_ns"])
+        self.assertLessEqual(query["end_ns"], view["end_ns"])
+
+    def test_unsampled_trace_exports_nothing(self):
+        request = RequestFactory().get("/users/count/", HTTP_TRACEPARENT=f"00-{TRACE_ID}-{PARENT_ID}-00")
+        TracingWSGIHandler().get_response(request)
+        self.processor.flush()
+        self.assertEqual(os.path.getsize(self.path), 0)
@@ -0,0 +1,61 @@
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from apps.common.tracing.spans import KIND_CLIENT, start_span
+
+
+class TracedCacheMixin:
+    """
+    Record a client span around each cache operation.
+    """
+
+    def _span(self, operation: str):
+        return start_span(f"cache.{operation}", KIND_CLIENT, {"cache.backend": type(self).__name__})
+
+    def get(self, *args, **kwargs):
+        with self._span("get"):
+            return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        with self._span("set"):
+            return super().set(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        with self._span("add"):
+            return super().add(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with self._span("delete"):
+            return super().delete(*args, **kwargs)
+
+    def touch(self, *args, **kwargs):
+        with self._span("touch"):
+            return super().touch(*args, **kwargs)
+
+    def incr(self, *args, **kwargs):
+        with self._span("incr"):
+            return super().incr(*args, **kwargs)
+
+    def has_key(self, *args, **kwargs):
+        with self._span("has_key"):
+            return super().has_key(*args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        with self._span("get_many"):
+            return super().get_many(*args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        with self._span("set_many"):
+            return super().set_many(*args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        with self._span("delete_many"):
+            return super().delete_many(*args, **kwargs)
+
+
+class TracedRedisCache(TracedCacheMixin, RedisCache):
+    pass
+
+
+class TracedLocMemCache(TracedCacheMixin, LocMemCache):
+    pass
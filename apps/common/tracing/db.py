@@ -0,0 +1,27 @@
+from apps.common.tracing.spans import KIND_CLIENT, start_span
+
+# Statements longer than this are truncated in span attributes
+MAX_STATEMENT_LENGTH = 2000
+
+
+def trace_query(execute, sql, params, many, context):
+    """
+    connection.execute_wrapper() hook recording one span per query.
+
+    Only the SQL text is recorded, never the parameters.
+    """
+    connection = context["connection"]
+    with start_span(
+        "db.query",
+        KIND_CLIENT,
+        {"db.system": connection.vendor, "db.name": connection.alias, "db.statement": str(sql)[:MAX_STATEMENT_LENGTH]},
+    ) as span:
+        result = execute(sql, params, many, context)
+        if span is not None and context["cursor"].rowcount >= 0:
+            span.set_attribute("db.rows", context["cursor"].rowcount)
+        return result
+
+
+def install_query_tracing(connection) -> None:
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(trace_query)
@@ -0,0 +1,169 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import urllib.request
+
+from config.django.tracing import TraceExporterChoices, tracing_config
+
+logger = logging.getLogger(__name__)
+
+
+class FileExporter:
+    """
+    Append finished spans to a JSON-lines file (offline analysis, tests).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: list) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans))
+
+
+class OTLPHttpExporter:
+    """
+    POST spans to an OTLP/HTTP collector using the JSON encoding.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def encode_value(value) -> dict:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def encode(self, spans: list) -> dict:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "apps.common.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_id or "",
+                                    "name": span.name,
+                                    "kind": span.kind,
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.end_ns),
+                                    "attributes": [
+                                        {"key": key, "value": self.encode_value(value)} for key, value in span.attributes.items()
+                                    ],
+                                    "status": {"code": span.status},
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: list) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(self.encode(spans)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class BatchSpanProcessor:
+    """
+    Collect finished spans and export them from a background thread.
+
+    Request threads never block: when the queue is full spans are dropped.
+    The thread is restarted in forked children and flushed at exit.
+    """
+
+    def __init__(self, exporter, queue_size: int, batch_size: int, interval: float):
+        self.exporter = exporter
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._start()
+
+        atexit.register(self.shutdown)
+        os.register_at_fork(after_in_child=self._start)
+
+    def _start(self) -> None:
+        self.queue: queue.Queue = queue.Queue(self.queue_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._worker, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span) -> None:
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _worker(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            try:
+                self.exporter.export(batch)
+            except Exception:
+                logger.warning("Exporting %d spans failed", len(batch), exc_info=True)
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+
+_processor: BatchSpanProcessor | None = None
+_processor_lock = threading.Lock()
+
+
+def build_exporter():
+    if tracing_config.TRACING_EXPORTER == TraceExporterChoices.OTLP:
+        return OTLPHttpExporter(tracing_config.TRACING_OTLP_ENDPOINT, tracing_config.TRACING_SERVICE_NAME)
+    return FileExporter(tracing_config.TRACING_FILE_PATH)
+
+
+def get_processor() -> BatchSpanProcessor:
+    """
+    Return the process-wide span processor, creating it on first use.
+    """
+    global _processor
+    if _processor is None:
+        with _processor_lock:
+            if _processor is None:
+                _processor = BatchSpanProcessor(
+                    build_exporter(),
+                    queue_size=tracing_config.TRACING_QUEUE_SIZE,
+                    batch_size=tracing_config.TRACING_EXPORT_BATCH_SIZE,
+                    interval=tracing_config.TRACING_EXPORT_INTERVAL,
+                )
+    return _processor
@@ -0,0 +1,98 @@
+from inspect import iscoroutinefunction
+
+import django
+
+from apps.common.middleware.deadline import DeadlineASGIHandler, DeadlineWSGIHandler
+from apps.common.tracing.spans import STATUS_ERROR, STATUS_OK, start_span, start_trace
+from config.django.tracing import tracing_config
+
+
+class TracingHandlerMixin:
+    """
+    Request handler that opens a root span per request and a child span
+    around every middleware and the view.
+
+    Middleware spans nest: each covers its own work plus everything below it,
+    so self time is the span duration minus its child.
+    """
+
+    def span_name(self, method) -> str | None:
+        # load_middleware() wraps each chain element with convert_exception_to_response,
+        # which keeps the original in __wrapped__
+        target = getattr(method, "__wrapped__", None)
+        if target is None:
+            return None
+        if target in (self._get_response, self._get_response_async):
+            return "view"
+        if hasattr(target, "get_response"):
+            return f"middleware {type(target).__module__}.{type(target).__qualname__}"
+        return None
+
+    def adapt_method_mode(self, is_async, method, method_is_async=None, debug=False, name=None):
+        span_name = self.span_name(method)
+        if span_name is None:
+            return super().adapt_method_mode(is_async, method, method_is_async, debug, name)
+
+        if method_is_async is None:
+            method_is_async = iscoroutinefunction(method)
+
+        if method_is_async:
+
+            async def traced(request):
+                with start_span(span_name):
+                    return await method(request)
+
+        else:
+
+            def traced(request):
+                with start_span(span_name):
+                    return method(request)
+
+        return super().adapt_method_mode(is_async, traced, method_is_async, debug, name)
+
+    @staticmethod
+    def trace_attributes(request) -> dict:
+        return {"http.method": request.method, "http.target": request.path}
+
+    @staticmethod
+    def record_response(span, request, response) -> None:
+        match = getattr(request, "resolver_match", None)
+        if match is not None and match.route:
+            span.name = f"{request.method} {match.route}"
+            span.set_attribute("http.route", match.route)
+        span.set_attribute("http.status_code", response.status_code)
+        span.status = STATUS_ERROR if response.status_code >= 500 else STATUS_OK
+
+
+class TracingWSGIHandler(TracingHandlerMixin, DeadlineWSGIHandler):
+    def get_response(self, request):
+        with start_trace(request.method, request.headers.get("traceparent"), self.trace_attributes(request)) as span:
+            response = super().get_response(request)
+            self.record_response(span, request, response)
+            return response
+
+
+class TracingASGIHandler(TracingHandlerMixin, DeadlineASGIHandler):
+    async def get_response_async(self, request):
+        with start_trace(request.method, request.headers.get("traceparent"), self.trace_attributes(request)) as span:
+            response = await super().get_response_async(request)
+            self.record_response(span, request, response)
+            return response
+
+
+def get_wsgi_application():
+    """
+    Drop-in for django.core.wsgi.get_wsgi_application honouring TRACING_ENABLED
+    (both handlers cancel async views at the request deadline).
+    """
+    django.setup(set_prefix=False)
+    return TracingWSGIHandler() if tracing_config.TRACING_ENABLED else DeadlineWSGIHandler()
+
+
+def get_asgi_application():
+    """
+    Drop-in for django.core.asgi.get_asgi_application honouring TRACING_ENABLED
+    (both handlers cancel async views at the request deadline).
+    """
+    django.setup(set_prefix=False)
+    return TracingASGIHandler() if tracing_config.TRACING_ENABLED else DeadlineASGIHandler()
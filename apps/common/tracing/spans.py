@@ -0,0 +1,162 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import os
+import random
+import re
+import time
+
+from apps.common.tracing.exporters import get_processor
+from config.django.tracing import tracing_config
+
+# W3C trace context: version-traceid-parentid-flags
+TRACEPARENT_RE = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+INVALID_TRACE_ID = "0" * 32
+INVALID_SPAN_ID = "0" * 16
+
+# Span kinds (OTLP numbering)
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+# Span status codes (OTLP numbering)
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+@dataclass(slots=True)
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    sampled: bool
+    kind: int = KIND_INTERNAL
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+    status: int = STATUS_UNSET
+    _perf_start: int = 0
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+# Active span of the current request (thread or asyncio task)
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _new_id(length: int) -> str:
+    return os.urandom(length // 2).hex()
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """
+    Parse a W3C `traceparent` header into (trace_id, parent_span_id, sampled).
+
+    Returns None for missing or malformed headers (a new trace is started).
+    """
+    if not header:
+        return None
+    match = TRACEPARENT_RE.match(header.strip().lower())
+    if not match:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == INVALID_TRACE_ID or parent_id == INVALID_SPAN_ID:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+def _begin(span: Span) -> Span:
+    span.start_ns = time.time_ns()
+    span._perf_start = time.perf_counter_ns()
+    return span
+
+
+def _finish(span: Span) -> None:
+    span.end_ns = span.start_ns + (time.perf_counter_ns() - span._perf_start)
+    if span.sampled:
+        get_processor().on_end(span)
+
+
+@contextmanager
+def start_trace(name: str, traceparent: str | None = None, attributes: dict | None = None):
+    """
+    Open the root (server) span of a request.
+
+    Head-based sampling: an incoming traceparent decides; otherwise
+    TRACING_SAMPLE_RATE does. Unsampled traces still carry ids so they can be
+    propagated downstream, but record nothing.
+    """
+    parent = parse_traceparent(traceparent)
+    if parent:
+        trace_id, parent_id, sampled = parent
+    else:
+        trace_id, parent_id = _new_id(32), None
+        sampled = random.random() < tracing_config.TRACING_SAMPLE_RATE
+
+    span = _begin(Span(trace_id, _new_id(16), parent_id, name, sampled, KIND_SERVER, attributes=attributes or {}))
+    token = current_span.set(span)
+    try:
+        yield span
+    except BaseException:
+        span.status = STATUS_ERROR
+        raise
+    finally:
+        current_span.reset(token)
+        _finish(span)
+
+
+@contextmanager
+def start_span(name: str, kind: int = KIND_INTERNAL, attributes: dict | None = None):
+    """
+    Open a child span of the current span.
+
+    Yields None (and records nothing) outside a sampled trace, so
+    instrumentation stays cheap when tracing is off or not sampled.
+    """
+    parent = current_span.get()
+    if parent is None or not parent.sampled:
+        yield None
+        return
+
+    span = _begin(Span(parent.trace_id, _new_id(16), parent.span_id, name, True, kind, attributes=attributes or {}))
+    token = current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.status = STATUS_ERROR
+        span.set_attribute("exception.type", type(exc).__name__)
+        raise
+    finally:
+        current_span.reset(token)
+        _finish(span)
+
+
+def inject_headers(headers: dict) -> dict:
+    """
+    Add the current `traceparent` to outgoing request headers.
+    """
+    span = current_span.get()
+    if span is not None:
+        headers["traceparent"] = span.traceparent
+    return headers
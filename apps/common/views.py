@@ -1,3 +1,77 @@
-from django.shortcuts import render
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.common.deadlines import deadline_metrics
+from apps.common.functions.bulkhead import bulkhead_metrics
+from apps.common.functions.media import serve_media
+from apps.common.functions.memory_profile import memory_profiler
+from apps.common.sse.broker import event_stream_metrics
+
+
+class ProtectedMediaView(APIView):
+    """
+    Serve user-uploaded media behind DRF authentication and permissions.
+
+    Subclass and override `permission_classes` / `has_media_permission`
+    for per-object rules (e.g. only the owner may download a file).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    # Force download instead of inline rendering
+    as_attachment = False
+
+    def has_media_permission(self, request, path: str) -> bool:
+        # Hook for path-level checks on top of permission_classes
+        return True
+
+    def get(self, request, path: str):
+        if not self.has_media_permission(request, path):
+            self.permission_denied(request, message="You do not have permission to access this file.")
+        return serve_media(request, path, as_attachment=self.as_attachment)
+
+
+class BulkheadMetricsView(APIView):
+    """
+    Saturation metrics of every bulkhead group used by this worker.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(bulkhead_metrics())
+
+
+class DeadlineMetricsView(APIView):
+    """
+    How many requests of this worker ran out of time, per layer.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(deadline_metrics())
+
+
+class MemoryProfileView(APIView):
+    """
+    Sampled allocation profile of this worker: per-route peak / retained
+    memory and the top allocation sites (see MEMORY_PROFILING_*).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(memory_profiler.snapshot())
+
+
+class EventStreamMetricsView(APIView):
+    """
+    Open event streams of this worker and their fan-out counters.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(event_stream_metrics())
@@ -0,0 +1,13 @@
+from django.apps import apps
+
+from apps.common.cache_warming import warmer
+from apps.common.models import CachedModel, get_generation
+
+
+@warmer("common.model_generations", priority=100, tags=("models",))
+def warm_model_generations() -> int:
+    # Every cached read first looks up its model's generation; create them before traffic does
+    models = [model for model in apps.get_models() if issubclass(model, CachedModel)]
+    for model in models:
+        get_generation(model)
+    return len(models)
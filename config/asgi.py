@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+from apps.common.health import HealthCheckASGIMiddleware
+from apps.common.tracing.handlers import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+# Sets Django up: the event stream module imports models (token authentication)
+django_application = get_asgi_application()
+
+from apps.common.sse.asgi import EventStreamASGIMiddleware  # noqa: E402
+
+# Probes and event streams are answered before Django's handler (no middleware, no URL resolution)
+application = HealthCheckASGIMiddleware(EventStreamASGIMiddleware(django_application))
@@ -10,6 +10,18 @@ class AuthenticationSettings(PydanticBaseSettings):
     # Django password validator definitions (final structure expected by Django)
     AUTH_PASSWORD_VALIDATORS: list[dict] = Field(default_factory=list)
 
+    # Authentication backends (cached user + permission snapshots for session auth)
+    # New logins record CachedModelBackend; ModelBackend stays listed so sessions that
+    # recorded it keep resolving (Django drops sessions whose backend is not listed);
+    # it is only used for get_user, failed logins stop at CachedModelBackend
+    AUTHENTICATION_BACKENDS: list[str] = [
+        "apps.common.backends.CachedModelBackend",
+        "django.contrib.auth.backends.ModelBackend",
+    ]
+
+    # Seconds a user snapshot stays cached (invalidated early on user/group/permission changes)
+    USER_CACHE_TIMEOUT: int = Field(default=300, ge=1, description="Cache lifetime of user snapshots")
+
     @model_validator(mode="after")
     def build_auth_password_validators(self) -> "AuthenticationSettings":
         # Enforce a fixed, secure set of password validators
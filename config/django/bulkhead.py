@@ -0,0 +1,41 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class BulkheadSettings(BaseSettings):
+    """
+    Cluster-wide concurrency limits (apps.common.functions.bulkhead) loaded via Pydantic.
+
+    Throttling limits request *rate* per client; bulkheads limit how many
+    requests of a group run *at once* across all nodes.
+    """
+
+    # group -> max in-flight requests across the cluster, e.g. {"reports": 8}
+    BULKHEAD_GROUPS: dict[str, int] = Field(default_factory=dict, description="Concurrency limit per group")
+
+    # URL path prefix -> group, applied by BulkheadMiddleware, e.g. {"/api/reports/": "reports"}
+    BULKHEAD_ROUTES: dict[str, str] = Field(default_factory=dict, description="Path prefixes limited by a group")
+
+    # Seconds a slot lease lives in Redis; must exceed the slowest request (reclaimed if a worker dies)
+    BULKHEAD_LEASE_SECONDS: int = Field(default=120, ge=1, description="Slot lease lifetime")
+
+    # Seconds an excess request waits for a slot before being shed
+    BULKHEAD_QUEUE_TIMEOUT: float = Field(default=0.5, ge=0, description="Max wait for a free slot")
+
+    # Retry-After (seconds) sent with 503 responses
+    BULKHEAD_RETRY_AFTER: int = Field(default=2, ge=0, description="Retry-After for shed requests")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton bulkhead configuration instance
+bulkhead_config = BulkheadSettings()
@@ -1,6 +1,7 @@
 from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from config.django.tracing import tracing_config
 from config.environment import env_config
 
 
@@ -43,6 +44,28 @@ class CacheSettings(BaseSettings):
     # Retry on timeout, hidden from logs to avoid accidental leaks
     RETRY_ON_TIMEOUT: bool = Field(default=False, frozen=True, repr=False)
 
+    # In-process (per worker) cache tier in front of Redis; keep short, entries are not
+    # invalidated across workers and live at most this many seconds
+    LOCAL_CACHE_TIMEOUT: int = Field(default=5, ge=0, frozen=True, repr=False)
+
+    # Maximum number of entries held by the in-process cache tier
+    LOCAL_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=1, frozen=True, repr=False)
+
+    # Default lifetime of cached model reads (apps.common.models.CachedModel)
+    MODEL_CACHE_TIMEOUT: int = Field(default=300, ge=1, frozen=True, repr=False)
+
+    # Querysets with more rows than this are not cached by CachedQuerySet.cached()
+    MODEL_CACHE_MAX_ROWS: int = Field(default=1000, ge=1, frozen=True, repr=False)
+
+    # get_or_compute(): seconds a recompute lock lives (expires if the worker dies mid-compute)
+    COMPUTE_LOCK_TIMEOUT: int = Field(default=30, ge=1, frozen=True, repr=False)
+
+    # get_or_compute(): seconds a cold-miss caller waits for another node's compute before computing itself
+    COMPUTE_WAIT_TIMEOUT: float = Field(default=5.0, ge=0, frozen=True, repr=False)
+
+    # get_or_compute(): probabilistic early expiration strength (0 disables, >1 refreshes earlier)
+    COMPUTE_EARLY_EXPIRY_BETA: float = Field(default=1.0, ge=0, frozen=True, repr=False)
+
     # Final Django CACHES dictionary
     CACHES: dict = Field(default_factory=dict)
 
@@ -74,7 +97,11 @@ class CacheSettings(BaseSettings):
             "default": {
                 "BACKEND": "django_redis.cache.RedisCache",
                 "LOCATION": f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}",
-                "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+                "OPTIONS": {
+                    "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                    # Reads wait at most the remaining request budget (apps.common.deadlines)
+                    "CONNECTION_POOL_CLASS": "apps.common.deadlines.redis.DeadlineConnectionPool",
+                },
                 "TIMEOUT": self.CACHES_TIMEOUT,
             }
         }
@@ -100,6 +127,19 @@ class CacheSettings(BaseSettings):
         if self.RETRY_ON_TIMEOUT:
             self.CACHES["default"]["OPTIONS"]["RETRY_ON_TIMEOUT"] = self.RETRY_ON_TIMEOUT
 
+        # In-process tier used by apps.common.functions.tiered_cache
+        self.CACHES["local"] = {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "local",
+            "TIMEOUT": self.LOCAL_CACHE_TIMEOUT,
+            "OPTIONS": {"MAX_ENTRIES": self.LOCAL_CACHE_MAX_ENTRIES},
+        }
+
+        # Same backends with a span per operation (see apps.common.tracing)
+        if tracing_config.TRACING_ENABLED:
+            self.CACHES["default"]["BACKEND"] = "apps.common.tracing.cache.TracedRedisCache"
+            self.CACHES["local"]["BACKEND"] = "apps.common.tracing.cache.TracedLocMemCache"
+
         return self
 
 
@@ -0,0 +1,39 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class CacheWarmingSettings(BaseSettings):
+    """
+    Deploy-time cache warming (apps.common.cache_warming) loaded via Pydantic.
+
+    Apps declare warmers in a `warmers` module; `manage.py warm_cache` runs
+    them on a bounded thread pool and, once every required warmer succeeded,
+    marks the shared cache warm for CACHE_WARMING_VERSION.
+    """
+
+    # Warmers running at the same time (each holds one database connection)
+    CACHE_WARMING_WORKERS: int = Field(default=4, ge=1, description="Concurrent warmers")
+
+    # Seconds the whole run may take; warmers still running after it are reported as timed out
+    CACHE_WARMING_TIMEOUT: float = Field(default=300.0, gt=0, description="Warm-up time budget")
+
+    # Namespaces the warm marker, e.g. a release id, so a deploy with new cache keys warms again
+    CACHE_WARMING_VERSION: str = Field(default="", description="Warm marker version")
+
+    # Readiness probe fails until the marker for CACHE_WARMING_VERSION exists
+    CACHE_WARMING_READINESS: bool = Field(default=False, description="Gate readiness on a warm cache")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton cache warming configuration instance
+cache_warming_config = CacheWarmingSettings()
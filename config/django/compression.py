@@ -0,0 +1,52 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class CompressionSettings(BaseSettings):
+    """
+    Response compression (apps.common.middleware.compression) loaded via Pydantic.
+
+    zstd and brotli are used when `zstandard` / `brotli` are installed;
+    gzip is always available.
+    """
+
+    # Master switch
+    COMPRESSION_ENABLED: bool = Field(default=True, description="Compress responses")
+
+    # Server preference among encodings the client accepts
+    COMPRESSION_ENCODINGS: list[str] = Field(default=["zstd", "br", "gzip"], description="Encoding preference")
+
+    # Smaller bodies are sent as-is (headers would eat the savings)
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0, description="Minimum body size to compress")
+
+    # Levels: responses are compressed per request, so favour speed over ratio
+    COMPRESSION_ZSTD_LEVEL: int = Field(default=3, ge=1, le=22, description="zstd level")
+    COMPRESSION_BROTLI_LEVEL: int = Field(default=4, ge=0, le=11, description="brotli quality")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip level")
+
+    # Max random padding (bytes) added to BREACH-sensitive responses
+    COMPRESSION_BREACH_PADDING: int = Field(default=100, ge=0, description="Max random padding for sensitive responses")
+
+    # Bodies of at least this size have their compressed bytes kept in the local cache tier
+    COMPRESSION_CACHE_MIN_SIZE: int = Field(default=16 * 1024, ge=0, description="Min body size to cache compressed bytes")
+
+    # Compressed results larger than this are not cached
+    COMPRESSION_CACHE_MAX_SIZE: int = Field(default=1024 * 1024, ge=0, description="Max cached compressed size")
+
+    # Seconds compressed bytes stay in the local cache tier
+    COMPRESSION_CACHE_TIMEOUT: int = Field(default=300, ge=1, description="Compressed bytes cache lifetime")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton compression configuration instance
+compression_config = CompressionSettings()
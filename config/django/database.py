@@ -52,6 +52,12 @@ class DatabaseSettings(BaseSettings):
         repr=False,
     )
 
+    # Rows per INSERT ... ON CONFLICT statement in bulk_upsert() (capped by backend limits)
+    BULK_UPSERT_BATCH_SIZE: int = Field(default=1000, ge=1, frozen=True)
+
+    # From this many rows bulk_upsert() on PostgreSQL loads via COPY + merge
+    BULK_UPSERT_COPY_THRESHOLD: int = Field(default=10000, ge=1, frozen=True)
+
     # Final Django-compatible DATABASES dict
     DATABASES: dict = Field(default_factory=dict)
 
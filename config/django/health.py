@@ -0,0 +1,38 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class HealthSettings(BaseSettings):
+    """
+    Load balancer probes (apps.common.health) loaded via Pydantic.
+
+    Probes are answered by an outer WSGI/ASGI wrapper before Django's
+    handler, so they never run middleware, URL resolution or views.
+    """
+
+    # Process is up (never touches DB or Redis)
+    HEALTH_LIVENESS_PATH: str = Field(default="/healthz", description="Liveness probe path")
+
+    # Dependencies are reachable (DB + Redis)
+    HEALTH_READINESS_PATH: str = Field(default="/readyz", description="Readiness probe path")
+
+    # Seconds a readiness result is reused; probes in between cost a dict lookup
+    HEALTH_CACHE_SECONDS: float = Field(default=1.0, ge=0, description="Readiness result cache lifetime")
+
+    # Seconds before a hanging dependency check counts as failed
+    HEALTH_CHECK_TIMEOUT: float = Field(default=2.0, gt=0, description="Readiness check timeout")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton health configuration instance
+health_config = HealthSettings()
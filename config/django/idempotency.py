@@ -0,0 +1,51 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class IdempotencySettings(BaseSettings):
+    """
+    Idempotency-Key handling (apps.common.middleware.idempotency) loaded via Pydantic.
+
+    Completed responses of unsafe requests carrying an `Idempotency-Key`
+    header are stored in Redis and replayed to retries of the same request.
+    """
+
+    # Methods the header is honoured on
+    IDEMPOTENCY_METHODS: list[str] = Field(
+        default=["POST", "PUT", "PATCH", "DELETE"], description="Methods using Idempotency-Key"
+    )
+
+    # Seconds a completed response can be replayed
+    IDEMPOTENCY_TTL: int = Field(default=86400, ge=1, description="Stored response lifetime")
+
+    # Seconds the in-flight lock lives; must exceed the slowest request (expires if a worker dies)
+    IDEMPOTENCY_LOCK_TIMEOUT: int = Field(default=60, ge=1, description="In-flight lock lifetime")
+
+    # 4xx answers a retry of the same request would get again (stored and replayed like 2xx)
+    IDEMPOTENCY_STORED_CLIENT_ERRORS: list[int] = Field(
+        default=[400, 404, 405, 410, 413, 415, 422], description="Deterministic 4xx statuses that are stored"
+    )
+
+    # Seconds a concurrent duplicate waits for the first request before getting 409
+    IDEMPOTENCY_WAIT_TIMEOUT: float = Field(default=10.0, ge=0, description="Max wait for an in-flight duplicate")
+
+    # Responses with larger bodies are not stored (retries execute again)
+    IDEMPOTENCY_MAX_RESPONSE_BYTES: int = Field(default=1024 * 1024, ge=0, description="Max stored body size")
+
+    # Longer keys are rejected with 400
+    IDEMPOTENCY_MAX_KEY_LENGTH: int = Field(default=255, ge=1, description="Max Idempotency-Key length")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton idempotency configuration instance
+idempotency_config = IdempotencySettings()
@@ -23,6 +23,7 @@ class InstalledAppsSettings(BaseSettings):
     THIRD_PARTY_APPS: list[str] = [
         "django_filters",
         "rest_framework",
+        "rest_framework.authtoken",
         "drf_spectacular",
         "drf_spectacular_sidecar",
         "debug_toolbar",
@@ -1,83 +1,154 @@
 from pydantic import Field, model_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import EnvironmentChoices, env_config
 
 
 class LoggingSettings(BaseSettings):
     """
     Django logging settings.
+
+    Pipeline:
+    - Request threads only enqueue records (QueueBatchHandler); a background
+      thread writes them in batches to stdout and, optionally, a rotating file.
+    - Error storms are rate limited per call site (RateLimitFilter).
+    - Production-like environments log JSON at INFO; local ones log verbose text at DEBUG.
     """
 
     LOGGING: dict = Field(default_factory=dict, description="Django logging configuration")
-    # Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+    # Root / project log level (defaults depend on ENVIRONMENT when unset)
+    LOG_LEVEL: str | None = Field(default=None, description="Root log level override")
+
+    # Output format: "json" (structured) or "verbose" (human readable)
+    LOG_FORMAT: str | None = Field(default=None, description="Log format override (json | verbose)")
+
+    # Optional rotating log file (disabled when empty)
+    LOG_FILE: str = Field(default="", description="Rotating log file path")
+    LOG_FILE_MAX_BYTES: int = Field(default=50 * 1024 * 1024, ge=0, description="Rotate log file at this size")
+    LOG_FILE_BACKUP_COUNT: int = Field(default=5, ge=0, description="Rotated log files to keep")
+
+    # Background writer queue
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1, description="Max queued records before dropping")
+    LOG_BATCH_SIZE: int = Field(default=256, ge=1, description="Max records written per batch")
+
+    # Error storm protection: records per call site per window
+    LOG_RATE_LIMIT_WINDOW: int = Field(default=60, ge=1, description="Rate limit window in seconds")
+    LOG_RATE_LIMIT_BURST: int = Field(default=10, ge=1, description="Records per call site per window")
+
+    # Logging formatters
     FORMATTERS: dict = {
         "verbose": {
             "format": "{levelname} {asctime} [{module}:{lineno}] {message}",
             "style": "{",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
-    }
-
-    # Logging handlers (console, file, email)
-    HANDLERS: dict = {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "verbose",
-            "level": "DEBUG",
+        "json": {
+            "()": "apps.common.logging_handlers.JsonFormatter",
         },
-        # "file": {
-        #     "class": "logging.FileHandler",
-        #     "formatter": "verbose",
-        #     "level": "DEBUG",
-        #     "filename": "django.log",
-        # },
-        # "email": {
-        #     "class": "logging.handlers.SMTPHandler",
-        #     "formatter": "verbose",
-        #     "level": "ERROR",
-        #     "mailhost": "localhost",
-        #     "fromaddr": "django@example.com",
-        #     "toaddrs": "admin@example.com",
-        #     "subject": "Django Error",
-        # },  # TODO: Add email settings
     }
 
-    ROOT: dict = {
-        "handlers": ["console"],
-        "level": "DEBUG",
-    }
+    # Logging filters
+    FILTERS: dict = Field(default_factory=dict)
 
-    LOGGERS: dict = {
-        "django": {
-            "handlers": ["console"],
-            "level": "DEBUG",
-            "propagate": False,
-        },
-        "django.request": {
-            "handlers": ["console"],
-            "level": "ERROR",
-            "propagate": False,
-        },
-        "django.utils.autoreload": {
-            "handlers": ["console"],
-            "level": "WARNING",
-            "propagate": False,
-        },
-        "django.db.backends": {
-            "handlers": ["console"],
-            "level": "WARNING",
-            "propagate": False,
-        },
-    }
+    # Logging handlers (queued console / file)
+    HANDLERS: dict = Field(default_factory=dict)
+
+    ROOT: dict = Field(default_factory=dict)
+
+    LOGGERS: dict = Field(default_factory=dict)
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+    @model_validator(mode="after")
+    def set_environment_defaults(self) -> "LoggingSettings":
+        # Production-like environments: structured logs, no DEBUG formatting cost
+        production_like = env_config.ENVIRONMENT in (EnvironmentChoices.PRODUCTION, EnvironmentChoices.STAGING)
+        if self.LOG_LEVEL is None:
+            self.LOG_LEVEL = "INFO" if production_like else "DEBUG"
+        if self.LOG_FORMAT is None:
+            self.LOG_FORMAT = "json" if production_like else "verbose"
+        if self.LOG_FORMAT not in self.FORMATTERS:
+            raise ValueError(f"LOG_FORMAT must be one of {sorted(self.FORMATTERS)}")
+        return self
 
     @model_validator(mode="after")
     def build_logging(self) -> "LoggingSettings":
         """
         Build Django logging configuration.
         """
+        sinks = [{"class": "apps.common.logging_handlers.BatchStreamHandler"}]
+        if self.LOG_FILE:
+            sinks.append(
+                {
+                    "class": "apps.common.logging_handlers.BatchRotatingFileHandler",
+                    "filename": self.LOG_FILE,
+                    "maxBytes": self.LOG_FILE_MAX_BYTES,
+                    "backupCount": self.LOG_FILE_BACKUP_COUNT,
+                    "encoding": "utf-8",
+                }
+            )
+
+        self.FILTERS = {
+            "rate_limit": {
+                "()": "apps.common.logging_handlers.RateLimitFilter",
+                "window": self.LOG_RATE_LIMIT_WINDOW,
+                "burst": self.LOG_RATE_LIMIT_BURST,
+            },
+        }
+
+        self.HANDLERS = {
+            "console": {
+                "()": "apps.common.logging_handlers.QueueBatchHandler",
+                "sinks": sinks,
+                "queue_size": self.LOG_QUEUE_SIZE,
+                "batch_size": self.LOG_BATCH_SIZE,
+                "formatter": self.LOG_FORMAT,
+                "filters": ["rate_limit"],
+                "level": self.LOG_LEVEL,
+            },
+        }
+
+        self.ROOT = {
+            "handlers": ["console"],
+            "level": self.LOG_LEVEL,
+        }
+
+        self.LOGGERS = {
+            "django": {
+                "handlers": ["console"],
+                "level": self.LOG_LEVEL,
+                "propagate": False,
+            },
+            "django.request": {
+                "handlers": ["console"],
+                "level": "ERROR",
+                "propagate": False,
+            },
+            "django.utils.autoreload": {
+                "handlers": ["console"],
+                "level": "WARNING",
+                "propagate": False,
+            },
+            "django.db.backends": {
+                "handlers": ["console"],
+                "level": "WARNING",
+                "propagate": False,
+            },
+        }
+
         self.LOGGING = {
             "version": 1,
             "disable_existing_loggers": False,
             "formatters": self.FORMATTERS,
+            "filters": self.FILTERS,
             "handlers": self.HANDLERS,
             "root": self.ROOT,
             "loggers": self.LOGGERS,
@@ -0,0 +1,48 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class MemoryProfilingSettings(BaseSettings):
+    """
+    Sampled per-request memory profiling (apps.common.functions.memory_profile) loaded via Pydantic.
+
+    A sampled request runs under tracemalloc; its peak and retained
+    allocations are recorded per route together with the top allocation
+    sites. Disabled, the middleware removes itself (MiddlewareNotUsed);
+    enabled, unsampled requests pay one random() call.
+    """
+
+    # Master switch
+    MEMORY_PROFILING_ENABLED: bool = Field(default=False, description="Enable sampled memory profiling")
+
+    # Fraction of requests traced (one at a time per worker; tracemalloc is process-wide)
+    MEMORY_PROFILING_SAMPLE_RATE: float = Field(default=0.01, ge=0.0, le=1.0, description="Sampling rate")
+
+    # Frames recorded per allocation (1 = allocating line only; deeper is slower)
+    MEMORY_PROFILING_TRACEBACK_DEPTH: int = Field(default=1, ge=1, le=50, description="tracemalloc frames")
+
+    # Allocation sites kept per sample and in the worker-wide ranking
+    MEMORY_PROFILING_TOP_SITES: int = Field(default=10, ge=1, description="Top sites per sample")
+    MEMORY_PROFILING_MAX_SITES: int = Field(default=200, ge=1, description="Sites kept in the worker ranking")
+
+    # Bounded buffers (per worker)
+    MEMORY_PROFILING_RECENT_SAMPLES: int = Field(default=100, ge=1, description="Recent samples kept")
+    MEMORY_PROFILING_MAX_ROUTES: int = Field(default=500, ge=1, description="Routes tracked before grouping as <other>")
+
+    # Workers publish their profile to Redis at most this often (for `manage.py memory_profile`)
+    MEMORY_PROFILING_PUBLISH_INTERVAL: int = Field(default=30, ge=1, description="Seconds between publishes")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton memory profiling configuration instance
+memory_profiling_config = MemoryProfilingSettings()
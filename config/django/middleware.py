@@ -10,7 +10,13 @@ class MiddlewareSettings(BaseSettings):
     """
 
     # Core Django middleware (order-sensitive)
+    # DeadlineMiddleware comes first so session/auth lookups run inside the request budget
+    # MemoryProfileMiddleware wraps the rest of the chain so sampled requests include middleware allocations
+    # CompressionMiddleware sits outside everything that reads or rewrites the body
     MIDDLEWARE: list[str] = [
+        "apps.common.middleware.deadline.DeadlineMiddleware",
+        "apps.common.middleware.memory_profile.MemoryProfileMiddleware",
+        "apps.common.middleware.compression.CompressionMiddleware",
         "django.middleware.security.SecurityMiddleware",
         "django.contrib.sessions.middleware.SessionMiddleware",
         "django.middleware.common.CommonMiddleware",
@@ -21,13 +27,19 @@ class MiddlewareSettings(BaseSettings):
     ]
 
     # Third-party middleware shared across environments
+    # WhiteNoise is wrapped to serve zstd variants and the precomputed static index
     THIRD_PARTY_MIDDLEWARE: list[str] = [
-        "whitenoise.middleware.WhiteNoiseMiddleware",
+        "apps.common.middleware.static_files.IndexedWhiteNoiseMiddleware",
         "debug_toolbar.middleware.DebugToolbarMiddleware",
     ]
 
     # Project-specific custom middleware
-    CUSTOM_MIDDLEWARE: list[str] = []
+    # Idempotency-Key replay runs after AuthenticationMiddleware (keys are scoped per user)
+    # Bulkheads run inside it, so duplicates waiting on a replay hold no slot
+    CUSTOM_MIDDLEWARE: list[str] = [
+        "apps.common.middleware.idempotency.IdempotencyMiddleware",
+        "apps.common.middleware.bulkhead.BulkheadMiddleware",
+    ]
     # CUSTOM_MIDDLEWARE: list[str] = []
 
     @model_validator(mode="after")
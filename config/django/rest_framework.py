@@ -29,13 +29,16 @@ class RestFrameworkSettings(BaseSettings):
     # Supported authentication mechanisms
     # Session → browsable API
     # Basic  → legacy / internal tools
-    # Token  → programmatic access
+    # Token  → programmatic access (cached token → user resolution)
     DEFAULT_AUTHENTICATION_CLASSES: list[str] = [
         "rest_framework.authentication.SessionAuthentication",
         "rest_framework.authentication.BasicAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "apps.common.authentication.CachedTokenAuthentication",
     ]
 
+    # Seconds a resolved token stays cached (invalidated early on revocation)
+    TOKEN_CACHE_TIMEOUT: int = Field(default=60, ge=1, description="Cache lifetime of token resolutions")
+
     # Throttling strategy:
     # - anon   → unauthenticated users
     # - user   → authenticated users
@@ -76,6 +79,9 @@ class RestFrameworkSettings(BaseSettings):
     # Hard timeout for API views (seconds)
     DEFAULT_TIMEOUT: int = 3600
 
+    # Refuse (instead of warn about) IndexedFilterSet filters on unindexed columns
+    FILTER_INDEX_STRICT: bool = Field(default=False, description="Treat unindexed filter fields as errors")
+
     # Default schema class for API views
     DEFAULT_SCHEMA_CLASS: str = Field(
         default="drf_spectacular.openapi.AutoSchema", description="Default schema class for API views"
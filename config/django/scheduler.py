@@ -0,0 +1,57 @@
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.django.time_zone import time_zone_config
+from config.environment import env_config
+
+
+class SchedulerSettings(BaseSettings):
+    """
+    Periodic jobs (apps.common.scheduler, `manage.py run_scheduler`) loaded via Pydantic.
+
+    Every node runs the scheduler; one holds the leader lease in Redis and
+    dispatches, the others stand by to take over when the lease expires.
+    """
+
+    # Leader lease lifetime; a dead leader is replaced at most this many seconds later
+    SCHEDULER_LEASE_TTL: float = Field(default=30.0, gt=0, description="Leader lease lifetime (seconds)")
+    SCHEDULER_RENEW_INTERVAL: float = Field(default=10.0, gt=0, description="Seconds between lease renewals")
+
+    # Longest sleep of the dispatch loop
+    SCHEDULER_TICK: float = Field(default=1.0, gt=0, description="Maximum seconds between due checks")
+
+    # Occurrences missed by less than this (leader failover, restart) still run once
+    SCHEDULER_MISFIRE_GRACE: float = Field(default=60.0, ge=0, description="Seconds a late occurrence still runs")
+
+    # Defaults for jobs that don't set their own
+    SCHEDULER_DEFAULT_JITTER: float = Field(default=0.0, ge=0, description="Maximum start delay (seconds)")
+    SCHEDULER_JOB_TIMEOUT: float = Field(default=3600.0, gt=0, description="Maximum run time (seconds)")
+
+    # Jobs running at the same time on the leader
+    SCHEDULER_WORKERS: int = Field(default=4, ge=1, description="Concurrent job threads")
+
+    # Runs kept per job in the Redis history list
+    SCHEDULER_HISTORY: int = Field(default=50, ge=1, description="Run history length")
+
+    # Cron expressions are evaluated in this zone
+    SCHEDULER_TIME_ZONE: str = Field(default=time_zone_config.TIME_ZONE, description="Schedule time zone")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+    @model_validator(mode="after")
+    def check_renew_interval(self) -> "SchedulerSettings":
+        # A leader must renew well before its lease can lapse
+        if self.SCHEDULER_RENEW_INTERVAL * 2 > self.SCHEDULER_LEASE_TTL:
+            raise ValueError("SCHEDULER_RENEW_INTERVAL must be at most half of SCHEDULER_LEASE_TTL")
+        return self
+
+
+# Singleton scheduler configuration instance
+scheduler_config = SchedulerSettings()
@@ -0,0 +1,72 @@
+from enum import StrEnum
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.django.rest_framework import drf_config
+from config.environment import env_config
+
+
+class ServerChoices(StrEnum):
+    # Process model used by `manage.py serve`
+    GUNICORN = "gunicorn"  # pre-forking master, app preloaded before fork
+    UVICORN = "uvicorn"  # single in-process ASGI server (one worker per container)
+
+
+class WorkerClassChoices(StrEnum):
+    # Gunicorn worker models
+    SYNC = "sync"  # WSGI, one request per process
+    GTHREAD = "gthread"  # WSGI, SERVER_THREADS requests per process
+    UVICORN = "uvicorn"  # ASGI, event loop per process
+
+
+class ServerSettings(BaseSettings):
+    """
+    Production serving (`manage.py serve`, apps.common.server) loaded via Pydantic.
+
+    The application is imported and warmed in the master, the heap is moved
+    to gc's permanent generation (gc.freeze) and only then are workers
+    forked, so the preloaded pages stay shared copy-on-write.
+    """
+
+    SERVER: ServerChoices = Field(default=ServerChoices.GUNICORN, description="Process model")
+    SERVER_WORKER_CLASS: WorkerClassChoices = Field(default=WorkerClassChoices.GTHREAD, description="Gunicorn worker model")
+    SERVER_BIND: str = Field(default="0.0.0.0:8000", description="host:port or unix:/path")
+
+    # 0 = derive from the CPUs this process may use (affinity and cgroup quota)
+    SERVER_WORKERS: int = Field(default=0, ge=0, description="Worker processes (0 = auto)")
+    SERVER_THREADS: int = Field(default=4, ge=1, description="Threads per gthread worker")
+
+    # Workers are recycled after max_requests ± jitter so they don't all restart together
+    SERVER_MAX_REQUESTS: int = Field(default=10000, ge=0, description="Requests before a worker is recycled (0 = never)")
+    SERVER_MAX_REQUESTS_JITTER: int = Field(default=1000, ge=0, description="Random extra requests per worker")
+
+    # Hard kill of a silent worker; defaults above DEFAULT_TIMEOUT so the request deadline answers 504 first
+    SERVER_TIMEOUT: int | None = Field(default=None, ge=1, description="Worker timeout in seconds")
+    SERVER_GRACEFUL_TIMEOUT: int = Field(default=30, ge=1, description="Seconds to finish requests on shutdown")
+    SERVER_KEEPALIVE: int = Field(default=5, ge=0, description="Keep-alive seconds")
+
+    # Master logs per-worker RSS/PSS this often (0 disables)
+    SERVER_MEMORY_REPORT_INTERVAL: int = Field(default=300, ge=0, description="Seconds between memory reports")
+
+    # Lets `manage.py serve --memory` find a running server
+    SERVER_PIDFILE: str = Field(default="", description="Master PID file")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+    @model_validator(mode="after")
+    def set_timeout_default(self) -> "ServerSettings":
+        if self.SERVER_TIMEOUT is None:
+            self.SERVER_TIMEOUT = drf_config.DEFAULT_TIMEOUT + 30
+        return self
+
+
+# Singleton server configuration instance
+server_config = ServerSettings()
@@ -15,10 +15,8 @@ class SessionsSettings(BaseSettings):
     - Optional session lifetime and sliding expiration
     """
 
-    # Session engine: cache backend (recommended for production)
-    SESSION_ENGINE: str = Field(
-        default="django.contrib.sessions.backends.cache", frozen=True, description="Django session backend engine"
-    )
+    # Session engine: write-coalescing cache backend (see apps.common.sessions)
+    SESSION_ENGINE: str = Field(default="apps.common.sessions", frozen=True, description="Django session backend engine")
 
     # Alias of the cache backend to use (matches CACHES setting)
     SESSION_CACHE_ALIAS: str = Field(default="default", frozen=True, description="Cache alias to store sessions")
@@ -45,6 +43,18 @@ class SessionsSettings(BaseSettings):
         default=False, frozen=True, description="Refresh session expiry time on each request"
     )
 
+    # Minimum seconds between TTL refreshes of an unchanged session
+    SESSION_REFRESH_INTERVAL: int = Field(default=300, ge=0, description="Seconds between expiry refreshes of unchanged sessions")
+
+    # Session payloads at or above this size are zlib-compressed
+    SESSION_COMPRESS_MIN_BYTES: int = Field(default=1024, ge=0, description="Compression threshold for session payloads")
+
+    # Persist sessions to the database behind the cache for durability
+    SESSION_WRITE_BEHIND: bool = Field(default=False, description="Enable cache + DB write-behind sessions")
+
+    # Minimum seconds between database flushes of a changed session
+    SESSION_DB_FLUSH_INTERVAL: int = Field(default=300, ge=0, description="Seconds between DB flushes in write-behind mode")
+
     model_config = SettingsConfigDict(
         # Load environment-specific .env file
         env_file=env_config.ENVIRONMENT_FILE,
@@ -63,5 +73,12 @@ class SessionsSettings(BaseSettings):
             raise ValueError("SESSION_CACHE_ALIAS must be one of ['default', 'redis']")
         return value
 
+    @model_validator(mode="after")
+    def validate_refresh_interval(self) -> "SessionsSettings":
+        # A refresh interval longer than the session lifetime would let active sessions expire
+        if self.SESSION_REFRESH_INTERVAL >= self.SESSION_COOKIE_AGE:
+            raise ValueError("SESSION_REFRESH_INTERVAL must be lower than SESSION_COOKIE_AGE")
+        return self
+
 
 sessions_config = SessionsSettings()
@@ -0,0 +1,44 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class SlowQuerySettings(BaseSettings):
+    """
+    Fleet-wide query statistics (apps.common.slow_queries) loaded via Pydantic.
+
+    Every query is fingerprinted and aggregated per worker, then merged into
+    Redis; statements above the threshold are logged and EXPLAINed once per
+    fingerprint per SLOW_QUERY_EXPLAIN_TTL. Read with `manage.py slow_queries`.
+    """
+
+    # Master switch (installs the connection.execute_wrapper hook)
+    SLOW_QUERY_LOG_ENABLED: bool = Field(default=False, description="Record query statistics")
+
+    # Statements at or above this duration are logged and have their plan captured
+    SLOW_QUERY_THRESHOLD_MS: float = Field(default=200.0, gt=0, description="Slow query threshold (ms)")
+
+    # Capture EXPLAIN (never EXPLAIN ANALYZE) for slow SELECT statements
+    SLOW_QUERY_EXPLAIN: bool = Field(default=True, description="Capture plans of slow queries")
+    SLOW_QUERY_EXPLAIN_TTL: int = Field(default=3600, ge=1, description="Seconds between plan captures per fingerprint")
+
+    # Per-worker aggregation before merging into Redis
+    SLOW_QUERY_FLUSH_INTERVAL: float = Field(default=5.0, gt=0, description="Seconds between flushes to Redis")
+    SLOW_QUERY_MAX_FINGERPRINTS: int = Field(default=2000, ge=1, description="Fingerprints buffered before an early flush")
+
+    # Statistics of fingerprints not seen for this long expire from Redis
+    SLOW_QUERY_STATS_TTL: int = Field(default=7 * 24 * 3600, ge=60, description="Statistics retention (seconds)")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton slow query configuration instance
+slow_query_config = SlowQuerySettings()
@@ -0,0 +1,50 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class ServerSentEventsSettings(BaseSettings):
+    """
+    Server-Sent Events push channel (apps.common.sse) loaded via Pydantic.
+
+    Streams are answered by an outer ASGI wrapper before Django's handler
+    (config/asgi.py); each worker holds one Redis pub/sub connection and
+    fans events out to its own clients. ASGI only.
+    """
+
+    SSE_ENABLED: bool = Field(default=False, description="Serve the event stream")
+    SSE_PATH: str = Field(default="/events/", description="Event stream path")
+
+    # Comment frame sent to idle connections so proxies and clients don't time them out
+    SSE_HEARTBEAT_INTERVAL: float = Field(default=15.0, gt=0, description="Seconds between heartbeats")
+
+    # Client reconnect delay announced in the stream
+    SSE_RETRY_MS: int = Field(default=3000, ge=0, description="EventSource reconnect delay (ms)")
+
+    # Frames queued per connection; a client that falls further behind is disconnected and resumes from the stream
+    SSE_BUFFER_SIZE: int = Field(default=256, ge=1, description="Per-connection buffer (frames)")
+
+    # Open streams per worker; beyond it new connections get 503 + Retry-After
+    SSE_MAX_CONNECTIONS: int = Field(default=20000, ge=1, description="Streams per worker")
+    SSE_MAX_TOPICS: int = Field(default=20, ge=1, description="Topics per connection")
+
+    # Streams are closed after this long (clients reconnect and resume), which rebalances workers after scaling
+    SSE_MAX_AGE: float = Field(default=3600.0, gt=0, description="Maximum stream lifetime (seconds)")
+
+    # Replay log per channel for Last-Event-ID resume (approximate length, idle expiry)
+    SSE_STREAM_MAXLEN: int = Field(default=1000, ge=1, description="Events kept per channel")
+    SSE_STREAM_TTL: int = Field(default=24 * 3600, ge=60, description="Seconds a channel log outlives its last event")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton server-sent events configuration instance
+sse_config = ServerSentEventsSettings()
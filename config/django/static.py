@@ -1,12 +1,21 @@
+from enum import StrEnum
 import os
 from pathlib import PosixPath
 from typing import Any
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from config.django.base import base_config
 
 
+class MediaServeChoices(StrEnum):
+    # How protected media bytes reach the client
+    DIRECT = "direct"  # streamed by Django (sendfile via wsgi.file_wrapper when available)
+    X_ACCEL_REDIRECT = "x-accel-redirect"  # handed off to nginx
+    X_SENDFILE = "x-sendfile"  # handed off to Apache / lighttpd
+
+
 class StaticSettings(BaseSettings):
     """
     Static and media file configuration for Django.
@@ -19,21 +28,34 @@ class StaticSettings(BaseSettings):
     STATIC_ROOT: PosixPath = os.path.join(base_config.BASE_DIR, "static")
 
     # Django storage backends (Whitenoise for optimized static file serving)
+    # Static files are compressed in parallel (gzip/brotli/zstd) with incremental rebuilds
     STORAGES: dict[str, dict[str, Any]] = {
         "default": {
             "BACKEND": "django.core.files.storage.FileSystemStorage",
         },
         "staticfiles": {
-            "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+            "BACKEND": "apps.common.storages.ParallelCompressedManifestStaticFilesStorage",
         },
     }
 
+    # Worker processes used to compress static files (0 → one per CPU)
+    STATIC_COMPRESS_WORKERS: int = Field(default=0, ge=0, description="Static compression worker processes")
+
+    # zstd compression level for static variants (0 disables zstd output)
+    STATIC_COMPRESS_ZSTD_LEVEL: int = Field(default=19, ge=0, le=22, description="zstd level for static files")
+
     # URL prefix for user-uploaded media
     MEDIA_URL: str = "/media/"
 
     # Filesystem location for uploaded media files
     MEDIA_ROOT: PosixPath = os.path.join(base_config.BASE_DIR, "media")
 
+    # Protected media delivery: proxy handoff in production, direct streaming locally
+    MEDIA_SERVE_MODE: MediaServeChoices = Field(default=MediaServeChoices.DIRECT, description="Protected media delivery")
+
+    # nginx `internal` location aliased to MEDIA_ROOT (used with X-Accel-Redirect)
+    MEDIA_ACCEL_REDIRECT_PREFIX: str = Field(default="/protected-media/", description="Internal nginx media location")
+
 
 # Singleton static/media configuration instance
 static_config = StaticSettings()
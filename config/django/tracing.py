@@ -0,0 +1,53 @@
+from enum import StrEnum
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.environment import env_config
+
+
+class TraceExporterChoices(StrEnum):
+    # Supported span exporters
+    FILE = "file"  # JSON lines, one span per line
+    OTLP = "otlp"  # OTLP/HTTP JSON to a collector
+
+
+class TracingSettings(BaseSettings):
+    """
+    Local request tracing (apps.common.tracing) loaded via Pydantic.
+
+    Spans cover each middleware, the view, every DB query and cache call.
+    Disabled by default; sampling is decided once per request (head-based).
+    """
+
+    # Master switch (handlers, DB wrapper and traced cache backends)
+    TRACING_ENABLED: bool = Field(default=False, description="Enable request tracing")
+
+    # Fraction of new traces to record (incoming sampled traceparent is always honoured)
+    TRACING_SAMPLE_RATE: float = Field(default=0.01, ge=0.0, le=1.0, description="Head-based sampling rate")
+
+    # Reported as the OTLP resource service.name
+    TRACING_SERVICE_NAME: str = Field(default="django-api", description="Service name attached to spans")
+
+    # Where finished spans go
+    TRACING_EXPORTER: TraceExporterChoices = Field(default=TraceExporterChoices.FILE, description="Span exporter")
+    TRACING_FILE_PATH: str = Field(default="traces.jsonl", description="File exporter output path")
+    TRACING_OTLP_ENDPOINT: str = Field(default="http://localhost:4318/v1/traces", description="OTLP/HTTP traces endpoint")
+
+    # Background export batching
+    TRACING_QUEUE_SIZE: int = Field(default=10000, ge=1, description="Max finished spans waiting for export")
+    TRACING_EXPORT_BATCH_SIZE: int = Field(default=512, ge=1, description="Max spans per export call")
+    TRACING_EXPORT_INTERVAL: float = Field(default=2.0, gt=0, description="Seconds between export flushes")
+
+    model_config = SettingsConfigDict(
+        # Load environment-specific .env file
+        env_file=env_config.ENVIRONMENT_FILE,
+        # Ignore unrelated environment variables
+        extra="ignore",
+        # Enforce exact environment variable names
+        case_sensitive=True,
+    )
+
+
+# Singleton tracing configuration instance
+tracing_config = TracingSettings()
@@ -84,6 +84,9 @@ DATABASES = database_config.DATABASES
 # Password validators enforce strong passwords and security best practices
 AUTH_PASSWORD_VALIDATORS = authentication_config.AUTH_PASSWORD_VALIDATORS
 
+# Authentication backends (cached session user loading)
+AUTHENTICATION_BACKENDS = authentication_config.AUTHENTICATION_BACKENDS
+
 
 # ------------------------------------------------------------------------------
 # Internationalization
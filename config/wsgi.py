@@ -9,8 +9,10 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 
 import os
 
-from django.core.wsgi import get_wsgi_application
+from apps.common.health import HealthCheckWSGIMiddleware
+from apps.common.tracing.handlers import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_wsgi_application()
+# Probes are answered before Django's handler (no middleware, no URL resolution)
+application = HealthCheckWSGIMiddleware(get_wsgi_application())
@@ -3,10 +3,28 @@ from django.contrib import admin
 from django.urls import path
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
+from apps.common.views import (
+    BulkheadMetricsView,
+    DeadlineMetricsView,
+    EventStreamMetricsView,
+    MemoryProfileView,
+    ProtectedMediaView,
+)
 from config.django.security import security_config
+from config.django.static import static_config
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # Concurrency limiter saturation (admin only)
+    path("internal/bulkheads/", BulkheadMetricsView.as_view(), name="bulkhead-metrics"),
+    # Requests that ran out of time, per layer (admin only)
+    path("internal/deadlines/", DeadlineMetricsView.as_view(), name="deadline-metrics"),
+    # Sampled per-route allocations of this worker (admin only)
+    path("internal/memory/", MemoryProfileView.as_view(), name="memory-profile"),
+    # Server-sent event streams and fan-out counters of this worker (admin only)
+    path("internal/events/", EventStreamMetricsView.as_view(), name="event-stream-metrics"),
+    # Permission-checked media; bytes are handed off to the proxy when configured
+    path(f"{static_config.MEDIA_URL.strip('/')}/<path:path>", ProtectedMediaView.as_view(), name="protected-media"),
 ]
 
 if security_config.DEBUG: